@@ -576,13 +576,17 @@ def play_tts_audio(audio_data: bytes) -> bool:
 
 
 def handle_tts_response(response_json: dict) -> bool:
-    """Handle TTS audio from server response (base64)."""
-    if "tts_audio" not in response_json:
+    """Handle TTS audio from server response (tts_url, or inline base64)."""
+    if "tts_audio" not in response_json and "tts_url" not in response_json:
         print("ℹ️  No TTS audio in server response")
         return False
     try:
-        audio_base64 = response_json["tts_audio"]
-        audio_data = base64.b64decode(audio_base64)
+        if "tts_audio" in response_json:
+            audio_data = base64.b64decode(response_json["tts_audio"])
+        else:
+            resp = requests.get(f"{SERVER_BASE_URL.rstrip('/')}{response_json['tts_url']}", timeout=30)
+            resp.raise_for_status()
+            audio_data = resp.content
         print(f"📥 Received TTS audio: {len(audio_data)} bytes")
         return play_tts_audio(audio_data)
     except Exception as e:
@@ -636,7 +640,7 @@ def upload_audio_buffer(wav_buffer: io.BytesIO, duration: float) -> bool:
             if affected_days:
                 print(f"   📅 Affected days: {', '.join(affected_days)}")
 
-            if response_data.get("tts_audio"):
+            if response_data.get("tts_audio") or response_data.get("tts_url"):
                 print("\n🔊 Playing response...")
                 handle_tts_response(response_data)
             else:
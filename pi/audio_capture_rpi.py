@@ -328,22 +328,28 @@ def play_tts_audio(audio_data: bytes) -> bool:
 def handle_tts_response(response_json: dict) -> bool:
     """
     Handle TTS audio from server response.
-    Decodes base64 audio and plays it.
+    Downloads the audio from 'tts_url' (or decodes inline base64) and plays it.
     
     Args:
-        response_json: JSON response from server containing 'tts_audio' field
+        response_json: JSON response from server containing 'tts_url' or 'tts_audio' field
         
     Returns:
         True if TTS was played, False otherwise
     """
-    if 'tts_audio' not in response_json:
+    if 'tts_audio' not in response_json and 'tts_url' not in response_json:
         print("ℹ️  No TTS audio in server response")
         return False
     
     try:
-        # Decode base64 audio
-        audio_base64 = response_json['tts_audio']
-        audio_data = base64.b64decode(audio_base64)
+        if 'tts_audio' in response_json:
+            # Decode base64 audio
+            audio_data = base64.b64decode(response_json['tts_audio'])
+        else:
+            # Base URL from SERVER_URL (remove /upload)
+            base_url = SERVER_URL.rsplit('/', 1)[0]
+            resp = requests.get(f"{base_url}{response_json['tts_url']}", timeout=30)
+            resp.raise_for_status()
+            audio_data = resp.content
         
         print(f"📥 Received TTS audio: {len(audio_data)} bytes")
         
@@ -444,7 +450,7 @@ def upload_audio_buffer(wav_buffer: io.BytesIO, duration: float, display: Option
                 print(f"   📅 Affected days: {', '.join(affected_days)}")
             
             # Play TTS audio if available
-            if response_data.get('tts_audio'):
+            if response_data.get('tts_audio') or response_data.get('tts_url'):
                 print("\n🔊 Playing response...")
                 if display:
                     display.show_text("Speaking...")
@@ -23,56 +23,294 @@ load_dotenv()  # Load environment variables from .env file
 # (Handled by simple_calendar module now)
 
 from flask import Flask, request, jsonify, send_file, render_template_string, Response
-import json
+from flask.json.provider import JSONProvider
 import base64
+import hashlib
 from datetime import datetime
 from pathlib import Path
+from zoneinfo import ZoneInfo
+import atexit
 import threading
+import itertools
+import logging
+import logging.handlers
+import queue
+import time
 import shutil
+import signal
 from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from bisect import insort
+from cachetools import TTLCache
+import orjson
+
+# Pipeline helpers used directly by the endpoints. Importing the modules
+# package loads the whole pipeline anyway (see _get_schedule_manager in
+# cleanup_on_startup), so import them once here rather than per request.
+from modules.schedule_manager import normalize_day_name, DAY_INDEX, DaySchedule
+from modules.llm_interpreter import get_date_for_day, parse_time_to_datetime, estimate_end_time
+from modules.scheduler import optimize_day_events, find_conflicts
+from modules.summary_generator import generate_week_summary_with_status
+from modules.simple_calendar import create_event
+from modules.tts_handler import synthesize_speech, is_tts_available, preload_voice
+from modules.whisper_handler import preload_model
+from modules.intent_router import clear_intent_cache, get_openai_client
+
+# Optional: parse multipart uploads straight to disk instead of through
+# Werkzeug's form parser (pip install streaming-form-data)
+try:
+    from streaming_form_data import StreamingFormDataParser
+    from streaming_form_data.targets import FileTarget
+
+    class _CountingFileTarget(FileTarget):
+        """FileTarget that tallies the bytes it writes, so no stat() is needed."""
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.size = 0
+
+        def on_data_received(self, chunk: bytes):
+            super().on_data_received(chunk)
+            self.size += len(chunk)
+except ImportError:
+    StreamingFormDataParser = None
 
 # Import processing modules (lazy load for faster startup)
 _pipeline_loaded = False
 _schedule_manager = None
 
+_init_lock = threading.Lock()
+
 def _load_pipeline():
     global _pipeline_loaded, process_audio_file, process_transcript_only
     if not _pipeline_loaded:
-        from modules import process_audio_file, process_transcript_only
-        _pipeline_loaded = True
+        # Requests and the warmup thread can race to the first import
+        with _init_lock:
+            if not _pipeline_loaded:
+                from modules import process_audio_file, process_transcript_only
+                _pipeline_loaded = True
     return process_audio_file, process_transcript_only
 
 def _get_schedule_manager():
     global _schedule_manager
     if _schedule_manager is None:
-        from modules import get_schedule_manager
-        _schedule_manager = get_schedule_manager()
+        with _init_lock:
+            if _schedule_manager is None:
+                from modules import get_schedule_manager
+                _schedule_manager = get_schedule_manager()
     return _schedule_manager
 
+# Error logging: handlers only enqueue records; a listener thread formats the
+# tracebacks and writes them to stderr, off the request thread
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record):
+        # Same process, so the record (with exc_info) can be handed over as-is;
+        # the default prepare() would format the traceback here
+        return record
+
+
+LOGGER = logging.getLogger("audioCapture_server")
+LOGGER.setLevel(logging.INFO)
+_log_queue = queue.Queue(-1)
+LOGGER.addHandler(_DeferredQueueHandler(_log_queue))
+LOGGER.propagate = False
+# The pipeline's and speech modules' output and handler tracebacks share the same listener
+for _module_logger_name in ("audio_pipeline", "tts_handler", "whisper_handler"):
+    _module_logger = logging.getLogger(_module_logger_name)
+    _module_logger.addHandler(_DeferredQueueHandler(_log_queue))
+    _module_logger.propagate = False
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+# Flush records still queued at exit (tracebacks included) before the thread dies
+atexit.register(_log_listener.stop)
+
+class OrjsonProvider(JSONProvider):
+    """
+    Route jsonify() and request.get_json() through orjson.
+    Week schedules, recording lists and the base64 TTS audio in upload
+    responses are the largest payloads we send, and orjson serializes them
+    several times faster than the stdlib.
+    """
+
+    # numpy values can show up in pipeline results (audio/scheduler maths)
+    OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=str, option=self.OPTIONS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        # Write the encoded bytes straight into the response; no str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=str, option=self.OPTIONS),
+            mimetype='application/json'
+        )
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Configuration
 AUDIO_DIR = "recordings"
 OUTPUT_DIR = "output"
 PORT = 8000
 TIMEZONE = os.getenv("TIMEZONE", "America/New_York")
+LOCAL_TZ = ZoneInfo(TIMEZONE)
+
+# Files read back from a recording's output directory by /api/results
+RESULT_FILES = [
+    ('transcript.txt', 'transcript'),
+    ('summary.txt', 'summary'),
+    ('schedule.json', 'schedule'),
+]
+
+# TTS reply written by the pipeline into each recording's output directory
+TTS_AUDIO_NAME = "response.wav"
+
+# /api/process_transcript replies live in output/transcript_<hash of the text>;
+# only this many of those directories (most recently written) are kept
+TRANSCRIPT_TTS_KEEP = 32
+
+# How often (seconds) the background thread checks for a new week
+WEEK_ROLLOVER_INTERVAL = 3600
+
+# Buffer size (bytes) for streamed uploads from the Pi
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Threads used to read recording metadata in /api/recordings
+LISTING_WORKERS = 16
+
+# Recordings never change once uploaded, so browsers/the Pi may cache them
+AUDIO_CACHE_MAX_AGE = 3600
+
+# When running behind Apache/lighttpd (or nginx mapping X-Sendfile to X-Accel-Redirect),
+# hand WAV transfers to the web server instead of streaming them through Python
+app.config['USE_X_SENDFILE'] = os.getenv("USE_X_SENDFILE", "false").lower() == "true"
 
 # Create directories if they don't exist
 os.makedirs(AUDIO_DIR, exist_ok=True)
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-# Store processing results
-processing_results = {}
+# Store processing results (bounded and expiring; results.json on disk is the fallback)
+processing_results = TTLCache(maxsize=256, ttl=3600)
+_results_lock = threading.Lock()
+
+# Agenda from the most recent successful result (served to the ESP32 without scanning)
+_latest_agenda: Optional[dict] = None
+
+# Uploads accepted with ?async=1 run here. One worker: the pipeline shares a
+# single Whisper model and writes to the same weekly schedule.
+_pipeline_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pipeline")
+_pending_results = set()
+
+# Shared by /api/recordings requests, so a listing doesn't start and join
+# LISTING_WORKERS threads each time
+_listing_executor = ThreadPoolExecutor(max_workers=LISTING_WORKERS, thread_name_prefix="listing")
 
 # Global flag to disable TTS audio in response (for cleaner terminal output)
 DISABLE_TTS_RESPONSE = False
 
 
+def _stream_to_file(stream, filepath: str) -> int:
+    """
+    Copy an upload stream to disk and return the number of bytes written.
+    Reads into one reused buffer and writes it straight to the file
+    descriptor, skipping the buffered file object's extra copy. When the
+    stream is already a real file (werkzeug spools large multipart parts to
+    a temp file), the kernel copies it with sendfile instead.
+    """
+    file_size = 0
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        src_fd = _real_fileno(stream)
+        if src_fd is not None:
+            file_size = _sendfile_all(fd, src_fd, stream.tell())
+            _advise_willneed(fd, file_size)
+            return file_size
+        
+        view = memoryview(bytearray(UPLOAD_CHUNK_SIZE))
+        while (n := stream.readinto(view)):
+            written = 0
+            while written < n:
+                written += os.write(fd, view[written:n])
+            file_size += n
+        _advise_willneed(fd, file_size)
+    finally:
+        os.close(fd)
+    return file_size
+
+
+def _real_fileno(stream) -> Optional[int]:
+    """Return the OS file descriptor behind stream, or None if it is in memory or sendfile is unavailable."""
+    if not hasattr(os, 'sendfile') or getattr(stream, '_rolled', True) is False:
+        # An in-memory SpooledTemporaryFile would be forced to disk by fileno()
+        return None
+    try:
+        stream.flush()
+        return stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        # io.UnsupportedOperation (BytesIO, sockets wrapped by the WSGI server)
+        # is a subclass of both OSError and ValueError
+        return None
+
+
+def _sendfile_all(out_fd: int, in_fd: int, offset: int) -> int:
+    """Copy in_fd from offset to EOF into out_fd in the kernel and return the byte count."""
+    remaining = os.fstat(in_fd).st_size - offset
+    copied = 0
+    while remaining > 0:
+        sent = os.sendfile(out_fd, in_fd, offset + copied, remaining)
+        if sent == 0:
+            break
+        copied += sent
+        remaining -= sent
+    return copied
+
+
+def _advise_willneed(fd: int, size: int):
+    """
+    Hint the kernel to keep a just-uploaded file in the page cache, since
+    Whisper reads it back right away. No-op where posix_fadvise is missing.
+    """
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+
+
+def _stream_multipart_audio(filepath: str) -> Optional[int]:
+    """
+    Parse a multipart request body as it arrives, writing the 'audio' part
+    directly to filepath. Returns the file size, or None if there was no
+    audio part.
+    """
+    parser = StreamingFormDataParser(headers=request.headers)
+    target = _CountingFileTarget(filepath)
+    parser.register('audio', target)
+    
+    for chunk in iter(lambda: request.stream.read(UPLOAD_CHUNK_SIZE), b''):
+        parser.data_received(chunk)
+    
+    if not target.multipart_filename:
+        return None
+    
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        _advise_willneed(fd, target.size)
+    finally:
+        os.close(fd)
+    return target.size
+
+
 def cleanup_on_startup():
     """
     Clean up schedule data and output transcripts on server startup.
     """
-    print("\n🧹 Running startup cleanup...")
+    LOGGER.info("\n🧹 Running startup cleanup...")
     
     # 1. Clear output directory
     if os.path.exists(OUTPUT_DIR):
@@ -84,19 +322,56 @@ def cleanup_on_startup():
                     os.unlink(item_path)
                 elif os.path.isdir(item_path):
                     shutil.rmtree(item_path)
-            print(f"✅ Cleared output directory: {OUTPUT_DIR}")
+            LOGGER.info(f"✅ Cleared output directory: {OUTPUT_DIR}")
         except Exception as e:
-            print(f"❌ Error clearing output directory: {e}")
+            LOGGER.error(f"❌ Error clearing output directory: {e}")
     
     # 2. Clear schedule data
     try:
         manager = _get_schedule_manager()
         manager.clear_week()
-        print(f"✅ Cleared weekly schedule data")
+        LOGGER.info(f"✅ Cleared weekly schedule data")
     except Exception as e:
-        print(f"❌ Error clearing schedule data: {e}")
+        LOGGER.error(f"❌ Error clearing schedule data: {e}")
     
-    print("✨ Cleanup complete\n")
+    LOGGER.info("✨ Cleanup complete\n")
+
+    # 3. Warm up the pipeline in the background so the first upload doesn't
+    #    pay for importing the modules and loading the Whisper/TTS models
+    threading.Thread(target=_warmup_pipeline, daemon=True).start()
+
+    # 4. Reset the schedule when a new week starts, instead of checking on every request
+    threading.Thread(target=_week_rollover_loop, daemon=True).start()
+
+
+def _warmup_pipeline():
+    """
+    Import the processing pipeline and load the models ahead of the first request.
+    """
+    try:
+        # Build the shared OpenAI client now; a missing key shows up in the
+        # startup log instead of failing the first upload
+        get_openai_client()
+    except Exception as e:
+        LOGGER.error(f"❌ OpenAI client unavailable: {e}")
+    try:
+        _load_pipeline()
+        preload_model()
+        preload_voice()
+        LOGGER.info("🔥 Pipeline warmed up")
+    except Exception as e:
+        LOGGER.warning(f"⚠️ Pipeline warmup failed (will load on first request): {e}")
+
+def _week_rollover_loop():
+    """
+    Periodically clear the schedule once the week changes.
+    """
+    while True:
+        time.sleep(WEEK_ROLLOVER_INTERVAL)
+        try:
+            _get_schedule_manager().check_and_reset_if_new_week()
+        except Exception as e:
+            LOGGER.warning(f"⚠️ Week rollover check failed: {e}")
 
 # Run cleanup immediately
 cleanup_on_startup()
@@ -107,23 +382,39 @@ def get_tts_audio_base64(result) -> Optional[str]:
     Read the TTS audio file and return as base64 encoded string.
     Returns None if TTS audio is not available.
     """
-    if result.summary_audio_path and os.path.exists(result.summary_audio_path):
-        try:
-            with open(result.summary_audio_path, 'rb') as f:
-                audio_data = f.read()
-            return base64.b64encode(audio_data).decode('utf-8')
-        except Exception as e:
-            print(f"[TTS] Error reading audio file: {e}")
-            return None
-    return None
+    if not result.summary_audio_path:
+        return None
+    try:
+        audio_data = Path(result.summary_audio_path).read_bytes()
+        return base64.b64encode(audio_data).decode('utf-8')
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        LOGGER.warning(f"[TTS] Error reading audio file: {e}")
+        return None
+
+
+def get_tts_url(result) -> Optional[str]:
+    """
+    Return the /api/tts URL for the result's TTS audio, or None if the audio
+    was not written to a recording's output directory.
+    """
+    if not result.summary_audio_path:
+        return None
+    audio_path = Path(result.summary_audio_path)
+    if audio_path.name != TTS_AUDIO_NAME or audio_path.parent.parent != Path(OUTPUT_DIR):
+        return None
+    return f"/api/tts/{audio_path.parent.name}"
 
 
 def build_response_with_tts(result, extra_data: dict = None) -> dict:
     """
     Build a response dictionary that includes TTS audio if available.
     
-    The TTS audio is included as base64-encoded WAV data in the 'tts_audio' field.
-    This allows the Raspberry Pi to decode and play it directly.
+    The TTS audio is referenced by URL in the 'tts_url' field; the client
+    fetches the WAV from /api/tts separately. Clients that need the audio
+    inline can pass ?inline=1 to also get base64-encoded WAV data in
+    'tts_audio'.
     """
     response = result.to_dict()
     
@@ -132,11 +423,18 @@ def build_response_with_tts(result, extra_data: dict = None) -> dict:
         response.update(extra_data)
     
     # Add TTS audio if available
-    tts_audio = get_tts_audio_base64(result)
-    if tts_audio and not DISABLE_TTS_RESPONSE:
-        response['tts_audio'] = tts_audio
-        response['tts_audio_format'] = 'wav'
-        print(f"[TTS] Included {len(tts_audio)} bytes of base64 audio in response")
+    if not DISABLE_TTS_RESPONSE:
+        tts_url = get_tts_url(result)
+        if tts_url:
+            response['tts_url'] = tts_url
+            response['tts_audio_format'] = 'wav'
+        
+        if request.args.get('inline') == '1' or (result.summary_audio_path and not tts_url):
+            tts_audio = get_tts_audio_base64(result)
+            if tts_audio:
+                response['tts_audio'] = tts_audio
+                response['tts_audio_format'] = 'wav'
+                LOGGER.info(f"[TTS] Included {len(tts_audio)} bytes of base64 audio in response")
     
     # Backwards compatibility: also include summary field if response_text exists
     if hasattr(result, 'response_text') and result.response_text:
@@ -144,22 +442,53 @@ def build_response_with_tts(result, extra_data: dict = None) -> dict:
     
     return response
 
-def get_next_filename():
-    """Get the next numbered filename"""
-    existing_files = list(Path(AUDIO_DIR).glob("recording_*.wav"))
-    if not existing_files:
-        return "recording_001.wav"
-    
-    # Extract numbers from existing files
+def store_result(filename: str, result):
+    """Cache a processing result for the results/agenda endpoints."""
+    global _latest_agenda
+    with _results_lock:
+        processing_results[filename] = result.to_dict()
+        _pending_results.discard(filename)
+        if result.success and result.agenda:
+            _latest_agenda = result.agenda
+
+
+def _process_upload_in_background(filename: str, filepath: str):
+    """Run the pipeline for an upload accepted with ?async=1."""
+    try:
+        process_audio_file, _ = _load_pipeline()
+        file_output_dir = os.path.join(OUTPUT_DIR, Path(filename).stem)
+        store_result(filename, process_audio_file(filepath, file_output_dir))
+        LOGGER.info(f"✅ Background processing complete for {filename}")
+    except Exception:
+        with _results_lock:
+            _pending_results.discard(filename)
+        LOGGER.exception(f"❌ Background processing failed for {filename}")
+
+
+def _scan_max_recording_number() -> int:
+    """Highest N among the recording_N.wav files already on disk (0 if none)."""
     numbers = []
-    for f in existing_files:
+    for f in Path(AUDIO_DIR).glob("recording_*.wav"):
         try:
             num = int(f.stem.split('_')[1])
             numbers.append(num)
         except (IndexError, ValueError):
             continue
-    
-    next_num = max(numbers) + 1 if numbers else 1
+    return max(numbers, default=0)
+
+
+_recording_counter = None
+_recording_counter_lock = threading.Lock()
+
+def get_next_filename():
+    """Get the next numbered filename"""
+    global _recording_counter
+    # Scan the recordings directory once, then hand out numbers from memory;
+    # the lock also keeps concurrent uploads from getting the same name
+    with _recording_counter_lock:
+        if _recording_counter is None:
+            _recording_counter = itertools.count(_scan_max_recording_number() + 1)
+        next_num = next(_recording_counter)
     return f"recording_{next_num:03d}.wav"
 
 @app.route('/')
@@ -191,21 +520,19 @@ def upload_audio():
                 from datetime import timezone as dt_timezone
                 server_now = datetime.now(dt_timezone.utc) # Compare in UTC to be safe, or local
                 # Better: use the configured timezone for "server now"
-                import pytz
-                tz = pytz.timezone(TIMEZONE)
-                server_now = datetime.now(tz)
+                server_now = datetime.now(LOCAL_TZ)
                 
                 # Ensure client_datetime is timezone aware
                 if client_datetime.tzinfo is None:
-                    client_datetime = tz.localize(client_datetime)
+                    client_datetime = client_datetime.replace(tzinfo=LOCAL_TZ)
                 
                 if client_datetime.year < server_now.year:
-                    print(f"⚠️ Client time {client_datetime} is in the past year. Using server time: {server_now}")
+                    LOGGER.warning(f"⚠️ Client time {client_datetime} is in the past year. Using server time: {server_now}")
                     client_datetime = server_now
                 else:
-                    print(f"📅 Client datetime: {client_datetime}")
+                    LOGGER.info(f"📅 Client datetime: {client_datetime}")
             except ValueError:
-                print(f"⚠️ Invalid client datetime: {client_dt_str}, using server time")
+                LOGGER.warning(f"⚠️ Invalid client datetime: {client_dt_str}, using server time")
         
         # Check if it's multipart form data
         if 'audio' in request.files:
@@ -229,10 +556,9 @@ def upload_audio():
             filepath = os.path.join(AUDIO_DIR, filename)
             
             # Save file
-            file.save(filepath)
-            file_size = os.path.getsize(filepath)
+            file_size = _stream_to_file(file.stream, filepath)
             
-            print(f"✅ Received (multipart): {filename} ({file_size} bytes)")
+            LOGGER.info(f"✅ Received (multipart): {filename} ({file_size} bytes)")
         
         # Otherwise, it's streaming raw data
         else:
@@ -241,24 +567,16 @@ def upload_audio():
             filepath = os.path.join(AUDIO_DIR, filename)
             
             # Stream data directly to file
-            print(f"📥 Receiving streamed upload: {filename}")
+            LOGGER.info(f"📥 Receiving streamed upload: {filename}")
             
-            file_size = 0
-            with open(filepath, 'wb') as f:
-                # Read in chunks from request stream
-                while True:
-                    chunk = request.stream.read(4096)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-                    file_size += len(chunk)
+            file_size = _stream_to_file(request.stream, filepath)
             
-            print(f"✅ Received (streamed): {filename} ({file_size} bytes)")
+            LOGGER.info(f"✅ Received (streamed): {filename} ({file_size} bytes)")
         
         # ============================================================
         # INTENT-BASED PROCESSING PIPELINE
         # ============================================================
-        print(f"\n🎙️ Processing: {filename}")
+        LOGGER.info(f"\n🎙️ Processing: {filename}")
         
         # Load pipeline modules (lazy load for faster startup)
         process_audio_file, _ = _load_pipeline()
@@ -274,7 +592,7 @@ def upload_audio():
         )
         
         # Store result for later retrieval
-        processing_results[filename] = result.to_dict()
+        store_result(filename, result)
         
         # Build response with both upload and processing info (includes TTS audio)
         response = build_response_with_tts(result, {
@@ -290,78 +608,85 @@ def upload_audio():
         is_interactive = result.error in interactive_errors
         
         if result.success or is_interactive:
-            print(f"✅ Processing complete for {filename}")
+            LOGGER.info(f"✅ Processing complete for {filename}")
             if is_interactive:
-                print(f"   Interactive state: {result.error}")
+                LOGGER.info(f"   Interactive state: {result.error}")
             else:
-                print(f"   Intent: {result.intent} | Response: {result.response_text[:80] if result.response_text else 'N/A'}...")
+                LOGGER.info(f"   Intent: {result.intent} | Response: {result.response_text[:80] if result.response_text else 'N/A'}...")
             status_code = 200
         else:
-            print(f"⚠️ Processing had issues for {filename}: {result.error}")
+            LOGGER.warning(f"⚠️ Processing had issues for {filename}: {result.error}")
             status_code = 500
         
         return jsonify(response), status_code
     
     except Exception as e:
-        print(f"❌ Error in upload/process: {e}")
-        import traceback
-        traceback.print_exc()
+        LOGGER.exception("❌ Error in upload/process")
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
+
+def _read_recording_info(filename: Path):
+    """
+    Build the listing entry for one recording.
+    Returns (entry dict, size in bytes).
+    """
+    stat = filename.stat()
+    size_bytes = stat.st_size
+    
+    # Estimate duration - read sample rate from WAV header
+    # Default: 16kHz, 16-bit, mono = 32000 bytes/sec
+    bytes_per_sec = 32000
+    
+    # Try to read actual sample rate from WAV header
+    try:
+        with open(filename, 'rb') as f:
+            f.seek(24)  # Sample rate is at byte 24-27
+            sample_rate_bytes = f.read(4)
+            sample_rate = int.from_bytes(sample_rate_bytes, 'little')
+            if sample_rate > 0:
+                bytes_per_sec = sample_rate * 2  # 16-bit mono
+    except:
+        pass  # Use default if can't read
+    
+    duration_sec = max(0, size_bytes - 44) / bytes_per_sec  # Subtract WAV header
+    
+    # Try to read processing result
+    result_data = {}
+    try:
+        # Assuming output dir name matches filename stem
+        result_json_path = Path(OUTPUT_DIR) / filename.stem / "result.json"
+        result_data = orjson.loads(result_json_path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        LOGGER.error(f"Error reading result for {filename}: {e}")
+    
+    return {
+        'filename': filename.name,
+        'size_kb': size_bytes / 1024,
+        'timestamp': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
+        'duration_estimate_sec': duration_sec,
+        'transcript': result_data.get('transcript'),
+        'intent': result_data.get('intent'),
+        'summary': result_data.get('response_text')
+    }, size_bytes
+
+
 @app.route('/api/recordings', methods=['GET'])
 def list_recordings():
     """API endpoint to list all recordings"""
     try:
-        recordings = []
-        total_size = 0
+        files = sorted(Path(AUDIO_DIR).glob("recording_*.wav"), reverse=True)
         
-        for filename in sorted(Path(AUDIO_DIR).glob("recording_*.wav"), reverse=True):
-            stat = filename.stat()
-            size_bytes = stat.st_size
-            total_size += size_bytes
-            
-            # Estimate duration - read sample rate from WAV header
-            # Default: 16kHz, 16-bit, mono = 32000 bytes/sec
-            bytes_per_sec = 32000
-            
-            # Try to read actual sample rate from WAV header
-            try:
-                with open(filename, 'rb') as f:
-                    f.seek(24)  # Sample rate is at byte 24-27
-                    sample_rate_bytes = f.read(4)
-                    sample_rate = int.from_bytes(sample_rate_bytes, 'little')
-                    if sample_rate > 0:
-                        bytes_per_sec = sample_rate * 2  # 16-bit mono
-            except:
-                pass  # Use default if can't read
-            
-            duration_sec = max(0, size_bytes - 44) / bytes_per_sec  # Subtract WAV header
-            
-            # Try to read processing result
-            result_data = {}
-            try:
-                # Assuming output dir name matches filename stem
-                output_dir = os.path.join(OUTPUT_DIR, filename.stem)
-                result_json_path = os.path.join(output_dir, "result.json")
-                
-                if os.path.exists(result_json_path):
-                    with open(result_json_path, 'r') as f:
-                        result_data = json.load(f)
-            except Exception as e:
-                print(f"Error reading result for {filename}: {e}")
-
-            recordings.append({
-                'filename': filename.name,
-                'size_kb': size_bytes / 1024,
-                'timestamp': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                'duration_estimate_sec': duration_sec,
-                'transcript': result_data.get('transcript'),
-                'intent': result_data.get('intent'),
-                'summary': result_data.get('response_text')
-            })
+        # Each recording needs a stat, a WAV header read and a result.json read;
+        # overlap that I/O instead of doing it one file at a time
+        entries = list(_listing_executor.map(_read_recording_info, files))
+        
+        recordings = [info for info, _ in entries]
+        total_size = sum(size_bytes for _, size_bytes in entries)
         
         return jsonify({
             'recordings': recordings,
@@ -376,9 +701,9 @@ def serve_audio(filename):
     """Serve audio file for playback"""
     try:
         filepath = os.path.join(AUDIO_DIR, filename)
-        if not os.path.exists(filepath):
-            return jsonify({'error': 'File not found'}), 404
-        return send_file(filepath, mimetype='audio/wav')
+        return send_file(filepath, mimetype='audio/wav', conditional=True, max_age=AUDIO_CACHE_MAX_AGE)
+    except FileNotFoundError:
+        return jsonify({'error': 'File not found'}), 404
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -387,9 +712,10 @@ def download_audio(filename):
     """Download audio file"""
     try:
         filepath = os.path.join(AUDIO_DIR, filename)
-        if not os.path.exists(filepath):
-            return jsonify({'error': 'File not found'}), 404
-        return send_file(filepath, as_attachment=True, download_name=filename)
+        return send_file(filepath, as_attachment=True, download_name=filename,
+                         conditional=True, max_age=AUDIO_CACHE_MAX_AGE)
+    except FileNotFoundError:
+        return jsonify({'error': 'File not found'}), 404
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -416,18 +742,18 @@ def process_recording(filename):
         file_output_dir = os.path.join(OUTPUT_DIR, Path(filename).stem)
         
         # Process the audio
-        print(f"\n🎙️ Processing: {filename}")
+        LOGGER.info(f"\n🎙️ Processing: {filename}")
         result = process_audio_file(filepath, file_output_dir)
         
         # Store result
-        processing_results[filename] = result.to_dict()
+        store_result(filename, result)
         
         # Return with TTS audio included
         response = build_response_with_tts(result)
         return jsonify(response), 200 if result.success else 500
     
     except Exception as e:
-        print(f"❌ Processing error: {e}")
+        LOGGER.error(f"❌ Processing error: {e}")
         return jsonify({
             'success': False,
             'error': str(e)
@@ -468,19 +794,20 @@ def process_transcript():
         # Load pipeline modules
         _, process_transcript_only = _load_pipeline()
         
-        # Import TTS handler for transcript processing
-        from modules.tts_handler import synthesize_speech, is_tts_available
-        
         # Process the transcript with intent-based routing
-        print(f"\n📝 Processing transcript: '{transcript[:50]}...'")
+        LOGGER.info(f"\n📝 Processing transcript: '{transcript[:50]}...'")
         result = process_transcript_only(transcript, client_datetime)
         
         # Generate TTS if available and processing succeeded
         if result.success and is_tts_available() and result.response_text:
-            # Create a temp output directory for TTS
-            import tempfile
-            tts_output_path = os.path.join(tempfile.gettempdir(), "smartpager_tts_transcript.wav")
+            # Same reply text -> same output directory, so /api/tts can serve it
+            # without a new directory per request
+            digest = hashlib.blake2b(result.response_text.encode("utf-8"), digest_size=8).hexdigest()
+            tts_output_dir = os.path.join(OUTPUT_DIR, f"transcript_{digest}")
+            os.makedirs(tts_output_dir, exist_ok=True)
+            tts_output_path = os.path.join(tts_output_dir, TTS_AUDIO_NAME)
             result.summary_audio_path = synthesize_speech(result.response_text, tts_output_path)
+            _prune_transcript_tts_dirs()
         
         # Return with TTS audio included
         response = build_response_with_tts(result)
@@ -492,15 +819,23 @@ def process_transcript():
         return jsonify(response), status_code
     
     except Exception as e:
-        print(f"❌ Processing error: {e}")
-        import traceback
-        traceback.print_exc()
+        LOGGER.exception("❌ Processing error")
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
 
+def _prune_transcript_tts_dirs():
+    """Remove all but the TRANSCRIPT_TTS_KEEP most recently written transcript_* directories."""
+    try:
+        dirs = sorted(Path(OUTPUT_DIR).glob("transcript_*"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for stale in dirs[TRANSCRIPT_TTS_KEEP:]:
+            shutil.rmtree(stale, ignore_errors=True)
+    except OSError as e:
+        LOGGER.warning(f"Could not prune transcript TTS directories: {e}")
+
+
 @app.route('/api/process_latest', methods=['POST'])
 def process_latest():
     """
@@ -516,7 +851,7 @@ def process_latest():
             return jsonify({'error': 'No recordings found'}), 404
         
         latest = recordings[0]
-        print(f"\n🎙️ Processing latest: {latest.name}")
+        LOGGER.info(f"\n🎙️ Processing latest: {latest.name}")
         
         # Load pipeline modules
         process_audio_file, _ = _load_pipeline()
@@ -528,7 +863,7 @@ def process_latest():
         result = process_audio_file(str(latest), file_output_dir)
         
         # Store result
-        processing_results[latest.name] = result.to_dict()
+        store_result(latest.name, result)
         
         # Return with TTS audio included
         response = build_response_with_tts(result, {'filename': latest.name})
@@ -536,7 +871,7 @@ def process_latest():
         return jsonify(response), 200 if result.success else 500
     
     except Exception as e:
-        print(f"❌ Processing error: {e}")
+        LOGGER.error(f"❌ Processing error: {e}")
         return jsonify({
             'success': False,
             'error': str(e)
@@ -546,11 +881,22 @@ def process_latest():
 @app.route('/api/results/<filename>')
 def get_results(filename):
     """Get processing results for a specific recording"""
-    if filename in processing_results:
-        return jsonify(processing_results[filename])
+    with _results_lock:
+        cached = processing_results.get(filename)
+        pending = filename in _pending_results
+    if cached is not None:
+        return jsonify(cached)
+    if pending:
+        return jsonify({'filename': filename, 'status': 'processing'}), 202
     
-    # Check if output directory exists with results
+    # Evicted from memory: the pipeline saved the full result as result.json
     output_dir = os.path.join(OUTPUT_DIR, Path(filename).stem)
+    try:
+        return jsonify(orjson.loads((Path(output_dir) / "result.json").read_bytes()))
+    except FileNotFoundError:
+        pass
+    
+    # Check if output directory exists with results
     if os.path.exists(output_dir):
         result = {
             'filename': filename,
@@ -558,23 +904,13 @@ def get_results(filename):
             'output_dir': output_dir
         }
         
-        # Read transcript if available
-        transcript_path = os.path.join(output_dir, 'transcript.txt')
-        if os.path.exists(transcript_path):
-            with open(transcript_path, 'r') as f:
-                result['transcript'] = f.read()
-        
-        # Read summary if available
-        summary_path = os.path.join(output_dir, 'summary.txt')
-        if os.path.exists(summary_path):
-            with open(summary_path, 'r') as f:
-                result['summary'] = f.read()
-        
-        # Read schedule JSON if available
-        schedule_path = os.path.join(output_dir, 'schedule.json')
-        if os.path.exists(schedule_path):
-            with open(schedule_path, 'r') as f:
-                result['schedule'] = json.load(f)
+        # Read transcript, summary and schedule JSON if available
+        for name, key in RESULT_FILES:
+            try:
+                data = (Path(output_dir) / name).read_text()
+            except FileNotFoundError:
+                continue
+            result[key] = orjson.loads(data) if name.endswith('.json') else data
         
         return jsonify(result)
     
@@ -590,13 +926,11 @@ def get_tts_audio(filename):
     try:
         # Strip extension if provided
         base_name = Path(filename).stem
-        tts_path = os.path.join(OUTPUT_DIR, base_name, "summary.wav")
-        
-        if not os.path.exists(tts_path):
-            return jsonify({'error': 'TTS audio not found for this recording'}), 404
-        
-        return send_file(tts_path, mimetype='audio/wav')
+        tts_path = os.path.join(OUTPUT_DIR, base_name, TTS_AUDIO_NAME)
+        return send_file(tts_path, mimetype='audio/wav', conditional=True)
     
+    except FileNotFoundError:
+        return jsonify({'error': 'TTS audio not found for this recording'}), 404
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -607,11 +941,9 @@ def get_agenda_today():
     Get today's agenda from the most recent processing result.
     This endpoint is designed for ESP32 consumption.
     """
-    # Find the most recent result with an agenda
-    for filename in sorted(processing_results.keys(), reverse=True):
-        result = processing_results[filename]
-        if result.get('success') and result.get('agenda'):
-            return jsonify(result['agenda'])
+    agenda = _latest_agenda
+    if agenda:
+        return jsonify(agenda)
     
     return jsonify({
         'next_item': None,
@@ -626,12 +958,9 @@ def get_agenda_next():
     Get the next upcoming event.
     This endpoint is designed for ESP32 consumption.
     """
-    for filename in sorted(processing_results.keys(), reverse=True):
-        result = processing_results[filename]
-        if result.get('success') and result.get('agenda'):
-            agenda = result['agenda']
-            if agenda.get('next_item'):
-                return jsonify(agenda['next_item'])
+    agenda = _latest_agenda
+    if agenda and agenda.get('next_item'):
+        return jsonify(agenda['next_item'])
     
     return jsonify({
         'title': 'No upcoming events',
@@ -652,7 +981,6 @@ def get_week_schedule():
     """
     try:
         manager = _get_schedule_manager()
-        manager.check_and_reset_if_new_week()
         
         week_data = manager.get_week_summary_data()
         return jsonify({
@@ -679,13 +1007,11 @@ def get_day_schedule(day):
     """
     try:
         manager = _get_schedule_manager()
-        manager.check_and_reset_if_new_week()
         
         # Normalize day name
-        from modules.schedule_manager import normalize_day_name, DAYS_OF_WEEK
         day_name = normalize_day_name(day, datetime.now())
         
-        if day_name not in DAYS_OF_WEEK:
+        if day_name not in DAY_INDEX:
             return jsonify({
                 'success': False,
                 'error': f'Invalid day: {day}'
@@ -720,10 +1046,9 @@ def clear_day_schedule(day):
     try:
         manager = _get_schedule_manager()
         
-        from modules.schedule_manager import normalize_day_name, DAYS_OF_WEEK
         day_name = normalize_day_name(day, datetime.now())
         
-        if day_name not in DAYS_OF_WEEK:
+        if day_name not in DAY_INDEX:
             return jsonify({
                 'success': False,
                 'error': f'Invalid day: {day}'
@@ -786,10 +1111,9 @@ def add_event_to_day(day):
     try:
         manager = _get_schedule_manager()
         
-        from modules.schedule_manager import normalize_day_name, DAYS_OF_WEEK
         day_name = normalize_day_name(day, datetime.now())
         
-        if day_name not in DAYS_OF_WEEK:
+        if day_name not in DAY_INDEX:
             return jsonify({
                 'success': False,
                 'error': f'Invalid day: {day}'
@@ -803,8 +1127,6 @@ def add_event_to_day(day):
             }), 400
         
         # Build event with proper datetime
-        from modules.llm_interpreter import get_date_for_day, parse_time_to_datetime, estimate_end_time
-        
         day_date = get_date_for_day(day_name, datetime.now())
         
         start_str = data.get('start', '09:00')
@@ -824,15 +1146,19 @@ def add_event_to_day(day):
         }
         
         # Add and optimize
-        from modules.scheduler import optimize_day_events
-        
         schedule = manager.get_day_schedule(day_name)
-        schedule.events.append(event)
         
-        optimized = optimize_day_events(schedule.events, day_date)
+        if event['type'] == 'fixed' and not find_conflicts(event, schedule.events):
+            # Nothing to move: the saved day is already optimized, so just
+            # insert the new event in start order and skip the solver
+            insort(schedule.events, event, key=lambda e: e['start'])
+            events = schedule.events
+        else:
+            schedule.events.append(event)
+            optimized = optimize_day_events(schedule.events, day_date)
+            events = optimized.get('events', [])
         
-        from modules.schedule_manager import DaySchedule
-        updated_schedule = DaySchedule(day=day_name, events=optimized.get('events', []))
+        updated_schedule = DaySchedule(day=day_name, events=events)
         manager.save_day_schedule(updated_schedule)
         
         return jsonify({
@@ -842,8 +1168,7 @@ def add_event_to_day(day):
             'events': updated_schedule.events
         })
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        LOGGER.exception("❌ Error adding event")
         return jsonify({
             'success': False,
             'error': str(e)
@@ -865,10 +1190,9 @@ def delete_event_from_day(day, event_name):
     try:
         manager = _get_schedule_manager()
         
-        from modules.schedule_manager import normalize_day_name, DAYS_OF_WEEK
         day_name = normalize_day_name(day, datetime.now())
         
-        if day_name not in DAYS_OF_WEEK:
+        if day_name not in DAY_INDEX:
             return jsonify({
                 'success': False,
                 'error': f'Invalid day: {day}'
@@ -905,12 +1229,8 @@ def get_week_summary_text():
     """
     try:
         manager = _get_schedule_manager()
-        manager.check_and_reset_if_new_week()
         
-        week_data = manager.get_week_summary_data()
-        
-        from modules.summary_generator import generate_week_summary
-        summary = generate_week_summary(week_data['days'])
+        summary, week_data = manager.get_week_summary_text(generate_week_summary_with_status)
         
         return jsonify({
             'success': True,
@@ -934,54 +1254,72 @@ def upload_and_process():
     """
     try:
         # First, handle the upload (same as /upload)
-        if 'audio' in request.files:
+        if StreamingFormDataParser is not None and request.mimetype == 'multipart/form-data':
+            filename = get_next_filename()
+            filepath = os.path.join(AUDIO_DIR, filename)
+            file_size = _stream_multipart_audio(filepath)
+            if file_size is None:
+                return jsonify({'success': False, 'error': 'No audio file in upload'}), 400
+            LOGGER.info(f"✅ Received (multipart, streamed): {filename} ({file_size} bytes)")
+            
+        elif 'audio' in request.files:
             file = request.files['audio']
             if file.filename == '':
                 return jsonify({'success': False, 'error': 'Empty filename'}), 400
             
             filename = get_next_filename()
             filepath = os.path.join(AUDIO_DIR, filename)
-            file.save(filepath)
-            file_size = os.path.getsize(filepath)
-            print(f"✅ Received (multipart): {filename} ({file_size} bytes)")
+            file_size = _stream_to_file(file.stream, filepath)
+            LOGGER.info(f"✅ Received (multipart): {filename} ({file_size} bytes)")
             
         else:
             filename = get_next_filename()
             filepath = os.path.join(AUDIO_DIR, filename)
             
-            total_bytes = 0
-            with open(filepath, 'wb') as f:
-                while True:
-                    chunk = request.stream.read(4096)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-                    total_bytes += len(chunk)
-            
-            file_size = total_bytes
-            print(f"✅ Received (streamed): {filename} ({total_bytes} bytes)")
+            file_size = _stream_to_file(request.stream, filepath)
+            LOGGER.info(f"✅ Received (streamed): {filename} ({file_size} bytes)")
         
-        # Now process the audio
+        upload_info = {
+            'success': True,
+            'filename': filename,
+            'size_bytes': file_size
+        }
+        
+        # ?async=1: hand the file to the pipeline worker and return right away;
+        # the client polls /api/results/<filename> for the outcome
+        if request.args.get('async') == '1':
+            with _results_lock:
+                _pending_results.add(filename)
+            _pipeline_executor.submit(_process_upload_in_background, filename, filepath)
+            return jsonify({
+                'success': True,
+                'status': 'processing',
+                'upload': upload_info,
+                'results_url': f'/api/results/{filename}'
+            }), 202
+        
+        # Now process the audio; ?agenda=0 skips building the agenda and week
+        # schedule for clients that only play back the spoken response
         process_audio_file, _ = _load_pipeline()
         file_output_dir = os.path.join(OUTPUT_DIR, Path(filename).stem)
-        result = process_audio_file(filepath, file_output_dir)
+        result = process_audio_file(
+            filepath,
+            file_output_dir,
+            include_agenda=request.args.get('agenda') != '0'
+        )
         
         # Store result
-        processing_results[filename] = result.to_dict()
+        store_result(filename, result)
         
         # Build response with TTS audio included
         response = build_response_with_tts(result, {
-            'upload': {
-                'success': True,
-                'filename': filename,
-                'size_bytes': file_size
-            }
+            'upload': upload_info
         })
         
         return jsonify(response), 200 if result.success else 500
     
     except Exception as e:
-        print(f"❌ Upload/process error: {e}")
+        LOGGER.error(f"❌ Upload/process error: {e}")
         return jsonify({
             'success': False,
             'error': str(e)
@@ -1008,11 +1346,9 @@ def test_calendar_add():
                 'error': 'Missing required fields: title, start, end'
             }), 400
         
-        from modules.calendar_utils import create_event
-        
-        print(f"\n🧪 [TEST] Attempting to create calendar event: {data['title']}")
-        print(f"   Start: {data['start']}")
-        print(f"   End:   {data['end']}")
+        LOGGER.info(f"\n🧪 [TEST] Attempting to create calendar event: {data['title']}")
+        LOGGER.info(f"   Start: {data['start']}")
+        LOGGER.info(f"   End:   {data['end']}")
         
         result = create_event(
             title=data['title'],
@@ -1022,78 +1358,90 @@ def test_calendar_add():
         )
         
         if result.get('status') == 'success':
-            print(f"✅ [TEST] Event created successfully! ID: {result['event']['id']}")
+            LOGGER.info(f"✅ [TEST] Event created successfully! ID: {result['event']['id']}")
             return jsonify({
                 'success': True,
                 'event': result['event']
             })
         else:
-            print(f"❌ [TEST] Failed to create event: {result.get('error')}")
+            LOGGER.error(f"❌ [TEST] Failed to create event: {result.get('error')}")
             return jsonify({
                 'success': False,
                 'error': result.get('error')
             }), 500
             
     except Exception as e:
-        print(f"❌ [TEST] Exception: {e}")
-        import traceback
-        traceback.print_exc()
+        LOGGER.exception("❌ [TEST] Exception")
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
 
+_RULE = "=" * 70
+
+# Startup banner, encoded once and written in a single call from __main__
+BANNER = ("\n".join([
+    _RULE,
+    "🎤 SmartPager Audio Capture & Processing Server",
+    _RULE,
+    f"📂 Recordings: {os.path.abspath(AUDIO_DIR)}",
+    f"📁 Output: {os.path.abspath(OUTPUT_DIR)}",
+    f"📅 Schedules: {os.path.abspath('schedule')}",
+    f"🌐 Server: http://0.0.0.0:{PORT}",
+    _RULE,
+    "\n📡 AUDIO ENDPOINTS:",
+    "  POST /upload                  - Upload + auto-process audio ⭐",
+    "  POST /api/process/<file>      - Re-process existing file",
+    "  POST /api/process_latest      - Re-process most recent file",
+    "  POST /api/process_transcript  - Process text directly",
+    "  GET  /api/tts/<file>          - Get TTS audio for recording",
+    "  GET  /api/recordings          - List all recordings",
+    _RULE,
+    "\n📅 SCHEDULE ENDPOINTS:",
+    "  GET    /api/schedule/week          - Get entire week schedule",
+    "  DELETE /api/schedule/week          - Clear entire week",
+    "  GET    /api/schedule/<day>         - Get day schedule (monday, today, etc)",
+    "  DELETE /api/schedule/<day>         - Clear day schedule",
+    "  POST   /api/schedule/<day>/event   - Add event to day",
+    "  DELETE /api/schedule/<day>/event/<name> - Delete event",
+    "  GET    /api/schedule/summary       - Get week summary text",
+    "  GET    /api/agenda/today           - Get today's agenda (legacy)",
+    "  GET    /api/agenda/next            - Get next event (legacy)",
+    _RULE,
+    "\n🎯 SUPPORTED VOICE COMMANDS:",
+    "  • Add events:   'Add meeting Monday 2pm', 'Schedule lunch tomorrow'",
+    "  • Query day:    'What's on Monday?', 'What do I have today?'",
+    "  • Query week:   'What does my week look like?'",
+    "  • Delete:       'Cancel dentist appointment', 'Remove gym on Tuesday'",
+    "  • Clear:        'Clear Monday', 'Start fresh'",
+    "  • Help:         'What can you do?'",
+    _RULE,
+    "\n⚙️ REQUIREMENTS:",
+    "  - OpenAI API key in .env file (OPENAI_API_KEY=...)",
+    "  - Whisper: pip install faster-whisper",
+    "  - OR-Tools: pip install ortools",
+    "  - TTS: pip install piper-tts (+ download model)",
+    _RULE,
+    "\n🔄 PIPELINE: Audio → Whisper → Intent Classification → Handler → TTS",
+    _RULE,
+    "\nWaiting for recordings from Raspberry Pi...",
+    "Press Ctrl+C to stop\n",
+]) + "\n").encode("utf-8")
+
+
 if __name__ == '__main__':
     import sys
     if "--no-audio" in sys.argv:
         DISABLE_TTS_RESPONSE = True
         print("🔇 TTS Audio response disabled via flag")
+    
+    # `kill -HUP <pid>` drops cached intent classifications without a restart
+    if hasattr(signal, 'SIGHUP'):
+        signal.signal(signal.SIGHUP, lambda signum, frame: clear_intent_cache())
 
-    print("=" * 70)
-    print("🎤 SmartPager Audio Capture & Processing Server")
-    print("=" * 70)
-    print(f"📂 Recordings: {os.path.abspath(AUDIO_DIR)}")
-    print(f"📁 Output: {os.path.abspath(OUTPUT_DIR)}")
-    print(f"📅 Schedules: {os.path.abspath('schedule')}")
-    print(f"🌐 Server: http://0.0.0.0:{PORT}")
-    print("=" * 70)
-    print("\n📡 AUDIO ENDPOINTS:")
-    print(f"  POST /upload                  - Upload + auto-process audio ⭐")
-    print(f"  POST /api/process/<file>      - Re-process existing file")
-    print(f"  POST /api/process_latest      - Re-process most recent file")
-    print(f"  POST /api/process_transcript  - Process text directly")
-    print(f"  GET  /api/tts/<file>          - Get TTS audio for recording")
-    print(f"  GET  /api/recordings          - List all recordings")
-    print("=" * 70)
-    print("\n📅 SCHEDULE ENDPOINTS:")
-    print(f"  GET    /api/schedule/week          - Get entire week schedule")
-    print(f"  DELETE /api/schedule/week          - Clear entire week")
-    print(f"  GET    /api/schedule/<day>         - Get day schedule (monday, today, etc)")
-    print(f"  DELETE /api/schedule/<day>         - Clear day schedule")
-    print(f"  POST   /api/schedule/<day>/event   - Add event to day")
-    print(f"  DELETE /api/schedule/<day>/event/<name> - Delete event")
-    print(f"  GET    /api/schedule/summary       - Get week summary text")
-    print(f"  GET    /api/agenda/today           - Get today's agenda (legacy)")
-    print(f"  GET    /api/agenda/next            - Get next event (legacy)")
-    print("=" * 70)
-    print("\n🎯 SUPPORTED VOICE COMMANDS:")
-    print("  • Add events:   'Add meeting Monday 2pm', 'Schedule lunch tomorrow'")
-    print("  • Query day:    'What's on Monday?', 'What do I have today?'")
-    print("  • Query week:   'What does my week look like?'")
-    print("  • Delete:       'Cancel dentist appointment', 'Remove gym on Tuesday'")
-    print("  • Clear:        'Clear Monday', 'Start fresh'")
-    print("  • Help:         'What can you do?'")
-    print("=" * 70)
-    print("\n⚙️ REQUIREMENTS:")
-    print("  - OpenAI API key in .env file (OPENAI_API_KEY=...)")
-    print("  - Whisper: pip install openai-whisper")
-    print("  - OR-Tools: pip install ortools")
-    print("  - TTS: pip install piper-tts (+ download model)")
-    print("=" * 70)
-    print("\n🔄 PIPELINE: Audio → Whisper → Intent Classification → Handler → TTS")
-    print("=" * 70)
-    print("\nWaiting for recordings from Raspberry Pi...")
-    print("Press Ctrl+C to stop\n")
+    sys.stdout.flush()  # keep the --no-audio note ahead of the raw write
+    sys.stdout.buffer.write(BANNER)
+    sys.stdout.buffer.flush()
     
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    app.run(host='0.0.0.0', port=5000, debug=os.getenv("FLASK_DEBUG", "false").lower() == "true")
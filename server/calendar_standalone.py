@@ -11,7 +11,6 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 import os
 import sys
 import time
-import json
 import logging
 from datetime import datetime, timedelta
 import pytz
@@ -29,53 +28,32 @@ LOGGER = logging.getLogger("calendar_standalone")
 
 def setup_credentials():
     """
-    Check if credentials.json exists. If not, try to create it from env vars.
-    Returns the path to the credentials file to use.
+    Build the Google OAuth client config from env vars.
+    Returns the config dict, or None if the env vars are not set.
     """
-    # Check for standard file first (optional, but good to respect if it exists)
-    # But user specifically wants to use env vars now.
+    from modules.simple_calendar import client_config_from_env
     
-    client_id = os.environ.get("GOOGLE_CLIENT_ID")
-    client_secret = os.environ.get("GOOGLE_CLIENT_SECRET")
-    project_id = os.environ.get("GOOGLE_PROJECT_ID")
-    
-    if client_id and client_secret:
-        print("[setup] Found Google Auth env vars. Creating temp credentials file...")
-        
-        creds_data = {
-            "installed": {
-                "client_id": client_id,
-                "project_id": project_id or "smartpager-480305",
-                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                "token_uri": "https://oauth2.googleapis.com/token",
-                "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
-                "client_secret": client_secret,
-                "redirect_uris": ["http://localhost"]
-            }
-        }
-        
-        temp_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp_credentials.json")
-        with open(temp_path, "w") as f:
-            json.dump(creds_data, f, indent=2)
-            
-        # Tell calendar_client where to look
-        os.environ["CREDENTIALS_PATH"] = temp_path
-        return temp_path
-    
-    return None
+    client_config = client_config_from_env()
+    if client_config:
+        print("[setup] Found Google Auth env vars.")
+    return client_config
 
 def main():
     print("=== SmartPager Standalone Calendar Script ===")
     
     # 0. Setup Credentials
-    temp_creds_path = setup_credentials()
+    client_config = setup_credentials()
     
-    # Import modules AFTER setting up env vars
     from modules import simple_calendar as calendar_utils
     
     # 1. Authentication (Implicitly handled by simple_calendar)
     print("\n[1] Testing Authentication & List Events...")
     try:
+        if client_config:
+            # Authenticate with the in-memory config (opens the browser
+            # only if there is no valid token.json yet)
+            calendar_utils.get_service(client_config)
+        
         # Fetch events for the next 7 days to verify auth works
         events = calendar_utils.fetch_events(lookahead_days=7)
         print(f"    Success! Found {len(events)} upcoming events.")
@@ -83,8 +61,6 @@ def main():
             print(f"    - {evt['start']} : {evt['name']}")
     except Exception as e:
         print(f"    FAILED: {e}")
-        if temp_creds_path and os.path.exists(temp_creds_path):
-            os.remove(temp_creds_path)
         return
 
     # 2. Add Event
@@ -113,13 +89,9 @@ def main():
             print(f"    Link: {result['event'].get('htmlLink')}")
         else:
             print(f"    FAILED: {result.get('error')}")
-            if temp_creds_path and os.path.exists(temp_creds_path):
-                os.remove(temp_creds_path)
             return
     except Exception as e:
         print(f"    FAILED: {e}")
-        if temp_creds_path and os.path.exists(temp_creds_path):
-            os.remove(temp_creds_path)
         return
 
     # 3. Modify Event
@@ -161,9 +133,6 @@ def main():
 
     # Cleanup
     input(">>> Check Google Calendar to ensure event is DELETED. Press Enter to finish...")
-    if temp_creds_path and os.path.exists(temp_creds_path):
-        print(f"\n[Cleanup] Removing temp credentials file: {temp_creds_path}")
-        os.remove(temp_creds_path)
 
     print("\n=== Test Complete ===")
 
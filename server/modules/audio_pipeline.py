@@ -15,11 +15,17 @@ Supports multiple intents:
 """
 
 import os
-import json
+import re
+import queue
+import logging
+import threading
+import orjson
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from datetime import datetime
 from dataclasses import dataclass, field
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from .whisper_handler import transcribe_audio_file
 from .intent_router import classify_intent, Intent, IntentResult, get_help_response, validate_operations
@@ -33,6 +39,7 @@ from .schedule_manager import (
     ScheduleManager,
     DaySchedule,
     DAYS_OF_WEEK,
+    DAY_INDEX,
     normalize_day_name,
     get_day_from_datetime
 )
@@ -41,18 +48,87 @@ from .summary_generator import (
     generate_summary_text,
     generate_agenda_for_esp32,
     generate_day_summary,
-    generate_week_summary,
+    generate_week_summary_with_status,
     generate_changes_summary,
     generate_changes_summary_with_conflicts,
     generate_clear_confirmation,
     generate_query_response
 )
-from .tts_handler import synthesize_speech, is_tts_available
+from .tts_handler import synthesize_speech, synthesize_speech_stream, is_tts_available
 from .context_manager import get_context_manager, ContextState
-from .simple_calendar import create_event, update_event, delete_event, find_event_by_details
+from .simple_calendar import (
+    create_events_batch,
+    update_event,
+    delete_event,
+    delete_events_batch,
+    find_event_by_details,
+    find_events_by_details
+)
+
+
+LOGGER = logging.getLogger("audio_pipeline")
+LOGGER.setLevel(os.getenv("PIPELINE_LOG_LEVEL", "INFO").upper())
+
+# Google Calendar writes for a command run here while TTS is synthesized
+_calendar_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="calendar-sync")
+# Individual Calendar API calls are HTTPS-bound, so a day's edits/deletes run concurrently
+_calendar_io_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="calendar-io")
+# Output artifacts (transcript.txt, schedule_<day>.json, result.json) are written
+# off the request path; the executor's worker is joined at interpreter exit, so
+# queued writes still land on shutdown
+_artifact_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifact-writer")
+# Held while a day file is saved, so the background calendar sync's
+# re-read/merge/save of a day can't interleave with a request saving it
+_day_locks = {day: threading.Lock() for day in DAYS_OF_WEEK}
+# Query summaries are spoken sentence by sentence while the LLM streams them
+_speech_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tts-stream")
+
+# Intents whose response_text comes from a streamed LLM summary
+_STREAMED_SPEECH_INTENTS = (Intent.QUERY_DAY, Intent.QUERY_WEEK)
+
+# Keyword scans over the lowercased transcript, compiled once into a single
+# pass each. Keywords match as plain substrings (no word boundaries).
+_CLARIFICATION_RE = re.compile("|".join(map(re.escape, [
+    "at ", "on ", "for ", "after ", "before ", "move", "make it", "change to",
+    "pm", "am", "tomorrow", "today", "next", "this", "that time"
+])))
+_CONFIRMATION_RE = re.compile("|".join(map(re.escape, [
+    "yes", "okay", "sure", "do it", "confirm",
+    "suggested", "suggestion", "recommendation", "that time", "great"
+])))
+
+
+def _write_artifact(path: Path, data: bytes):
+    """Queue an output file to be written by the background artifact writer."""
+    def _write():
+        try:
+            path.write_bytes(data)
+        except OSError as e:
+            LOGGER.warning("[pipeline] Failed to write %s: %s", path, e)
+    _artifact_executor.submit(_write)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(dt_str: str) -> datetime:
+    """datetime.fromisoformat, memoized: the same event start strings come up repeatedly."""
+    return datetime.fromisoformat(dt_str)
+
+
+@lru_cache(maxsize=4096)
+def _spoken_time(dt_str: str) -> str:
+    """Format an ISO datetime string as e.g. '2:30 PM'."""
+    return _parse_iso(dt_str).strftime("%I:%M %p").lstrip("0")
+
+
+def _day_from_iso(dt_str: str) -> str:
+    """Return lowercase weekday name from ISO datetime string."""
+    try:
+        return _parse_iso(dt_str).strftime("%A").lower()
+    except Exception:
+        return "today"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Container for the complete processing result"""
     
@@ -85,7 +161,11 @@ class ProcessingResult:
     processing_time_ms: int = 0
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON response"""
+        """
+        Convert to dictionary for JSON response.
+        Deliberately shallow: dataclasses.asdict would deep-copy every nested
+        schedule dict just to have it serialized once.
+        """
         return {
             "success": self.success,
             "error": self.error,
@@ -111,7 +191,8 @@ def process_audio_file(
     audio_path: str,
     output_dir: str = None,
     client_datetime: datetime = None,
-    generate_tts: bool = True
+    generate_tts: bool = True,
+    include_agenda: bool = True
 ) -> ProcessingResult:
     """
     Complete intent-based audio processing pipeline.
@@ -121,6 +202,8 @@ def process_audio_file(
         output_dir: Directory for output files (transcript, summary audio)
         client_datetime: Current datetime from client (for day resolution)
         generate_tts: Whether to generate TTS audio output
+        include_agenda: Whether schedule changes should also return today's
+            agenda and the week's schedule data (voice-only clients can skip it)
         
     Returns:
         ProcessingResult with all processing outputs
@@ -139,11 +222,8 @@ def process_audio_file(
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    print(f"\n{'='*60}")
-    print(f"[pipeline] Starting intent-based audio processing")
-    print(f"[pipeline] Input: {audio_path}")
-    print(f"[pipeline] Client datetime: {client_datetime}")
-    print(f"{'='*60}")
+    LOGGER.info("[pipeline] Starting intent-based audio processing: %s (client datetime: %s)",
+                audio_path, client_datetime)
     
     def _looks_like_clarification(text: str) -> bool:
         """Heuristic: quick replies that likely complete a prior request."""
@@ -153,79 +233,64 @@ def process_audio_file(
         # Very short replies (single phrase) are likely clarifications
         if len(t) <= 60:
             return True
-        clarification_tokens = [
-            "at ", "on ", "for ", "after ", "before ", "move", "make it", "change to",
-            "pm", "am", "tomorrow", "today", "next", "this", "that time"
-        ]
-        return any(tok in t for tok in clarification_tokens)
+        return _CLARIFICATION_RE.search(t) is not None
     
     # Step 0: Check Context
     ctx_mgr = get_context_manager()
-    context = ctx_mgr.get_context()
+    context_state = ctx_mgr.current_state()
     
-    if context["state"] == ContextState.AWAITING_CLARIFICATION:
-        print(f"[pipeline] Context active: AWAITING_CLARIFICATION")
-        print(f"[pipeline] Previous transcript: '{context['last_transcript']}'")
-    elif context["state"] == ContextState.AWAITING_CONFLICT_RESOLUTION:
-        print(f"[pipeline] Context active: AWAITING_CONFLICT_RESOLUTION")
-        print(f"[pipeline] Pending event: {context['pending_event'].get('name')}")
+    if context_state == ContextState.AWAITING_CLARIFICATION:
+        LOGGER.info("[pipeline] Context active: AWAITING_CLARIFICATION")
+        LOGGER.debug("[pipeline] Previous transcript: '%s'", ctx_mgr.last_transcript)
+    elif context_state == ContextState.AWAITING_CONFLICT_RESOLUTION:
+        LOGGER.info("[pipeline] Context active: AWAITING_CONFLICT_RESOLUTION")
+        LOGGER.debug("[pipeline] Pending event: %s", ctx_mgr.pending_event.get("name"))
     
     # Step 1: Transcribe audio with Whisper
-    print("\n[pipeline] Step 1: Transcribing audio with Whisper...")
+    LOGGER.debug("[pipeline] Step 1: Transcribing audio with Whisper...")
     try:
         transcript = transcribe_audio_file(audio_path)
         if transcript is None:
             result.error = "Failed to transcribe audio"
             return result
             
-        print(f"[pipeline] Raw Transcript: '{transcript}'")
+        LOGGER.info("[pipeline] Raw Transcript: '%s'", transcript)
         
         # Apply Context Logic
-        if context["state"] == ContextState.AWAITING_CLARIFICATION:
+        if context_state == ContextState.AWAITING_CLARIFICATION:
             # Merge transcripts
             if _looks_like_clarification(transcript):
-                original = context["last_transcript"]
+                original = ctx_mgr.last_transcript
                 transcript = f"{original} {transcript}"
-                print(f"[pipeline] Merged Transcript: '{transcript}'")
+                LOGGER.info("[pipeline] Merged Transcript: '%s'", transcript)
             else:
-                print("[pipeline] New command detected; skipping clarification merge.")
+                LOGGER.info("[pipeline] New command detected; skipping clarification merge.")
             # Clear context either way so it doesn't linger
             ctx_mgr.reset()
             
-        elif context["state"] == ContextState.AWAITING_CONFLICT_RESOLUTION:
+        elif context_state == ContextState.AWAITING_CONFLICT_RESOLUTION:
             # Check for confirmation
             lower_trans = transcript.lower()
-            confirmation_keywords = [
-                "yes", "okay", "sure", "do it", "confirm", 
-                "suggested", "suggestion", "recommendation", "that time", "great"
-            ]
-            if any(word in lower_trans for word in confirmation_keywords):
+            if _CONFIRMATION_RE.search(lower_trans):
                 # User confirmed the recommendation
-                pending = context["pending_event"]
-                rec = context["recommendation"]
-                
-                def _day_from_iso(dt_str: str) -> str:
-                    """Return lowercase weekday name from ISO datetime string."""
-                    try:
-                        return datetime.fromisoformat(dt_str).strftime("%A").lower()
-                    except Exception:
-                        return "today"
+                pending = ctx_mgr.pending_event
+                rec = ctx_mgr.recommendation
                 
                 if rec:
                     # Apply recommendation
-                    print(f"[pipeline] User confirmed recommendation. Updating start/end.")
+                    LOGGER.info("[pipeline] User confirmed recommendation. Updating start/end.")
                     pending["start"] = rec["start"]
                     pending["end"] = rec["end"]
                     day_name = _day_from_iso(rec["start"])
-                    transcript = f"Add {pending['name']} on {day_name} at {datetime.fromisoformat(rec['start']).strftime('%I:%M %p')}"
+                    transcript = f"Add {pending['name']} on {day_name} at {_parse_iso(rec['start']).strftime('%I:%M %p')}"
                 else:
                     # Just retry the original (might still conflict, but user insisted?)
                     # Or maybe we interpret "yes" as "force it"?
                     # For now, let's construct a new command that is explicit
                     day_name = _day_from_iso(pending["start"])
-                    transcript = f"Add {pending['name']} on {day_name} at {datetime.fromisoformat(pending['start']).strftime('%I:%M %p')}"
+                    transcript = f"Add {pending['name']} on {day_name} at {_parse_iso(pending['start']).strftime('%I:%M %p')}"
                 
-                print(f"[pipeline] Constructed Transcript from Confirmation: '{transcript}'")
+                LOGGER.info("[pipeline] Constructed Transcript from Confirmation: '%s'", transcript)
                 ctx_mgr.reset()
             else:
                 # User might be providing a new time: "No, make it 4pm"
@@ -233,55 +298,55 @@ def process_audio_file(
                 # Or just treat it as a new command. 
                 # If they say "Make it 4pm", the intent classifier might handle it if we contextually merge?
                 # Let's try merging with the event name: "Add [Event] [New Input]"
-                pending = context["pending_event"]
-                
-                def _day_from_iso(dt_str: str) -> str:
-                    try:
-                        return datetime.fromisoformat(dt_str).strftime("%A").lower()
-                    except Exception:
-                        return "today"
+                pending = ctx_mgr.pending_event
                 
                 day_name = _day_from_iso(pending.get("start", datetime.now().isoformat()))
                 transcript = f"Add {pending['name']} on {day_name} {transcript}"
-                print(f"[pipeline] Merged Conflict Response: '{transcript}'")
+                LOGGER.info("[pipeline] Merged Conflict Response: '%s'", transcript)
                 ctx_mgr.reset()
 
         result.transcript = transcript
         
         # Save transcript
-        transcript_path = output_dir / "transcript.txt"
-        with open(transcript_path, 'w') as f:
-            f.write(transcript)
+        _write_artifact(output_dir / "transcript.txt", transcript.encode("utf-8"))
             
     except Exception as e:
         result.error = f"Transcription error: {str(e)}"
-        print(f"[pipeline] Error: {result.error}")
+        LOGGER.error("[pipeline] Error: %s", result.error)
         return result
     
     # Step 2: Classify intent
-    print("\n[pipeline] Step 2: Classifying intent...")
+    LOGGER.debug("[pipeline] Step 2: Classifying intent...")
     try:
         intent_result = classify_intent(transcript, client_datetime)
         result.intent = intent_result.intent.value
         result.intent_confidence = intent_result.confidence
         result.intent_parameters = intent_result.parameters
-        print(f"[pipeline] Intent: {result.intent} (confidence: {result.intent_confidence})")
+        LOGGER.info("[pipeline] Intent: %s (confidence: %s)", result.intent, result.intent_confidence)
         
     except Exception as e:
         result.error = f"Intent classification error: {str(e)}"
-        print(f"[pipeline] Error: {result.error}")
+        LOGGER.error("[pipeline] Error: %s", result.error)
         return result
     
     # Step 3: Route to appropriate handler
-    print(f"\n[pipeline] Step 3: Handling {result.intent} intent...")
+    LOGGER.debug("[pipeline] Step 3: Handling %s intent...", result.intent)
+    # Query summaries stream from the LLM; start TTS on their first sentences
+    speech = None
+    if generate_tts and intent_result.intent in _STREAMED_SPEECH_INTENTS and is_tts_available():
+        speech = _StreamingSpeech(str(output_dir / "response.wav"))
     try:
         handler_result = route_intent(
             intent_result, 
             client_datetime, 
-            output_dir
+            output_dir,
+            include_agenda=include_agenda,
+            on_sentence=speech.put if speech else None
         )
         
         result.response_text = handler_result.get("response_text", "")
+        if speech:
+            result.summary_audio_path = speech.finish(result.response_text)
         result.changes_made = handler_result.get("changes_made", {})
         result.affected_days = handler_result.get("affected_days", [])
         result.calendar_debug = handler_result.get("calendar_debug", [])
@@ -293,15 +358,12 @@ def process_audio_file(
             
     except Exception as e:
         result.error = f"Handler error: {str(e)}"
-        print(f"[pipeline] Error: {result.error}")
-        import traceback
-        traceback.print_exc()
-        traceback.print_exc()
+        LOGGER.exception("[pipeline] Error: %s", result.error)
+        if speech:
+            speech.finish("")
         return result
     
     # Step 3.5: Update Context based on result
-    ctx_mgr = get_context_manager()
-    
     if result.error == "Clarification needed":
         ctx_mgr.set_clarification_state(result.transcript)
     elif result.error == "Conflict detected":
@@ -323,43 +385,77 @@ def process_audio_file(
         ctx_mgr.reset()
 
     # Step 4: Generate TTS audio
-    if generate_tts and is_tts_available() and result.response_text:
-        print("\n[pipeline] Step 4: Synthesizing speech...")
+    if result.summary_audio_path:
+        LOGGER.debug("[pipeline] Step 4: Speech already synthesized while streaming")
+    elif generate_tts and is_tts_available() and result.response_text:
+        LOGGER.debug("[pipeline] Step 4: Synthesizing speech...")
         try:
             audio_output_path = str(output_dir / "response.wav")
             result.summary_audio_path = synthesize_speech(result.response_text, audio_output_path)
         except Exception as e:
-            print(f"[pipeline] TTS warning: {str(e)}")
+            LOGGER.warning("[pipeline] TTS warning: %s", e)
             # TTS failure is not critical
     else:
-        print("\n[pipeline] Step 4: Skipping TTS")
+        LOGGER.debug("[pipeline] Step 4: Skipping TTS")
+    
+    # Calendar sync for schedule changes ran alongside TTS; wait for it here
+    _join_calendar_sync(result, handler_result)
     
     # Calculate processing time
     result.processing_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
     result.success = result.error is None
     
-    print(f"\n{'='*60}")
-    print(f"[pipeline] Processing complete!")
-    print(f"[pipeline] Response: '{result.response_text[:100]}...' " if result.response_text and len(result.response_text) > 100 else f"[pipeline] Response: '{result.response_text}'")
-    print(f"[pipeline] Total time: {result.processing_time_ms}ms")
-    print(f"{'='*60}\n")
+    LOGGER.info("[pipeline] Processing complete in %sms", result.processing_time_ms)
+    LOGGER.debug("[pipeline] Response: '%.100s'", result.response_text)
     
-    # Save complete result to JSON
+    # Save complete result to JSON. Serialized here so later changes to the
+    # result can't leak into the file; the write itself happens off the request path
     try:
         result_json_path = output_dir / "result.json"
-        with open(result_json_path, 'w') as f:
-            json.dump(result.to_dict(), f, indent=2)
-        print(f"[pipeline] Saved result to {result_json_path}")
+        _write_artifact(result_json_path, orjson.dumps(result.to_dict(), option=orjson.OPT_INDENT_2))
+        LOGGER.debug("[pipeline] Queued result for %s", result_json_path)
     except Exception as e:
-        print(f"[pipeline] Warning: Failed to save result JSON: {e}")
+        LOGGER.warning("[pipeline] Failed to save result JSON: %s", e)
 
     return result
 
 
+class _StreamingSpeech:
+    """Synthesizes a response into one WAV while its sentences are still arriving."""
+    
+    def __init__(self, output_path: str):
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._sentences: List[str] = []
+        self._future = _speech_executor.submit(
+            synthesize_speech_stream, iter(self._queue.get, None), output_path
+        )
+    
+    def put(self, sentence: str):
+        self._sentences.append(sentence)
+        self._queue.put(sentence)
+    
+    def finish(self, response_text: str) -> Optional[str]:
+        """
+        Wait for synthesis and return the audio path, or None if the audio
+        doesn't cover response_text (cached summary, fallback text, error).
+        """
+        self._queue.put(None)
+        try:
+            audio_path = self._future.result()
+        except Exception as e:
+            LOGGER.warning("[pipeline] TTS warning: %s", e)
+            return None
+        if " ".join(self._sentences).split() != response_text.split():
+            return None
+        return audio_path
+
+
 def route_intent(
     intent_result: IntentResult, 
     reference_datetime: datetime,
-    output_dir: Path
+    output_dir: Path,
+    include_agenda: bool = True,
+    on_sentence: Optional[Callable[[str], None]] = None
 ) -> Dict[str, Any]:
     """
     Route the classified intent to the appropriate handler.
@@ -368,6 +464,8 @@ def route_intent(
         intent_result: Classified intent with parameters
         reference_datetime: Reference datetime for day resolution
         output_dir: Output directory for saving files
+        include_agenda: Whether MODIFY_SCHEDULE should build the agenda and week data
+        on_sentence: Receives query summary sentences as the LLM streams them
         
     Returns:
         Dictionary with handler results
@@ -376,13 +474,13 @@ def route_intent(
     params = intent_result.parameters
     
     if intent == Intent.MODIFY_SCHEDULE:
-        return handle_modify_schedule(params, reference_datetime, output_dir)
+        return handle_modify_schedule(params, reference_datetime, output_dir, include_agenda)
     
     elif intent == Intent.QUERY_DAY:
-        return handle_query_day(params, reference_datetime)
+        return handle_query_day(params, reference_datetime, on_sentence)
     
     elif intent == Intent.QUERY_WEEK:
-        return handle_query_week()
+        return handle_query_week(on_sentence)
     
     elif intent == Intent.CLEAR_DAY:
         return handle_clear_day(params, reference_datetime)
@@ -408,7 +506,8 @@ def route_intent(
 def handle_modify_schedule(
     params: Dict[str, Any], 
     reference_datetime: datetime,
-    output_dir: Path
+    output_dir: Path,
+    include_agenda: bool = True
 ) -> Dict[str, Any]:
     """
     Handle MODIFY_SCHEDULE intent: add, edit, delete events.
@@ -426,7 +525,7 @@ def handle_modify_schedule(
     # Validate operations
     valid_ops, errors = validate_operations(operations)
     if errors:
-        print(f"[pipeline] Validation warnings: {errors}")
+        LOGGER.warning("[pipeline] Validation warnings: %s", errors)
     
     if not valid_ops:
         return {
@@ -445,255 +544,376 @@ def handle_modify_schedule(
     # Track changes
     changes_made = {"added": [], "deleted": [], "modified": [], "rescheduled": []}
     affected_days = []
-    calendar_debug = []
+    # (day_ops, old events, saved DaySchedule) per day still to sync to Calendar
+    pending_syncs = []
     
-    # Process each affected day
-    for day_name in DAYS_OF_WEEK:
-        day_ops = ops_by_day.get(day_name, {"add": [], "edit": [], "delete": []})
+    try:
+        # Process each affected day, in weekday order
+        for day_name in sorted(ops_by_day, key=DAY_INDEX.__getitem__):
+            day_ops = ops_by_day[day_name]
         
-        if not day_ops["add"] and not day_ops["edit"] and not day_ops["delete"]:
-            continue
+            if not day_ops["add"] and not day_ops["edit"] and not day_ops["delete"]:
+                continue
         
-        affected_days.append(day_name)
-        print(f"[pipeline] Processing {day_name}: +{len(day_ops['add'])} -{len(day_ops['delete'])} ~{len(day_ops['edit'])}")
+            affected_days.append(day_name)
+            LOGGER.info("[pipeline] Processing %s: +%d -%d ~%d", day_name,
+                        len(day_ops["add"]), len(day_ops["delete"]), len(day_ops["edit"]))
         
-        existing_schedule = manager.get_day_schedule(day_name)
-        day_date = get_date_for_day(day_name, reference_datetime)
+            existing_schedule = manager.get_day_schedule(day_name)
+            day_date = get_date_for_day(day_name, reference_datetime)
         
-        optimized = merge_and_optimize_events(
-            existing_events=existing_schedule.events,
-            new_events=day_ops["add"],
-            delete_names=day_ops["delete"],
-            edit_events=day_ops["edit"],
-            day_date=day_date
-        )
+            optimized = merge_and_optimize_events(
+                existing_events=existing_schedule.events,
+                new_events=day_ops["add"],
+                delete_names=day_ops["delete"],
+                edit_events=day_ops["edit"],
+                day_date=day_date
+            )
         
-        # If optimizer failed (e.g., no feasible slot), report back immediately
-        if optimized.get("error"):
-            return {
-                "response_text": f"I couldn't fit everything into {day_name.capitalize()}. The scheduler reported: {optimized['error']}",
-                "changes_made": {},
-                "affected_days": [],
-                "error": "Scheduling impossible"
-            }
+            # If optimizer failed (e.g., no feasible slot), report back immediately
+            if optimized.get("error"):
+                return {
+                    "response_text": f"I couldn't fit everything into {day_name.capitalize()}. The scheduler reported: {optimized['error']}",
+                    "changes_made": {},
+                    "affected_days": [],
+                    "calendar_sync": _start_calendar_sync(pending_syncs, manager),
+                    "error": "Scheduling impossible"
+                }
         
-        # Check for conflicts
-        conflicts = optimized.get("conflicts", [])
-        if conflicts:
-            conflict_responses = []
-            for conflict in conflicts:
-                new_evt = conflict["new_event"]
-                exist_evt = conflict["existing_event"]
-                exist_type = conflict["existing_type"]
-                rec = conflict["recommendation"]
-                new_name = new_evt.get("name", "event")
-                exist_name = exist_evt.get("name", "event")
-                try:
-                    conflict_time = datetime.fromisoformat(exist_evt["start"]).strftime("%I:%M %p").lstrip("0")
-                except:
-                    conflict_time = "that time"
-                msg = f"I couldn't add '{new_name}' because it conflicts with your {exist_type} event '{exist_name}' at {conflict_time}."
-                if rec:
+            # Check for conflicts
+            conflicts = optimized.get("conflicts", [])
+            if conflicts:
+                conflict_responses = []
+                for conflict in conflicts:
+                    new_evt = conflict["new_event"]
+                    exist_evt = conflict["existing_event"]
+                    exist_type = conflict["existing_type"]
+                    rec = conflict["recommendation"]
+                    new_name = new_evt.get("name", "event")
+                    exist_name = exist_evt.get("name", "event")
                     try:
-                        rec_time = datetime.fromisoformat(rec["start"]).strftime("%I:%M %p").lstrip("0")
-                        msg += f" I recommend moving it to {rec_time}."
+                        conflict_time = _spoken_time(exist_evt["start"])
                     except:
-                        pass
-                conflict_responses.append(msg)
+                        conflict_time = "that time"
+                    msg = f"I couldn't add '{new_name}' because it conflicts with your {exist_type} event '{exist_name}' at {conflict_time}."
+                    if rec:
+                        try:
+                            rec_time = _spoken_time(rec["start"])
+                            msg += f" I recommend moving it to {rec_time}."
+                        except:
+                            pass
+                    conflict_responses.append(msg)
             
-            return {
-                "response_text": " ".join(conflict_responses) + " Would you like to do that?",
-                "changes_made": {},
-                "affected_days": [],
-                "schedule_data": {"conflicts": conflicts},
-                "error": "Conflict detected"
-            }
+                return {
+                    "response_text": " ".join(conflict_responses) + " Would you like to do that?",
+                    "changes_made": {},
+                    "affected_days": [],
+                    "schedule_data": {"conflicts": conflicts},
+                    "calendar_sync": _start_calendar_sync(pending_syncs, manager),
+                    "error": "Conflict detected"
+                }
         
-        # Save the updated schedule - MOVED TO AFTER SYNC
-        updated_schedule = DaySchedule(day=day_name, events=optimized.get("events", []))
-        # manager.save_day_schedule(updated_schedule)
+            # Save the optimized schedule now so the response reflects it; the
+            # calendar sync runs alongside TTS and re-saves with the _calendar_ids
+            updated_schedule = DaySchedule(day=day_name, events=optimized.get("events", []))
+            with _day_locks[day_name]:
+                manager.save_day_schedule(updated_schedule)
+            pending_syncs.append((day_ops, existing_schedule.events, updated_schedule))
 
-        # === Calendar sync: create/update/delete events ===
-        # We sync AFTER optimization to ensure we use the final scheduled times.
-        # We must update the 'optimized' event objects with the new _calendar_id so it gets saved.
+            # Track what changed
+            for event in day_ops["add"]:
+                changes_made["added"].append((day_name, event.get("name", "event")))
+            for event_info in day_ops["delete"]:
+                changes_made["deleted"].append((day_name, event_info.get("name", "event")))
+            for event in day_ops["edit"]:
+                changes_made["modified"].append((day_name, event.get("name", "event")))
         
-        optimized_events = optimized.get("events", [])
-        
-        # 1. Handle ADDs
-        for new_event in day_ops["add"]:
-            # Find the corresponding event in the optimized list
-            # We match by name. (Assumption: names are unique enough for this batch)
-            target_event = None
-            for opt_event in optimized_events:
-                if opt_event.get("name") == new_event.get("name"):
-                    target_event = opt_event
-                    break
-            
-            if target_event:
-                title = target_event.get("name") or target_event.get("title") or "event"
-                start_iso = target_event.get("start")
-                end_iso = target_event.get("end")
-                all_day = target_event.get("all_day", False)
-                recurrence = target_event.get("recurrence")
-
-                cal_res = create_event(
-                    title=title,
-                    start=start_iso,
-                    end=end_iso,
-                    all_day=all_day,
-                    recurrence=recurrence
-                )
-                if cal_res.get("status") == "success":
-                    created = cal_res["event"]
-                    # Update the OPTIMIZED event object so it gets saved to disk
-                    target_event["_calendar_id"] = created.get("id")
-                    target_event["_calendar_htmlLink"] = created.get("htmlLink")
-                    debug_msg = cal_res.get("debug_message", f"Synced new event '{title}' to Calendar")
-                    calendar_debug.append(debug_msg)
-                    print(f"[pipeline] {debug_msg}")
-                else:
-                    err_msg = cal_res.get("error", "Unknown error")
-                    calendar_debug.append(f"Failed to create calendar event '{title}': {err_msg}")
-                    print("[pipeline] Warning: failed to create calendar event:", err_msg)
-            else:
-                print(f"[pipeline] Warning: Could not find optimized event for '{new_event.get('name')}' to sync.")
-
-        # 2. Handle EDITs
-        for event in day_ops["edit"]:
-            # For edits, the ID should be in the event object if it existed before.
-            # We need to find the optimized version to get the new times.
-            # We need to find the optimized version to get the new times AND the calendar ID.
-            target_event = None
-            for opt_event in optimized_events:
-                # Match by name (case-insensitive)
-                if opt_event.get("name", "").lower() == event.get("name", "").lower():
-                    target_event = opt_event
-                    break
-            
-            if not target_event:
-                print(f"[pipeline] Warning: Could not find optimized event for edit '{event.get('name')}'")
-                continue
-            
-            print(f"[pipeline] DEBUG: Found target_event for edit: {target_event.get('name')}")
-            print(f"[pipeline] DEBUG: target_event keys: {list(target_event.keys())}")
-            print(f"[pipeline] DEBUG: _calendar_id: {target_event.get('_calendar_id')}")
-            
-            if target_event and target_event.get("_calendar_id"):
-                upd_res = update_event(
-                    event_id=target_event["_calendar_id"],
-                    title=target_event.get("name"),
-                    start=target_event.get("start"),
-                    end=target_event.get("end"),
-                    all_day=target_event.get("all_day", False),
-                    recurrence=target_event.get("recurrence")
-                )
-                debug_msg = upd_res.get("debug_message", f"Synced update for '{target_event.get('name')}'")
-                calendar_debug.append(debug_msg)
-                print(f"[pipeline] {debug_msg}")
-            else:
-                msg = f"No calendar ID found for '{target_event.get('name')}'. Attempting recovery..."
-                print(f"[pipeline] {msg}")
-                
-                # Attempt to recover ID from Google Calendar
-                found_evt = find_event_by_details(target_event.get("name"), target_event.get("start"))
-                
-                if found_evt and found_evt.get("id"):
-                    print(f"[pipeline] Recovered event ID: {found_evt.get('id')}")
-                    target_event["_calendar_id"] = found_evt.get("id")
-                    target_event["_calendar_htmlLink"] = found_evt.get("htmlLink")
-                    
-                    # Now update it
-                    upd_res = update_event(
-                        event_id=target_event["_calendar_id"],
-                        title=target_event.get("name"),
-                        start=target_event.get("start"),
-                        end=target_event.get("end"),
-                        all_day=target_event.get("all_day", False),
-                        recurrence=target_event.get("recurrence")
-                    )
-                    debug_msg = upd_res.get("debug_message", f"Synced update for '{target_event.get('name')}' (Recovered ID)")
-                    calendar_debug.append(debug_msg)
-                    print(f"[pipeline] {debug_msg}")
-                else:
-                    msg = f"Could not recover calendar ID for '{target_event.get('name')}'. Skipping sync."
-                    calendar_debug.append(msg)
-                    print(f"[pipeline] {msg}")
+            # Serialize now: the calendar sync adds _calendar_ids to these events later
+            _write_artifact(
+                output_dir / f"schedule_{day_name}.json",
+                orjson.dumps(optimized, option=orjson.OPT_INDENT_2)
+            )
+    
+    except Exception:
+        # Days saved before the failure still need their Calendar writes
+        _start_calendar_sync(pending_syncs, manager)
+        raise
 
-        # 3. Handle DELETEs
-        # We need the OLD schedule to find the ID of the event we just deleted
-        # Use existing_schedule which was loaded BEFORE the changes were saved
-        
-        old_events = existing_schedule.events
-        for del_op in day_ops["delete"]:
-            # del_op might be just a name or a dict with name
-            del_name = del_op.get("name") if isinstance(del_op, dict) else str(del_op)
-            
-            # Find this event in the OLD schedule to get its ID
-            target_old_event = None
-            for old_evt in old_events:
-                if old_evt.get("name", "").lower() == del_name.lower():
-                    target_old_event = old_evt
-                    break
-            
-            cal_id = target_old_event.get("_calendar_id") if target_old_event else None
-            
-            # If we found the event locally but it has no ID, try to recover it
-            if target_old_event and not cal_id:
-                print(f"[pipeline] No ID for deletion of '{del_name}'. Attempting recovery...")
-                found_evt = find_event_by_details(del_name, target_old_event.get("start"))
-                if found_evt:
-                    cal_id = found_evt.get("id")
-                    print(f"[pipeline] Recovered ID for deletion: {cal_id}")
-
-            if cal_id:
-                del_res = delete_event(event_id=cal_id)
-                debug_msg = del_res.get("debug_message", f"Deleted calendar event ID {cal_id}")
-                calendar_debug.append(debug_msg)
-                print(f"[pipeline] {debug_msg}")
-            else:
-                msg = f"Skipping deletion for '{del_name}', no calendar ID found in previous schedule"
-                calendar_debug.append(msg)
-                print(f"[pipeline] {msg}")
-        
-        # Save the schedule AGAIN to persist the _calendar_ids we just added (if any from adds/edits)
-        # (Although we already saved it above, this second save might be redundant unless we updated IDs in the objects...
-        #  Actually, for ADDs/EDITs we updated 'target_event' which is a reference to an object in 'optimized['events']'.
-        #  So the first save at line 474 saved the objects *before* they had IDs populated in the loop?
-        #  Wait, line 474: updated_schedule = DaySchedule(..., events=optimized.get("events"))
-        #  Then we iterate over optimized_events (which are the SAME objects) and update them.
-        #  So we DO need to save again to persist the IDs.)
-        manager.save_day_schedule(updated_schedule)
-
-        # Track what changed
-        for event in day_ops["add"]:
-            changes_made["added"].append((day_name, event.get("name", "event")))
-        for event_info in day_ops["delete"]:
-            changes_made["deleted"].append((day_name, event_info.get("name", "event")))
-        for event in day_ops["edit"]:
-            changes_made["modified"].append((day_name, event.get("name", "event")))
-        
-        schedule_path = output_dir / f"schedule_{day_name}.json"
-        with open(schedule_path, 'w') as f:
-            json.dump(optimized, f, indent=2)
-    
     response_text = generate_changes_summary(changes_made)
-    today = get_day_from_datetime(reference_datetime)
-    today_schedule = manager.get_day_schedule(today)
-    agenda = generate_agenda_for_esp32({"events": today_schedule.events})
+    agenda = None
+    schedule_data = None
+    if include_agenda:
+        today = get_day_from_datetime(reference_datetime)
+        today_schedule = manager.get_day_schedule(today)
+        agenda = generate_agenda_for_esp32({"events": today_schedule.events})
+        schedule_data = manager.get_week_summary_data()
     
     return {
         "response_text": response_text,
         "changes_made": changes_made,
         "affected_days": affected_days,
-        "calendar_debug": calendar_debug,
-        "schedule_data": manager.get_week_summary_data(),
+        "schedule_data": schedule_data,
         "agenda": agenda,
+        "calendar_sync": _start_calendar_sync(pending_syncs, manager),
         "error": None
     }
 
 
+def _index_events_by_name(events: List[Dict[str, Any]], names: set) -> Dict[str, Dict[str, Any]]:
+    """
+    Map lowercased event name -> event for the events named in `names`, in a
+    single pass. The first event wins for duplicate names.
+    """
+    index = {}
+    for event in events:
+        key = event.get("name", "").lower()
+        if key in names and key not in index:
+            index[key] = event
+    return index
+
+
+def _op_name(op: Any) -> str:
+    """Lowercased event name of an add/edit/delete op (deletes may be bare names)."""
+    name = op.get("name", "") if isinstance(op, dict) else str(op)
+    return (name or "").lower()
 
-def handle_query_day(params: Dict[str, Any], reference_datetime: datetime) -> Dict[str, Any]:
+
+def _sync_day_to_calendar(
+    day_ops: Dict[str, Any],
+    old_events: List[Dict[str, Any]],
+    updated_schedule: DaySchedule
+) -> List[str]:
+    """
+    Push one day's adds/edits/deletes to Google Calendar.
+    Stores the new _calendar_ids on updated_schedule's events.
+    
+    Returns:
+        Calendar debug messages
+    """
+    calendar_debug = []
+    
+    # === Calendar sync: create/update/delete events ===
+    # We sync AFTER optimization to ensure we use the final scheduled times.
+    # We must update the 'optimized' event objects with the new _calendar_id so it gets saved.
+    
+    # One pass over the optimized events finds every add and edit target, and
+    # one pass over the old events finds every delete target
+    optimized_by_name = _index_events_by_name(
+        updated_schedule.events,
+        {_op_name(op) for op in day_ops["add"]} | {_op_name(op) for op in day_ops["edit"]}
+    )
+    old_by_name = _index_events_by_name(old_events, {_op_name(op) for op in day_ops["delete"]})
+    
+    # Edits and deletes are one HTTPS round-trip each and independent of one
+    # another, so run them on the calendar I/O pool while the adds go out
+    edit_futures = [
+        _calendar_io_executor.submit(_sync_edit_to_calendar, event, optimized_by_name)
+        for event in day_ops["edit"]
+    ]
+    delete_futures = [
+        _calendar_io_executor.submit(_sync_delete_to_calendar, del_op, old_by_name)
+        for del_op in day_ops["delete"]
+    ]
+    
+    # 1. Handle ADDs (one batched Calendar request for all of the day's adds)
+    add_targets = []
+    for new_event in day_ops["add"]:
+        # Find the corresponding event in the optimized list
+        # We match by name. (Assumption: names are unique enough for this batch)
+        target_event = optimized_by_name.get(_op_name(new_event))
+        
+        if target_event:
+            add_targets.append(target_event)
+        else:
+            LOGGER.warning("[pipeline] Could not find optimized event for '%s' to sync.", new_event.get("name"))
+    
+    cal_results = create_events_batch([
+        {
+            "title": target_event.get("name") or target_event.get("title") or "event",
+            "start": target_event.get("start"),
+            "end": target_event.get("end"),
+            "all_day": target_event.get("all_day", False),
+            "recurrence": target_event.get("recurrence")
+        }
+        for target_event in add_targets
+    ])
+    
+    for target_event, cal_res in zip(add_targets, cal_results):
+        title = target_event.get("name") or target_event.get("title") or "event"
+        if cal_res.get("status") == "success":
+            created = cal_res["event"]
+            # Update the OPTIMIZED event object so it gets saved to disk
+            target_event["_calendar_id"] = created.get("id")
+            target_event["_calendar_htmlLink"] = created.get("htmlLink")
+            debug_msg = cal_res.get("debug_message", f"Synced new event '{title}' to Calendar")
+            calendar_debug.append(debug_msg)
+            LOGGER.info("[pipeline] %s", debug_msg)
+        else:
+            err_msg = cal_res.get("error", "Unknown error")
+            calendar_debug.append(f"Failed to create calendar event '{title}': {err_msg}")
+            LOGGER.warning("[pipeline] Failed to create calendar event: %s", err_msg)
+
+    # 2. EDITs and 3. DELETEs were started above; collect them in order
+    for future in edit_futures + delete_futures:
+        calendar_debug.extend(future.result())
+
+    return calendar_debug
+
+
+def _sync_edit_to_calendar(event: Dict[str, Any], optimized_by_name: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Push one edited event's new times to Google Calendar; returns debug messages."""
+    calendar_debug = []
+    
+    # For edits, the ID should be in the event object if it existed before.
+    # We need to find the optimized version to get the new times AND the calendar ID.
+    # Match by name (case-insensitive)
+    target_event = optimized_by_name.get(_op_name(event))
+
+    if not target_event:
+        LOGGER.warning("[pipeline] Could not find optimized event for edit '%s'", event.get("name"))
+        return calendar_debug
+
+    # %-style args so nothing is formatted unless debug logging is enabled
+    LOGGER.debug("[pipeline] Found target_event for edit: %s", target_event.get("name"))
+    LOGGER.debug("[pipeline] target_event keys: %s", list(target_event.keys()))
+    LOGGER.debug("[pipeline] _calendar_id: %s", target_event.get("_calendar_id"))
+
+    if target_event and target_event.get("_calendar_id"):
+        upd_res = update_event(
+            event_id=target_event["_calendar_id"],
+            title=target_event.get("name"),
+            start=target_event.get("start"),
+            end=target_event.get("end"),
+            all_day=target_event.get("all_day", False),
+            recurrence=target_event.get("recurrence")
+        )
+        debug_msg = upd_res.get("debug_message", f"Synced update for '{target_event.get('name')}'")
+        calendar_debug.append(debug_msg)
+        LOGGER.info("[pipeline] %s", debug_msg)
+    else:
+        msg = f"No calendar ID found for '{target_event.get('name')}'. Attempting recovery..."
+        LOGGER.info("[pipeline] %s", msg)
+
+        # Attempt to recover ID from Google Calendar
+        found_evt = find_event_by_details(target_event.get("name"), target_event.get("start"))
+
+        if found_evt and found_evt.get("id"):
+            LOGGER.info("[pipeline] Recovered event ID: %s", found_evt.get("id"))
+            target_event["_calendar_id"] = found_evt.get("id")
+            target_event["_calendar_htmlLink"] = found_evt.get("htmlLink")
+
+            # Now update it
+            upd_res = update_event(
+                event_id=target_event["_calendar_id"],
+                title=target_event.get("name"),
+                start=target_event.get("start"),
+                end=target_event.get("end"),
+                all_day=target_event.get("all_day", False),
+                recurrence=target_event.get("recurrence")
+            )
+            debug_msg = upd_res.get("debug_message", f"Synced update for '{target_event.get('name')}' (Recovered ID)")
+            calendar_debug.append(debug_msg)
+            LOGGER.info("[pipeline] %s", debug_msg)
+        else:
+            msg = f"Could not recover calendar ID for '{target_event.get('name')}'. Skipping sync."
+            calendar_debug.append(msg)
+            LOGGER.info("[pipeline] %s", msg)
+    
+    return calendar_debug
+
+
+def _sync_delete_to_calendar(del_op: Any, old_by_name: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Delete one removed event from Google Calendar; returns debug messages."""
+    calendar_debug = []
+    
+    # We need the OLD schedule (loaded before the changes were saved) to find the ID
+    # del_op might be just a name or a dict with name
+    del_name = del_op.get("name") if isinstance(del_op, dict) else str(del_op)
+
+    # Find this event in the OLD schedule to get its ID
+    target_old_event = old_by_name.get(del_name.lower())
+
+    cal_id = target_old_event.get("_calendar_id") if target_old_event else None
+
+    # If we found the event locally but it has no ID, try to recover it
+    if target_old_event and not cal_id:
+        LOGGER.info("[pipeline] No ID for deletion of '%s'. Attempting recovery...", del_name)
+        found_evt = find_event_by_details(del_name, target_old_event.get("start"))
+        if found_evt:
+            cal_id = found_evt.get("id")
+            LOGGER.info("[pipeline] Recovered ID for deletion: %s", cal_id)
+
+    if cal_id:
+        del_res = delete_event(event_id=cal_id)
+        debug_msg = del_res.get("debug_message", f"Deleted calendar event ID {cal_id}")
+        calendar_debug.append(debug_msg)
+        LOGGER.info("[pipeline] %s", debug_msg)
+    else:
+        msg = f"Skipping deletion for '{del_name}', no calendar ID found in previous schedule"
+        calendar_debug.append(msg)
+        LOGGER.info("[pipeline] %s", msg)
+    
+    return calendar_debug
+
+
+def _sync_days_to_calendar(pending_syncs: List[tuple], manager: ScheduleManager) -> List[str]:
+    """
+    Sync every modified day to Google Calendar, then record any new
+    _calendar_ids in the saved day. The day is re-read under its lock and
+    only the calendar fields are merged in, so a request that saved the same
+    day while the Calendar calls ran isn't overwritten.
+    """
+    calendar_debug = []
+    for day_ops, old_events, updated_schedule in pending_syncs:
+        ids_before = [event.get("_calendar_id") for event in updated_schedule.events]
+        calendar_debug.extend(_sync_day_to_calendar(day_ops, old_events, updated_schedule))
+        linked = {}
+        for event, id_before in zip(updated_schedule.events, ids_before):
+            cal_id = event.get("_calendar_id")
+            if cal_id and cal_id != id_before:
+                linked.setdefault(event.get("name", "").lower(), event)
+        if not linked:
+            continue
+        with _day_locks[updated_schedule.day]:
+            current = manager.get_day_schedule(updated_schedule.day)
+            changed = False
+            for event in current.events:
+                if event.get("_calendar_id"):
+                    continue
+                synced = linked.pop(event.get("name", "").lower(), None)
+                if synced is not None:
+                    event["_calendar_id"] = synced["_calendar_id"]
+                    event["_calendar_htmlLink"] = synced.get("_calendar_htmlLink")
+                    changed = True
+            if changed:
+                manager.save_day_schedule(current)
+    return calendar_debug
+
+
+def _start_calendar_sync(pending_syncs: List[tuple], manager: ScheduleManager) -> Optional[Future]:
+    """Run the calendar sync on the background executor; None if nothing to sync."""
+    if not pending_syncs:
+        return None
+    return _calendar_executor.submit(_sync_days_to_calendar, pending_syncs, manager)
+
+
+def _join_calendar_sync(result: ProcessingResult, handler_result: Dict[str, Any]):
+    """Wait for the handler's calendar sync (if any) and record its debug output."""
+    calendar_sync = handler_result.get("calendar_sync")
+    if calendar_sync is None:
+        return
+    try:
+        result.calendar_debug = result.calendar_debug + calendar_sync.result()
+    except Exception as e:
+        result.calendar_debug = result.calendar_debug + [f"Calendar sync failed: {e}"]
+        LOGGER.error("[pipeline] Calendar sync error: %s", e)
+
+
+def handle_query_day(
+    params: Dict[str, Any],
+    reference_datetime: datetime,
+    on_sentence: Optional[Callable[[str], None]] = None
+) -> Dict[str, Any]:
     """
     Handle QUERY_DAY intent: get schedule for a specific day.
     """
@@ -709,7 +929,7 @@ def handle_query_day(params: Dict[str, Any], reference_datetime: datetime) -> Di
     today = get_day_from_datetime(reference_datetime)
     is_today = (day_name == today)
     
-    response_text = generate_query_response(day_name, schedule.events, is_today)
+    response_text = generate_query_response(day_name, schedule.events, is_today, on_sentence)
     agenda = generate_agenda_for_esp32({"events": schedule.events})
     
     return {
@@ -720,15 +940,16 @@ def handle_query_day(params: Dict[str, Any], reference_datetime: datetime) -> Di
     }
 
 
-def handle_query_week() -> Dict[str, Any]:
+def handle_query_week(on_sentence: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
     """
     Handle QUERY_WEEK intent: get overview of entire week.
     """
     manager = get_schedule_manager()
     manager.check_and_reset_if_new_week()
     
-    week_data = manager.get_week_summary_data()
-    response_text = generate_week_summary(week_data["days"])
+    response_text, week_data = manager.get_week_summary_text(
+        lambda days: generate_week_summary_with_status(days, on_sentence)
+    )
     
     return {
         "response_text": response_text,
@@ -737,6 +958,45 @@ def handle_query_week() -> Dict[str, Any]:
     }
 
 
+def _delete_events_from_calendar(events: List[Dict[str, Any]]) -> List[str]:
+    """
+    Delete cleared events from Google Calendar: recover any missing IDs, then
+    send every deletion in one batched request. Returns calendar debug messages.
+    """
+    calendar_debug = []
+    cal_ids = []
+    
+    # ID Recovery: one calendar listing covering every event missing an ID
+    missing = [i for i, evt in enumerate(events) if not evt.get("_calendar_id")]
+    for i in missing:
+        LOGGER.info("[pipeline] No ID for deletion of '%s'. Attempting recovery...", events[i].get("name"))
+    recoveries = dict(zip(missing, find_events_by_details(
+        [(events[i].get("name"), events[i].get("start")) for i in missing]
+    )))
+    
+    for i, evt in enumerate(events):
+        cal_id = evt.get("_calendar_id")
+        if i in recoveries:
+            found_evt = recoveries[i]
+            if found_evt:
+                cal_id = found_evt.get("id")
+                LOGGER.info("[pipeline] Recovered ID for deletion: %s", cal_id)
+
+        if cal_id:
+            cal_ids.append(cal_id)
+        else:
+            msg = f"Skipping calendar deletion for '{evt.get('name')}', no ID found"
+            calendar_debug.append(msg)
+            LOGGER.info("[pipeline] %s", msg)
+    
+    for cal_id, del_res in zip(cal_ids, delete_events_batch(cal_ids)):
+        debug_msg = del_res.get("debug_message", f"Deleted calendar event ID {cal_id}")
+        calendar_debug.append(debug_msg)
+        LOGGER.info("[pipeline] %s", debug_msg)
+    
+    return calendar_debug
+
+
 def handle_clear_day(params: Dict[str, Any], reference_datetime: datetime) -> Dict[str, Any]:
     """
     Handle CLEAR_DAY intent: clear all events for a specific day.
@@ -746,36 +1006,17 @@ def handle_clear_day(params: Dict[str, Any], reference_datetime: datetime) -> Di
     
     manager = get_schedule_manager()
     
-    # Get existing events BEFORE clearing to find IDs
-    existing_schedule = manager.get_day_schedule(day_name)
+    # Keep the cleared events to find their calendar IDs
+    existing_schedule = manager.pop_day_schedule(day_name)
     events_to_delete = existing_schedule.events
     
-    had_events = manager.clear_day(day_name)
+    had_events = bool(events_to_delete)
     
     calendar_debug = []
     
     # Sync deletions to Google Calendar
     if had_events:
-        for evt in events_to_delete:
-            cal_id = evt.get("_calendar_id")
-            
-            # ID Recovery
-            if not cal_id:
-                print(f"[pipeline] No ID for deletion of '{evt.get('name')}'. Attempting recovery...")
-                found_evt = find_event_by_details(evt.get("name"), evt.get("start"))
-                if found_evt:
-                    cal_id = found_evt.get("id")
-                    print(f"[pipeline] Recovered ID for deletion: {cal_id}")
-
-            if cal_id:
-                del_res = delete_event(event_id=cal_id)
-                debug_msg = del_res.get("debug_message", f"Deleted calendar event ID {cal_id}")
-                calendar_debug.append(debug_msg)
-                print(f"[pipeline] {debug_msg}")
-            else:
-                msg = f"Skipping calendar deletion for '{evt.get('name')}', no ID found"
-                calendar_debug.append(msg)
-                print(f"[pipeline] {msg}")
+        calendar_debug = _delete_events_from_calendar(events_to_delete)
     
     if had_events:
         response_text = generate_clear_confirmation("day", day_name)
@@ -799,41 +1040,19 @@ def handle_clear_week() -> Dict[str, Any]:
     """
     manager = get_schedule_manager()
     
-    # Get all events to delete
-    week_schedule = manager.get_week_schedule()
-    
-    manager.clear_week()
-    
-    calendar_debug = []
+    # Keep the cleared events to find their calendar IDs
+    week_schedule = manager.pop_week_schedule()
     
     # Sync deletions
-    for day, schedule in week_schedule.items():
-        for evt in schedule.events:
-            cal_id = evt.get("_calendar_id")
-            
-            # ID Recovery
-            if not cal_id:
-                print(f"[pipeline] No ID for deletion of '{evt.get('name')}'. Attempting recovery...")
-                found_evt = find_event_by_details(evt.get("name"), evt.get("start"))
-                if found_evt:
-                    cal_id = found_evt.get("id")
-                    print(f"[pipeline] Recovered ID for deletion: {cal_id}")
-
-            if cal_id:
-                del_res = delete_event(event_id=cal_id)
-                debug_msg = del_res.get("debug_message", f"Deleted calendar event ID {cal_id}")
-                calendar_debug.append(debug_msg)
-                print(f"[pipeline] {debug_msg}")
-            else:
-                msg = f"Skipping calendar deletion for '{evt.get('name')}', no ID found"
-                calendar_debug.append(msg)
-                print(f"[pipeline] {msg}")
+    calendar_debug = _delete_events_from_calendar(
+        [evt for schedule in week_schedule.values() for evt in schedule.events]
+    )
     
     response_text = generate_clear_confirmation("week")
     
     return {
         "response_text": response_text,
-        "affected_days": DAYS_OF_WEEK.copy(),
+        "affected_days": list(DAYS_OF_WEEK),
         "changes_made": {"cleared_week": True},
         "calendar_debug": calendar_debug,
         "agenda": {"today": [], "next_item": None},
@@ -852,20 +1071,24 @@ def handle_help() -> Dict[str, Any]:
     }
 
 
+# Follow-up question keyed by (missing time, missing day)
+_CLARIFICATION_QUESTIONS = {
+    (True, True): "When would you like to schedule that?",
+    (True, False): "What time would you like to schedule that?",
+    (False, True): "Which day would you like to schedule that?",
+}
+
+
 def handle_clarification(params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Handle CLARIFICATION_NEEDED intent.
     """
     missing = params.get("missing_info", "details")
+    missing_low = missing.lower()
     
     # Generate a natural question
-    if "time" in missing.lower() and "day" in missing.lower():
-        response = "When would you like to schedule that?"
-    elif "time" in missing.lower():
-        response = "What time would you like to schedule that?"
-    elif "day" in missing.lower():
-        response = "Which day would you like to schedule that?"
-    else:
+    response = _CLARIFICATION_QUESTIONS.get(("time" in missing_low, "day" in missing_low))
+    if response is None:
         response = f"Could you please provide more details about the {missing}?"
         
     return {
@@ -899,8 +1122,7 @@ def process_transcript_only(
         client_datetime = datetime.now()
     result.client_datetime = client_datetime.isoformat()
     
-    print(f"\n[pipeline] Processing transcript (Whisper skipped)")
-    print(f"[pipeline] Transcript: '{transcript}'")
+    LOGGER.info("[pipeline] Processing transcript (Whisper skipped): '%s'", transcript)
     
     try:
         # Classify intent
@@ -922,13 +1144,13 @@ def process_transcript_only(
         result.calendar_debug = handler_result.get("calendar_debug", [])
         result.schedule_data = handler_result.get("schedule_data")
         result.agenda = handler_result.get("agenda")
+        _join_calendar_sync(result, handler_result)
         
         result.success = True
         result.processing_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
         
     except Exception as e:
         result.error = str(e)
-        import traceback
-        traceback.print_exc()
+        LOGGER.exception("[pipeline] Error: %s", result.error)
     
     return result
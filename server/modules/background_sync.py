@@ -2,17 +2,43 @@
 # Run this in a separate process
 
 import os
-import json
-import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, time as dt_time
 from pathlib import Path
-import schedule
+from dateutil.rrule import rrulestr
+import orjson
+from apscheduler.schedulers.blocking import BlockingScheduler
 
-from .schedule_manager import get_schedule_manager, DaySchedule, get_day_from_datetime
-from .calendar_utils import fetch_events
+from .schedule_manager import get_schedule_manager, DaySchedule, get_day_from_datetime, DAYS_OF_WEEK
+from .simple_calendar import fetch_events, calendar_changed_since_last_sync, save_sync_token
 from .summary_generator import generate_agenda_for_esp32
 
 
+# Date of the last successful merge; only today's events are merged, so a
+# new day needs a full run even when the calendar itself hasn't changed
+LAST_MERGE_PATH = Path("output/.last_merge")
+
+# (event key, date) -> whether the event's recurrence has an occurrence that
+# day, so hourly syncs don't re-parse and re-expand the same RRULEs
+_RRULE_CACHE = {}
+
+
+def _recurs_on(event, start_dt, day):
+    """True if a recurring event (RRULE/EXDATE lines) has an occurrence on day."""
+    key = (event.get("_calendar_id") or event.get("id") or (event["name"], event["start"]), day)
+    cached = _RRULE_CACHE.get(key)
+    if cached is None:
+        try:
+            rule = rrulestr("\n".join(event["recurrence"]), dtstart=start_dt, forceset=True)
+            day_start = datetime.combine(day, dt_time.min, tzinfo=start_dt.tzinfo)
+            # inc=True so an occurrence at exactly midnight (all-day events) counts
+            cached = bool(rule.between(day_start, day_start + timedelta(days=1), inc=True))
+        except (ValueError, TypeError) as e:
+            print(f"[background_sync] Could not parse recurrence for '{event.get('name')}': {e}")
+            cached = False
+        _RRULE_CACHE[key] = cached
+    return cached
+
+
 def merge_external_events(events):
     """
     Merge external calendar events into SmartPager's schedule.
@@ -21,7 +47,13 @@ def merge_external_events(events):
     events: list of dicts with keys ['name', 'start', 'end', 'all_day', 'recurrence', '_calendar_id']
     """
     manager = get_schedule_manager()
-    today_name = datetime.now().strftime("%A").lower()
+    # Compare weekday numbers rather than formatting a day name per event
+    today = datetime.now().date()
+    today_idx = today.weekday()
+    today_name = DAYS_OF_WEEK[today_idx]
+    # Expansions for earlier days can never be hit again
+    for key in [k for k in _RRULE_CACHE if k[1] != today]:
+        del _RRULE_CACHE[key]
 
     # Filter events for today (or recurring events)
     day_events = []
@@ -32,13 +64,14 @@ def merge_external_events(events):
         except Exception:
             continue
 
-        # Recurring events (basic daily/weekly)
-        recurrences = event.get("recurrence", [])
-        if recurrences:
-            # For now, handle simple daily or weekly recurrence
-            # TODO: extend with full RRULE parsing
-            day_events.append(event)
-        elif event_start_dt.strftime("%A").lower() == today_name:
+        # Recurring events: keep them only if they occur today. fetch_events()
+        # lists with singleEvents=True, so Google already expands those into
+        # dated instances; this covers callers passing master events with
+        # their RRULE lines.
+        if event.get("recurrence"):
+            if _recurs_on(event, event_start_dt, today):
+                day_events.append(event)
+        elif event_start_dt.weekday() == today_idx:
             day_events.append(event)
 
     # Load current schedule for today
@@ -46,18 +79,25 @@ def merge_external_events(events):
 
     # Merge: add if name/start not already present
     merged_events = existing_schedule.events.copy()
+    existing_keys = {(e["name"], e["start"]) for e in merged_events}
     for evt in day_events:
-        if not any(
-            e["name"] == evt["name"] and e["start"] == evt["start"]
-            for e in merged_events
-        ):
+        key = (evt["name"], evt["start"])
+        if key not in existing_keys:
             merged_events.append(evt)
+            existing_keys.add(key)
 
     # Save updated schedule
     manager.save_day_schedule(DaySchedule(day=today_name, events=merged_events))
     return merged_events
 
 
+def _last_merge_date():
+    try:
+        return datetime.strptime(LAST_MERGE_PATH.read_text().strip(), "%Y-%m-%d").date()
+    except (FileNotFoundError, ValueError):
+        return None
+
+
 def update_from_calendar():
     """
     Fetch events from external calendar and merge into SmartPager schedule.
@@ -65,7 +105,14 @@ def update_from_calendar():
     now = datetime.now()
     print(f"[background_sync] Starting calendar sync at {now.isoformat()}")
     try:
-        events = fetch_events()  # returns list of dicts with start/end/name/all_day/recurrence
+        changed, sync_token = calendar_changed_since_last_sync()
+        # Most hours nothing changed; skip the fetch, merge and agenda write
+        # unless today's events haven't been merged yet
+        if not changed and _last_merge_date() == now.date():
+            print("[background_sync] Calendar unchanged since last sync, skipping")
+            return
+
+        events = fetch_events(raise_errors=True)  # returns list of dicts with start/end/name/all_day
         merged_events = merge_external_events(events)
         print(f"[background_sync] Merged {len(merged_events)} events into today's schedule")
 
@@ -73,8 +120,12 @@ def update_from_calendar():
         agenda = generate_agenda_for_esp32({"events": merged_events})
         output_dir = Path("output")
         output_dir.mkdir(parents=True, exist_ok=True)
-        with open(output_dir / "agenda.json", "w") as f:
-            json.dump(agenda, f, indent=2)
+        (output_dir / "agenda.json").write_bytes(orjson.dumps(agenda, option=orjson.OPT_INDENT_2))
+
+        # Only now are these changes consumed; a failure above leaves the old
+        # token in place so the next poll retries them
+        save_sync_token(sync_token)
+        LAST_MERGE_PATH.write_text(now.date().isoformat())
 
     except Exception as e:
         print(f"[background_sync] Error during calendar sync: {str(e)}")
@@ -83,16 +134,13 @@ def update_from_calendar():
 def run_hourly_sync():
     """
     Schedule the background sync to run every hour.
+    The scheduler sleeps until the next run instead of polling.
     """
     print("[background_sync] Scheduling hourly calendar sync...")
-    schedule.every(1).hours.do(update_from_calendar)
-
-    # Run initial sync immediately
-    update_from_calendar()
-
-    while True:
-        schedule.run_pending()
-        time.sleep(60)
+    scheduler = BlockingScheduler()
+    # Run initial sync immediately, then hourly
+    scheduler.add_job(update_from_calendar, 'interval', hours=1, next_run_time=datetime.now())
+    scheduler.start()
 
 
 if __name__ == "__main__":
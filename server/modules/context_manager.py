@@ -1,7 +1,45 @@
+import os
+from contextlib import contextmanager
 from enum import Enum
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Optional, Dict, Any
 
+import orjson
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking, restart persistence only
+    fcntl = None
+
+# Pending clarifications survive restarts and are shared by worker processes
+# through this file. It is rewritten (temp file + rename) on every state
+# change and re-read whenever another process has replaced it.
+STATE_PATH = Path(os.getenv("CONTEXT_STATE", "/tmp/smartpager_context.json"))
+LOCK_PATH = STATE_PATH.with_name(STATE_PATH.name + ".lock")
+
+
+@contextmanager
+def _state_lock(shared: bool = False):
+    """flock LOCK_PATH so a process never reads the state mid-replace."""
+    if fcntl is None:
+        yield
+        return
+    with open(LOCK_PATH, "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def _file_key():
+    """Identity of the current state file; each rename gives a new inode."""
+    try:
+        st = STATE_PATH.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
 class ContextState(Enum):
     IDLE = "idle"
     AWAITING_CLARIFICATION = "awaiting_clarification"
@@ -20,15 +58,68 @@ class ContextManager:
         if self._initialized:
             return
         self._initialized = True
-        self.reset()
+        self._file_key = None
+        self._clear()
+        self._load()
+        if self.state != ContextState.IDLE:
+            print(f"[ContextManager] Restored {self.state.value} context from {STATE_PATH}")
         
-    def reset(self):
-        """Reset context to idle state"""
+    def _clear(self):
         self.state = ContextState.IDLE
         self.last_transcript = None
         self.pending_event = None
         self.recommendation = None
         self.last_interaction_time = None
+    
+    def _persist(self):
+        """Write the current state to STATE_PATH atomically (temp file + rename)."""
+        data = {
+            "state": self.state.value,
+            "last_transcript": self.last_transcript,
+            "pending_event": self.pending_event,
+            "recommendation": self.recommendation,
+            "last_interaction_time": self.last_interaction_time,
+        }
+        try:
+            tmp_path = STATE_PATH.with_name(f"{STATE_PATH.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(orjson.dumps(data))
+            with _state_lock():
+                os.replace(tmp_path, STATE_PATH)
+                self._file_key = _file_key()
+        except (OSError, TypeError) as e:
+            print(f"[ContextManager] Could not persist context: {e}")
+    
+    def _load(self):
+        """Read the state saved by this or another process, unless it has expired."""
+        try:
+            with _state_lock(shared=True):
+                self._file_key = _file_key()
+                data = orjson.loads(STATE_PATH.read_bytes())
+            self.state = ContextState(data["state"])
+            self.last_transcript = data.get("last_transcript")
+            self.pending_event = data.get("pending_event")
+            self.recommendation = data.get("recommendation")
+            saved_time = data.get("last_interaction_time")
+            self.last_interaction_time = datetime.fromisoformat(saved_time) if saved_time else None
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[ContextManager] Ignoring unreadable saved context: {e}")
+            self._clear()
+            return
+        if self.state != ContextState.IDLE and self.is_expired():
+            self._clear()
+    
+    def _refresh(self):
+        """Pick up a state change written by another worker process."""
+        if _file_key() != self._file_key:
+            self._clear()
+            self._load()
+        
+    def reset(self):
+        """Reset context to idle state"""
+        self._clear()
+        self._persist()
         
     def is_expired(self, timeout_seconds=300) -> bool:
         """Check if context has expired"""
@@ -41,6 +132,7 @@ class ContextManager:
         self.state = ContextState.AWAITING_CLARIFICATION
         self.last_transcript = original_transcript
         self.last_interaction_time = datetime.now()
+        self._persist()
         print(f"[ContextManager] State set to AWAITING_CLARIFICATION. Transcript: '{original_transcript}'")
         
     def set_conflict_state(self, pending_event: Dict[str, Any], recommendation: Optional[Dict[str, Any]] = None):
@@ -49,19 +141,31 @@ class ContextManager:
         self.pending_event = pending_event
         self.recommendation = recommendation
         self.last_interaction_time = datetime.now()
+        self._persist()
         print(f"[ContextManager] State set to AWAITING_CONFLICT_RESOLUTION. Event: {pending_event.get('name')}")
 
-    def get_context(self) -> Dict[str, Any]:
-        """Get current valid context"""
+    def current_state(self) -> ContextState:
+        """
+        Expire a stale context, then return the current state. Callers read
+        last_transcript / pending_event / recommendation straight off the
+        manager instead of going through a get_context() dict.
+        """
+        self._refresh()
         if self.is_expired():
             if self.state != ContextState.IDLE:
                 print("[ContextManager] Context expired, resetting.")
                 self.reset()
-            return {"state": ContextState.IDLE}
+            return ContextState.IDLE
         print (f"[ContextManager] Returning current context state: {self.state}")
         print (f"[ContextManager] Last transcript: {self.last_transcript}")
         print (f"[ContextManager] Pending event: {self.pending_event}")
         print (f"[ContextManager] Recommendation: {self.recommendation}")
+        return self.state
+
+    def get_context(self) -> Dict[str, Any]:
+        """Get current valid context"""
+        if self.current_state() == ContextState.IDLE:
+            return {"state": ContextState.IDLE}
             
         return {
             "state": self.state,
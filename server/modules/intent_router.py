@@ -7,13 +7,21 @@ Supports multi-tool architecture where the LLM decides which action to take.
 """
 
 import os
-import json
+import re
+import copy
+import threading
 from datetime import datetime
 from openai import OpenAI
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+import numpy as np
+from cachetools import LRUCache
+import orjson
+
+from .schedule_manager import DAYS_OF_WEEK
+
 
 class Intent(Enum):
     """Supported user intents"""
@@ -27,6 +35,10 @@ class Intent(Enum):
     UNKNOWN = "unknown"                      # Can't understand
 
 
+# LLM intent strings -> Intent, built once at import
+_INTENT_BY_VALUE = {intent.value: intent for intent in Intent}
+
+
 @dataclass
 class IntentResult:
     """Result of intent classification"""
@@ -84,7 +96,7 @@ Your job is to analyze the user's transcript and determine their intent.
 
 ## Output Format
 
-Respond with ONLY valid JSON in this exact format:
+Respond with a JSON object in this format:
 {
   "intent": "modify_schedule|query_day|query_week|clear_day|clear_week|help|clarification_needed|unknown",
   "confidence": 0.0-1.0,
@@ -119,24 +131,192 @@ Respond with ONLY valid JSON in this exact format:
 
 ## Important Rules
 
-1. Output ONLY valid JSON. No explanations.
-2. If the user mentions multiple events or days, include ALL in the operations array.
-3. For relative days like "today" or "tomorrow", use those exact words - they'll be resolved later.
-4. If the user provides a DURATION but no explicit time (e.g., "homework for two hours on Monday"), treat it as modify_schedule with a FLEXIBLE task for that day (no clarification needed).
-5. If no specific day is mentioned, assume "today" ONLY IF the time is specific. If both day and time are vague, use 'clarification_needed'.
-6. If no end time is given, estimate based on context (meetings: 1hr, lunch: 1hr, etc.)
-7. For delete operations, you only need action, day, and event.name.
-8. Be generous with confidence - if the intent is clear, use 0.9+.
-9. Only use 'clarification_needed' if BOTH time and duration are missing/ambiguous for an ADD operation.
+1. If the user mentions multiple events or days, include ALL in the operations array.
+2. For relative days like "today" or "tomorrow", use those exact words - they'll be resolved later.
+3. If the user provides a DURATION but no explicit time (e.g., "homework for two hours on Monday"), treat it as modify_schedule with a FLEXIBLE task for that day (no clarification needed).
+4. If no specific day is mentioned, assume "today" ONLY IF the time is specific. If both day and time are vague, use 'clarification_needed'.
+5. If no end time is given, estimate based on context (meetings: 1hr, lunch: 1hr, etc.)
+6. For delete operations, you only need action, day, and event.name.
+7. Be generous with confidence - if the intent is clear, use 0.9+.
+8. Only use 'clarification_needed' if BOTH time and duration are missing/ambiguous for an ADD operation.
 """
 
 
+# Read-only intents whose classification can be reused for a repeated
+# utterance. MODIFY_SCHEDULE is never cached: its operations are built from
+# the exact wording and it changes state.
+CACHEABLE_INTENTS = {Intent.QUERY_DAY, Intent.QUERY_WEEK, Intent.CLEAR_DAY, Intent.CLEAR_WEEK, Intent.HELP}
+INTENT_CACHE_MIN_CONFIDENCE = 0.9
+INTENT_CACHE_SIZE = 10_000
+# Enough for a multi-event modify_schedule reply
+INTENT_MAX_TOKENS = 1024
+
+_intent_cache = LRUCache(maxsize=INTENT_CACHE_SIZE)
+_intent_cache_lock = threading.Lock()
+_NON_WORD_RE = re.compile(r"[^a-z0-9]+")
+
+
+# Paraphrase cache: opt-in, since a miss costs an extra embedding call.
+# "clear Monday" and "clear Tuesday" embed almost identically, so a similar
+# entry is only reused when its parameter signature (day words, action verbs)
+# matches too.
+SEMANTIC_CACHE_ENABLED = os.getenv("INTENT_SEMANTIC_CACHE", "false").lower() == "true"
+SEMANTIC_CACHE_SIZE = 256
+SEMANTIC_SIMILARITY_THRESHOLD = 0.92
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+_DAY_TOKENS = frozenset(DAYS_OF_WEEK) | {"today", "tonight", "tomorrow", "week", "weekend"}
+_RELATIVE_DAY_TOKENS = frozenset({"today", "tonight", "tomorrow"})
+_VERB_TOKENS = frozenset({
+    "add", "schedule", "clear", "delete", "cancel", "remove", "reset",
+    "move", "what", "show", "tell", "help"
+})
+
+
+def _param_signature(transcript: str, current_datetime: datetime) -> tuple:
+    """
+    Structural fingerprint of a command: the day words and action verbs it
+    contains. Relative days also pin the weekday, since "today" moves.
+    """
+    words = set(_NON_WORD_RE.sub(" ", transcript.lower()).split())
+    days = frozenset(words & _DAY_TOKENS)
+    verbs = frozenset(words & _VERB_TOKENS)
+    weekday = current_datetime.weekday() if days & _RELATIVE_DAY_TOKENS else None
+    return (verbs, days, weekday)
+
+
+class SemanticIntentCache:
+    """
+    Ring buffer of (unit-length transcript embedding, parameter signature,
+    IntentResult). Embeddings are stacked in one float32 matrix so a lookup
+    is a single matrix-vector product over every entry.
+    """
+    
+    def __init__(self, size: int = SEMANTIC_CACHE_SIZE, threshold: float = SEMANTIC_SIMILARITY_THRESHOLD):
+        self.size = size
+        self.threshold = threshold
+        self._matrix = None  # allocated on first add, once the dimension is known
+        self._results: List[Optional[IntentResult]] = [None] * size
+        self._signatures: List[Optional[tuple]] = [None] * size
+        self._count = 0
+        self._next = 0
+        self._lock = threading.Lock()
+    
+    def lookup(self, embedding: np.ndarray, signature: tuple) -> Optional[IntentResult]:
+        """
+        Return a copy of the most similar cached result above the threshold
+        whose parameter signature matches, if any.
+        """
+        with self._lock:
+            if self._count == 0:
+                return None
+            similarities = self._matrix[:self._count] @ embedding
+            for i in np.argsort(-similarities):
+                if similarities[i] < self.threshold:
+                    break
+                if self._signatures[i] == signature:
+                    return copy.deepcopy(self._results[i])
+            return None
+    
+    def add(self, embedding: np.ndarray, signature: tuple, result: IntentResult):
+        with self._lock:
+            if self._matrix is None:
+                self._matrix = np.zeros((self.size, embedding.shape[0]), dtype=np.float32)
+            self._matrix[self._next] = embedding
+            self._signatures[self._next] = signature
+            self._results[self._next] = copy.deepcopy(result)
+            self._next = (self._next + 1) % self.size
+            self._count = min(self._count + 1, self.size)
+    
+    def clear(self):
+        with self._lock:
+            self._results = [None] * self.size
+            self._signatures = [None] * self.size
+            self._count = 0
+            self._next = 0
+
+
+_semantic_cache = SemanticIntentCache()
+
+
+def _embed_transcript(transcript: str) -> Optional[np.ndarray]:
+    """Unit-length embedding of the transcript, or None if the API call fails."""
+    try:
+        response = get_openai_client().embeddings.create(model=EMBEDDING_MODEL, input=transcript)
+    except Exception as e:
+        print(f"[intent_router] Embedding failed, skipping semantic cache: {e}")
+        return None
+    vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+    return vector / (np.linalg.norm(vector) or 1.0)
+
+
+# Commands unambiguous enough to classify without the LLM. Matched with
+# fullmatch against the transcript lowercased, apostrophes dropped and other
+# punctuation folded to spaces ("What's on Monday?" -> "whats on monday").
+_DAY_GROUP = r"(?P<day>monday|tuesday|wednesday|thursday|friday|saturday|sunday|today|tomorrow)"
+_FAST_PATHS = [
+    (re.compile(r"(please )?(help|help me|what can you do|what are my options)"), Intent.HELP),
+    (re.compile(r"(start fresh|reset (my )?schedule|clear (my )?(entire |whole )?week|clear everything|delete everything)"), Intent.CLEAR_WEEK),
+    (re.compile(rf"(clear|delete everything on|remove all events on) (my )?{_DAY_GROUP}s?( schedule| events)?"), Intent.CLEAR_DAY),
+    (re.compile(r"what does my week look like|whats (on )?my week|give me a summary"), Intent.QUERY_WEEK),
+    (re.compile(rf"(whats on|what do i have|whats my schedule for|what is my schedule for|tell me about) {_DAY_GROUP}"), Intent.QUERY_DAY),
+]
+FAST_PATH_CONFIDENCE = 0.98
+
+
+def _match_fast_path(transcript: str) -> Optional[IntentResult]:
+    """Classify trivially parseable commands locally; None means ask the LLM."""
+    text = _NON_WORD_RE.sub(" ", transcript.lower().replace("'", "").replace("\u2019", "")).strip()
+    for pattern, intent in _FAST_PATHS:
+        match = pattern.fullmatch(text)
+        if match:
+            day = match.groupdict().get("day")
+            return IntentResult(
+                intent=intent,
+                confidence=FAST_PATH_CONFIDENCE,
+                parameters={"day": day} if day else {}
+            )
+    return None
+
+
+def clear_intent_cache():
+    """Drop all cached classifications (e.g. after editing the classification prompt)."""
+    with _intent_cache_lock:
+        _intent_cache.clear()
+    _semantic_cache.clear()
+
+
+def _intent_cache_key(transcript: str, current_datetime: datetime) -> tuple:
+    """
+    Normalize case, punctuation and spacing so "What's on Monday?" and
+    "what's on monday" share an entry. The weekday is part of the key since
+    the LLM may resolve "today"/"tomorrow" against it.
+    """
+    normalized = _NON_WORD_RE.sub(" ", transcript.lower()).strip()
+    return (normalized, current_datetime.weekday())
+
+
+_openai_client: Optional[OpenAI] = None
+_openai_client_lock = threading.Lock()
+
+
 def get_openai_client() -> OpenAI:
-    """Get OpenAI client with API key from environment"""
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise RuntimeError("OPENAI_API_KEY not set in environment variables.")
-    return OpenAI(api_key=api_key)
+    """
+    Get OpenAI client with API key from environment.
+    Shared so every request reuses one client and its pooled HTTPS
+    connections instead of paying a fresh TLS handshake per LLM call.
+    """
+    global _openai_client
+    if _openai_client is None:
+        # The warmup thread and the first requests can race to create it;
+        # build exactly one so they all share a single connection pool
+        with _openai_client_lock:
+            if _openai_client is None:
+                api_key = os.getenv("OPENAI_API_KEY")
+                if not api_key:
+                    raise RuntimeError("OPENAI_API_KEY not set in environment variables.")
+                _openai_client = OpenAI(api_key=api_key)
+    return _openai_client
 
 
 def classify_intent(transcript: str, current_datetime: datetime = None) -> IntentResult:
@@ -160,6 +340,27 @@ def classify_intent(transcript: str, current_datetime: datetime = None) -> Inten
     if current_datetime is None:
         current_datetime = datetime.now()
     
+    fast = _match_fast_path(transcript)
+    if fast is not None:
+        print(f"[intent_router] Fast-path intent: {fast.intent.value} (confidence: {fast.confidence})")
+        return fast
+    
+    cache_key = _intent_cache_key(transcript, current_datetime)
+    with _intent_cache_lock:
+        cached = _intent_cache.get(cache_key)
+    if cached is not None:
+        print(f"[intent_router] Cached intent: {cached.intent.value} (confidence: {cached.confidence})")
+        # Handlers may mutate parameters, so hand out a copy
+        return copy.deepcopy(cached)
+    
+    embedding = _embed_transcript(transcript) if SEMANTIC_CACHE_ENABLED else None
+    if embedding is not None:
+        signature = _param_signature(transcript, current_datetime)
+        similar = _semantic_cache.lookup(embedding, signature)
+        if similar is not None:
+            print(f"[intent_router] Semantic cache hit: {similar.intent.value} (confidence: {similar.confidence})")
+            return similar
+    
     # Add context about current date/time
     context = f"""
 Current date/time: {current_datetime.strftime("%A, %B %d, %Y at %I:%M %p")}
@@ -177,6 +378,10 @@ User transcript: "{transcript}"
                 {"role": "user", "content": context}
             ],
             temperature=0.0,
+            # JSON mode: no markdown fences or chatter to generate or strip,
+            # and the token cap bounds decoding for a runaway reply
+            response_format={"type": "json_object"},
+            max_tokens=INTENT_MAX_TOKENS,
         )
         
         raw_response = response.choices[0].message.content
@@ -184,6 +389,12 @@ User transcript: "{transcript}"
         result.raw_response = raw_response
         
         print(f"[intent_router] Classified intent: {result.intent.value} (confidence: {result.confidence})")
+        
+        if result.intent in CACHEABLE_INTENTS and result.confidence >= INTENT_CACHE_MIN_CONFIDENCE:
+            with _intent_cache_lock:
+                _intent_cache[cache_key] = copy.deepcopy(result)
+            if embedding is not None:
+                _semantic_cache.add(embedding, signature, result)
         return result
         
     except Exception as e:
@@ -195,6 +406,16 @@ User transcript: "{transcript}"
         )
 
 
+# A whole response wrapped in a ```json ... ``` markdown block
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.DOTALL)
+
+
+def strip_code_fence(raw_text: str) -> str:
+    """Return the JSON inside a markdown code block, or the stripped text."""
+    match = _FENCE_RE.match(raw_text)
+    return match.group(1) if match else raw_text.strip()
+
+
 def parse_intent_response(raw_text: str) -> IntentResult:
     """
     Parse the LLM's JSON response into an IntentResult.
@@ -205,32 +426,15 @@ def parse_intent_response(raw_text: str) -> IntentResult:
     Returns:
         IntentResult object
     """
-    # Clean up markdown code blocks if present
-    clean_text = raw_text.strip()
-    if clean_text.startswith("```json"):
-        clean_text = clean_text[7:]
-    if clean_text.startswith("```"):
-        clean_text = clean_text[3:]
-    if clean_text.endswith("```"):
-        clean_text = clean_text[:-3]
-    clean_text = clean_text.strip()
+    # JSON mode replies are bare JSON; fences only appear if it is bypassed
+    clean_text = strip_code_fence(raw_text)
     
     try:
-        data = json.loads(clean_text)
+        data = orjson.loads(clean_text)
         
         # Map string intent to enum
         intent_str = data.get("intent", "unknown").lower()
-        intent_map = {
-            "modify_schedule": Intent.MODIFY_SCHEDULE,
-            "query_day": Intent.QUERY_DAY,
-            "query_week": Intent.QUERY_WEEK,
-            "clear_day": Intent.CLEAR_DAY,
-            "clear_week": Intent.CLEAR_WEEK,
-            "help": Intent.HELP,
-            "clarification_needed": Intent.CLARIFICATION_NEEDED,
-            "unknown": Intent.UNKNOWN,
-        }
-        intent = intent_map.get(intent_str, Intent.UNKNOWN)
+        intent = _INTENT_BY_VALUE.get(intent_str, Intent.UNKNOWN)
         
         return IntentResult(
             intent=intent,
@@ -238,7 +442,7 @@ def parse_intent_response(raw_text: str) -> IntentResult:
             parameters=data.get("parameters", {})
         )
         
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"[intent_router] Failed to parse JSON: {e}")
         print(f"[intent_router] Raw response: {raw_text[:500]}")
         return IntentResult(
@@ -307,6 +511,9 @@ def format_operations_summary(operations: List[Dict[str, Any]]) -> str:
         return ", ".join(summaries[:-1]) + f", and {summaries[-1].lower()}."
 
 
+VALID_ACTIONS = frozenset(("add", "edit", "delete"))
+
+
 def validate_operations(operations: List[Dict[str, Any]]) -> tuple:
     """
     Validate and clean up operations from intent classification.
@@ -320,23 +527,19 @@ def validate_operations(operations: List[Dict[str, Any]]) -> tuple:
     valid = []
     errors = []
     
-    for i, op in enumerate(operations):
+    for i, op in enumerate(operations, 1):
         action = op.get("action", "").lower()
         
-        if action not in ["add", "edit", "delete"]:
-            errors.append(f"Operation {i+1}: Invalid action '{action}'")
+        if action not in VALID_ACTIONS:
+            errors.append(f"Operation {i}: Invalid action '{action}'")
             continue
         
         if not op.get("day"):
             op["day"] = "today"  # Default to today
         
-        event = op.get("event", {})
-        if action in ["add", "edit"] and not event.get("name"):
-            errors.append(f"Operation {i+1}: Missing event name")
-            continue
-        
-        if action == "delete" and not event.get("name"):
-            errors.append(f"Operation {i+1}: Missing event name to delete")
+        if not op.get("event", {}).get("name"):
+            suffix = " to delete" if action == "delete" else ""
+            errors.append(f"Operation {i}: Missing event name{suffix}")
             continue
         
         valid.append(op)
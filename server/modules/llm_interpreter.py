@@ -6,14 +6,18 @@ Converts intent router operations into scheduler-compatible format.
 Also provides legacy single-day interpretation for backwards compatibility.
 """
 
-import os
-import json
+import re
+import copy
+import threading
+import orjson
 from datetime import datetime, timedelta
 from openai import OpenAI
 from typing import Optional, Dict, Any, List
 from pathlib import Path
+from cachetools import LRUCache
 
-from .schedule_manager import DAYS_OF_WEEK, normalize_day_name
+from .schedule_manager import DAY_INDEX, normalize_day_name
+from .intent_router import get_openai_client, strip_code_fence
 
 BASE_DIR = Path(__file__).resolve().parent
 
@@ -27,13 +31,12 @@ def load_system_prompt() -> str:
 
 LEGACY_SYSTEM_PROMPT = load_system_prompt()
 
-def get_openai_client() -> OpenAI:
-    """Get OpenAI client with API key from environment"""
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise RuntimeError("OPENAI_API_KEY not set in environment variables.")
-    return OpenAI(api_key=api_key)
-
+# interpret_transcript results keyed by (normalized transcript, date). The
+# date is part of the key because call_chatgpt sends it with the transcript.
+INTERPRET_CACHE_SIZE = 512
+_interpret_cache: LRUCache = LRUCache(maxsize=INTERPRET_CACHE_SIZE)
+_interpret_cache_lock = threading.Lock()
+_NON_WORD_RE = re.compile(r"[^a-z0-9]+")
 
 def call_chatgpt(client: OpenAI, transcript_text: str) -> str:
     """
@@ -51,6 +54,9 @@ def call_chatgpt(client: OpenAI, transcript_text: str) -> str:
             {"role": "user", "content": user_message}
         ],
         temperature=0.0,
+        # JSON mode: the reply is bare JSON, so parse_json_response's fence
+        # stripping never has anything to do
+        response_format={"type": "json_object"},
     )
 
     return response.choices[0].message.content
@@ -61,19 +67,16 @@ def parse_json_response(raw_text: str) -> Dict[str, Any]:
     Converts the raw JSON string from ChatGPT into a Python dictionary.
     Handles markdown code blocks if present.
     """
-    # Remove markdown code blocks if present
-    clean_text = raw_text.strip()
-    if clean_text.startswith("```json"):
-        clean_text = clean_text[7:]
-    if clean_text.startswith("```"):
-        clean_text = clean_text[3:]
-    if clean_text.endswith("```"):
-        clean_text = clean_text[:-3]
-    clean_text = clean_text.strip()
+    # JSON mode replies are bare JSON; only fall back to fence stripping if
+    # the direct parse fails
+    try:
+        return orjson.loads(raw_text)
+    except orjson.JSONDecodeError:
+        pass
     
     try:
-        return json.loads(clean_text)
-    except json.JSONDecodeError as e:
+        return orjson.loads(strip_code_fence(raw_text))
+    except orjson.JSONDecodeError as e:
         print(f"[llm_interpreter] Invalid JSON returned by ChatGPT: {e}")
         print(f"[llm_interpreter] Raw response: {raw_text[:500]}")
         raise
@@ -96,11 +99,24 @@ def interpret_transcript(transcript_text: str) -> Optional[Dict[str, Any]]:
         
     print(f"[llm_interpreter] Interpreting transcript: '{transcript_text[:100]}...'")
     
+    cache_key = (
+        _NON_WORD_RE.sub(" ", transcript_text.lower()).strip(),
+        datetime.now().strftime("%Y-%m-%d")
+    )
+    with _interpret_cache_lock:
+        cached = _interpret_cache.get(cache_key)
+    if cached is not None:
+        print(f"[llm_interpreter] Cache hit for transcript")
+        # Callers may modify the result; keep the cached copy pristine
+        return copy.deepcopy(cached)
+    
     try:
         client = get_openai_client()
         raw_json = call_chatgpt(client, transcript_text)
         structured_data = parse_json_response(raw_json)
         print(f"[llm_interpreter] Successfully parsed schedule data")
+        with _interpret_cache_lock:
+            _interpret_cache[cache_key] = copy.deepcopy(structured_data)
         return structured_data
     except Exception as e:
         print(f"[llm_interpreter] Error interpreting transcript: {e}")
@@ -132,19 +148,13 @@ def get_date_for_day(day_name: str, reference_date: datetime) -> datetime:
         return reference_date + timedelta(days=1)
     
     # Find the day index
-    try:
-        target_day_idx = DAYS_OF_WEEK.index(day_name)
-    except ValueError:
+    target_day_idx = DAY_INDEX.get(day_name)
+    if target_day_idx is None:
         # If invalid day name, return reference date
         return reference_date
     
-    current_day_idx = reference_date.weekday()
-    
-    # Calculate days until target day
-    days_ahead = target_day_idx - current_day_idx
-    if days_ahead < 0:
-        # Target day already passed this week, go to next week
-        days_ahead += 7
+    # Days until target day; one that already passed this week wraps to next week
+    days_ahead = (target_day_idx - reference_date.weekday()) % 7
     
     return reference_date + timedelta(days=days_ahead)
 
@@ -180,6 +190,21 @@ def parse_time_to_datetime(time_str: str, target_date: datetime) -> datetime:
         return target_date.replace(hour=9, minute=0, second=0, microsecond=0)
 
 
+# Event-name keywords -> typical duration in minutes, checked in order.
+# Keywords match as substrings of the lowercased name ("meetings" counts).
+_DURATION_RULES = tuple(
+    (re.compile("|".join(keywords)), minutes)
+    for keywords, minutes in (
+        (("meeting", "call", "standup", "sync"), 60),
+        (("lunch", "dinner", "breakfast", "coffee"), 60),
+        (("gym", "workout", "exercise", "yoga"), 90),
+        (("dentist", "doctor", "appointment"), 60),
+        (("class", "lecture", "seminar"), 90),
+    )
+)
+DEFAULT_DURATION_MINUTES = 60
+
+
 def estimate_end_time(start_time: datetime, event_name: str, duration_minutes: int = None) -> datetime:
     """
     Estimate end time based on event type if not provided.
@@ -198,25 +223,18 @@ def estimate_end_time(start_time: datetime, event_name: str, duration_minutes: i
     # Heuristics based on event name
     name_lower = event_name.lower()
     
-    if any(word in name_lower for word in ["meeting", "call", "standup", "sync"]):
-        duration = 60  # 1 hour
-    elif any(word in name_lower for word in ["lunch", "dinner", "breakfast", "coffee"]):
-        duration = 60  # 1 hour
-    elif any(word in name_lower for word in ["gym", "workout", "exercise", "yoga"]):
-        duration = 90  # 1.5 hours
-    elif any(word in name_lower for word in ["dentist", "doctor", "appointment"]):
-        duration = 60  # 1 hour
-    elif any(word in name_lower for word in ["class", "lecture", "seminar"]):
-        duration = 90  # 1.5 hours
-    else:
-        duration = 60  # Default 1 hour
+    duration = next(
+        (minutes for pattern, minutes in _DURATION_RULES if pattern.search(name_lower)),
+        DEFAULT_DURATION_MINUTES
+    )
     
     return start_time + timedelta(minutes=duration)
 
 
 def operation_to_scheduler_event(
     operation: Dict[str, Any], 
-    reference_date: datetime
+    reference_date: datetime,
+    day_name: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Convert an intent router operation to a scheduler-compatible event.
@@ -224,15 +242,16 @@ def operation_to_scheduler_event(
     Args:
         operation: Operation dict from intent router
         reference_date: Reference datetime for day calculation
+        day_name: The operation's day, if the caller already normalized it
         
     Returns:
         Event dict compatible with scheduler.py format
     """
     event = operation.get("event", {})
-    day = operation.get("day", "today")
     
     # Normalize day name
-    day_name = normalize_day_name(day, reference_date)
+    if day_name is None:
+        day_name = normalize_day_name(operation.get("day", "today"), reference_date)
     
     # Get the target date
     target_date = get_date_for_day(day_name, reference_date)
@@ -253,16 +272,16 @@ def operation_to_scheduler_event(
     # If this is a flexible task with a duration but no explicit start/end,
     # give it a full-day window and let the optimizer place it.
     if event_type == "flexible" and duration and not start_str and not end_str:
-        day_start = target_date.replace(hour=8, minute=0, second=0, microsecond=0)
-        day_end = target_date.replace(hour=21, minute=0, second=0, microsecond=0)
+        day_start = target_date.replace(hour=8, minute=0, second=0, microsecond=0).isoformat()
+        day_end = target_date.replace(hour=21, minute=0, second=0, microsecond=0).isoformat()
         return {
             "name": event.get("name", "Unnamed Task"),
             "type": "flexible",
-            "start": day_start.isoformat(),
-            "end": day_end.isoformat(),
+            "start": day_start,
+            "end": day_end,
             "durationMinutes": duration,
-            "earliestStart": day_start.isoformat(),
-            "latestEnd": day_end.isoformat(),
+            "earliestStart": day_start,
+            "latestEnd": day_end,
             "day": day_name,
         }
     
@@ -275,16 +294,24 @@ def operation_to_scheduler_event(
     else:
         end_dt = estimate_end_time(start_dt, event.get("name", ""), duration)
     
+    # A flexible task's duration defaults to its whole window; record it now
+    # so later stages don't re-parse start/end to get it
+    if event_type == "flexible" and not duration:
+        duration = int((end_dt - start_dt).total_seconds() // 60)
+    
+    start_iso = start_dt.isoformat()
+    end_iso = end_dt.isoformat()
+    is_flexible = event_type == "flexible"
     return {
         "name": event.get("name", "Unnamed Event"),
         "_calendar_id": event.get("_calendar_id"),
         "type": event_type,
-        "start": start_dt.isoformat(),
-        "end": end_dt.isoformat(),
+        "start": start_iso,
+        "end": end_iso,
         "durationMinutes": duration,
         # If explicit times were provided for a flexible task, treat them as a window.
-        "earliestStart": start_dt.isoformat() if event_type == "flexible" else None,
-        "latestEnd": end_dt.isoformat() if event_type == "flexible" else None,
+        "earliestStart": start_iso if is_flexible else None,
+        "latestEnd": end_iso if is_flexible else None,
         "day": day_name,  # Keep track of which day this belongs to
     }
 
@@ -301,27 +328,27 @@ def operations_to_scheduler_format(
         reference_date: Reference datetime
         
     Returns:
-        Dictionary mapping day names to lists of events
+        Dictionary mapping day names to lists of events. Only days that an
+        operation names are present, in the order they were first mentioned.
     """
     # Group operations by day and action
-    days_events = {day: {"add": [], "edit": [], "delete": []} for day in DAYS_OF_WEEK}
+    days_events = {}
     
     for op in operations:
         action = op.get("action", "add").lower()
         day = normalize_day_name(op.get("day", "today"), reference_date)
+        day_ops = days_events.get(day)
+        if day_ops is None:
+            day_ops = days_events[day] = {"add": [], "edit": [], "delete": []}
         
-        if action == "add":
-            event = operation_to_scheduler_event(op, reference_date)
-            days_events[day]["add"].append(event)
-        elif action == "edit":
-            event = operation_to_scheduler_event(op, reference_date)
-            days_events[day]["edit"].append(event)
+        if action == "add" or action == "edit":
+            day_ops[action].append(operation_to_scheduler_event(op, reference_date, day))
         elif action == "delete":
             # For delete, we just need the name
             event_info = op.get("event", {})
             event_name = event_info.get("name", "")
             if event_name:
-                days_events[day]["delete"].append(event_info)
+                day_ops["delete"].append(event_info)
     
     return days_events
 
@@ -345,10 +372,12 @@ def build_day_schedule_for_optimizer(
     
     for event in events:
         if event.get("type") == "flexible":
-            # Calculate duration from start/end
-            start_dt = datetime.fromisoformat(event["start"])
-            end_dt = datetime.fromisoformat(event["end"])
-            duration = int((end_dt - start_dt).total_seconds() / 60)
+            # Set by operation_to_scheduler_event; older stored events lack it
+            duration = event.get("durationMinutes")
+            if not duration:
+                start_dt = datetime.fromisoformat(event["start"])
+                end_dt = datetime.fromisoformat(event["end"])
+                duration = int((end_dt - start_dt).total_seconds() / 60)
             
             flexible_tasks.append({
                 "name": event["name"],
@@ -10,18 +10,53 @@ Handles:
 """
 
 import os
-import json
+import re
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Callable, Tuple
+from dataclasses import dataclass, replace
+
+import orjson
 
 # Days of the week in order (Monday = 0)
-DAYS_OF_WEEK = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+DAYS_OF_WEEK = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+# Day name -> weekday number (monday = 0), matching datetime.weekday().
+# Also the hashed membership test for "is this a day name".
+DAY_INDEX = {day: i for i, day in enumerate(DAYS_OF_WEEK)}
+# "in 3 days" style references, resolved by parse_relative_day
+_IN_N_DAYS_RE = re.compile(r"in\s+(\d+)\s+day")
 
 # Default schedule directory (relative to server/)
 DEFAULT_SCHEDULE_DIR = "schedule"
 
+# Base dirs whose day folders and week_meta.json are known to exist
+_INITIALIZED_DIRS: set = set()
+
+# Week-wide reads/writes touch seven files; file I/O releases the GIL, so
+# they overlap on a small shared pool
+_week_io_executor = ThreadPoolExecutor(max_workers=len(DAYS_OF_WEEK), thread_name_prefix="schedule-io")
+
+
+def _write_json(path: Path, data: Any):
+    """
+    Write JSON to path atomically: write a temp file next to it, then rename
+    it over the original so readers never see a half-written schedule.
+    Dataclasses are serialized by orjson directly, without an asdict() copy.
+    The temp name is per thread so concurrent saves of one file can't
+    interleave their bytes before the rename.
+    """
+    tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    payload = memoryview(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while payload:
+            payload = payload[os.write(fd, payload):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
 
 @dataclass
 class DaySchedule:
@@ -31,7 +66,8 @@ class DaySchedule:
     last_updated: Optional[str] = None  # ISO timestamp
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Shallow: asdict() would deep-copy every event
+        return {"day": self.day, "events": self.events, "last_updated": self.last_updated}
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "DaySchedule":
@@ -54,7 +90,11 @@ class WeekMetadata:
     last_modified: Optional[str] = None  # ISO timestamp of last modification
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "week_start_date": self.week_start_date,
+            "last_reset": self.last_reset,
+            "last_modified": self.last_modified
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "WeekMetadata":
@@ -95,58 +135,83 @@ class ScheduleManager:
             base_dir = module_dir / DEFAULT_SCHEDULE_DIR
         
         self.base_dir = Path(base_dir)
+        # Parsed day files keyed by day -> ((st_mtime_ns, st_size), data)
+        self._day_cache: Dict[str, tuple] = {}
+        # Parsed week_meta.json -> ((st_mtime_ns, st_size), WeekMetadata)
+        self._meta_cache: Optional[tuple] = None
+        # (day files' state, (summary, week data)); see _week_files_key
+        self._summary_cache: Optional[tuple] = None
+        self._summary_lock = threading.Lock()
+        # ISO (year, week) already confirmed to match week_meta.json
+        self._checked_week: Optional[tuple] = None
         self._ensure_structure()
     
     def _ensure_structure(self):
         """Create directory structure if it doesn't exist"""
+        if self.base_dir in _INITIALIZED_DIRS:
+            return
+        
         self.base_dir.mkdir(parents=True, exist_ok=True)
         
+        # One directory listing instead of a mkdir/stat per day
+        with os.scandir(self.base_dir) as entries:
+            present = {entry.name for entry in entries}
         for day in DAYS_OF_WEEK:
-            day_dir = self.base_dir / day
-            day_dir.mkdir(exist_ok=True)
+            if day not in present:
+                (self.base_dir / day).mkdir(exist_ok=True)
         
         # Create week_meta.json if it doesn't exist
-        meta_path = self.base_dir / "week_meta.json"
-        if not meta_path.exists():
+        if "week_meta.json" not in present:
             self._reset_week_metadata()
+        
+        _INITIALIZED_DIRS.add(self.base_dir)
     
-    def _get_current_week_start(self) -> str:
+    def _get_current_week_start(self, now: Optional[datetime] = None) -> str:
         """Get the Monday of the current week as ISO date string"""
-        today = datetime.now().date()
+        today = (now or datetime.now()).date()
         # Monday is weekday 0
         days_since_monday = today.weekday()
         monday = today - timedelta(days=days_since_monday)
         return monday.isoformat()
     
-    def _reset_week_metadata(self):
-        """Reset week metadata to current week"""
-        now = datetime.now().isoformat()
+    def _reset_week_metadata(self) -> WeekMetadata:
+        """Reset week metadata to current week and return it"""
+        now_dt = datetime.now()
+        now = now_dt.isoformat()
         meta = WeekMetadata(
-            week_start_date=self._get_current_week_start(),
+            week_start_date=self._get_current_week_start(now_dt),
             last_reset=now,
             last_modified=now
         )
+        self._write_week_metadata(meta)
+        return meta
+    
+    def _write_week_metadata(self, meta: WeekMetadata):
+        """Save week metadata and remember it, so the next read skips the parse"""
         meta_path = self.base_dir / "week_meta.json"
-        with open(meta_path, 'w') as f:
-            json.dump(meta.to_dict(), f, indent=2)
+        _write_json(meta_path, meta)
+        st = meta_path.stat()
+        self._meta_cache = ((st.st_mtime_ns, st.st_size), replace(meta))
     
     def get_week_metadata(self) -> WeekMetadata:
         """Load week metadata"""
         meta_path = self.base_dir / "week_meta.json"
         try:
-            with open(meta_path, 'r') as f:
-                return WeekMetadata.from_dict(json.load(f))
-        except (FileNotFoundError, json.JSONDecodeError):
-            self._reset_week_metadata()
-            return self.get_week_metadata()
-    
-    def _update_week_metadata(self):
+            st = meta_path.stat()
+            key = (st.st_mtime_ns, st.st_size)
+            if self._meta_cache is None or self._meta_cache[0] != key:
+                meta = WeekMetadata.from_dict(orjson.loads(meta_path.read_bytes()))
+                self._meta_cache = (key, meta)
+            # Callers modify the returned metadata, so hand out a copy
+            return replace(self._meta_cache[1])
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return self._reset_week_metadata()
+    
+    def _update_week_metadata(self, now_iso: Optional[str] = None):
         """Update the last_modified timestamp"""
         meta = self.get_week_metadata()
-        meta.last_modified = datetime.now().isoformat()
-        meta_path = self.base_dir / "week_meta.json"
-        with open(meta_path, 'w') as f:
-            json.dump(meta.to_dict(), f, indent=2)
+        meta.last_modified = now_iso or datetime.now().isoformat()
+        self._write_week_metadata(meta)
     
     def check_and_reset_if_new_week(self) -> bool:
         """
@@ -155,14 +220,20 @@ class ScheduleManager:
         Returns:
             True if week was reset, False otherwise
         """
+        # Only the first call in a given week needs to read the metadata
+        year_week = datetime.now().isocalendar()[:2]
+        if year_week == self._checked_week:
+            return False
+        
         meta = self.get_week_metadata()
         current_week_start = self._get_current_week_start()
         
-        if meta.week_start_date != current_week_start:
+        reset = meta.week_start_date != current_week_start
+        if reset:
             print(f"[schedule_manager] New week detected. Resetting schedule.")
             self.clear_week()
-            return True
-        return False
+        self._checked_week = year_week
+        return reset
     
     # ==================== DAY OPERATIONS ====================
     
@@ -177,17 +248,27 @@ class ScheduleManager:
             DaySchedule object
         """
         day = day.lower()
-        if day not in DAYS_OF_WEEK:
+        if day not in DAY_INDEX:
             raise ValueError(f"Invalid day: {day}. Must be one of {DAYS_OF_WEEK}")
         
         schedule_path = self.base_dir / day / "schedule.json"
         
         try:
-            with open(schedule_path, 'r') as f:
-                data = json.load(f)
-                return DaySchedule.from_dict(data)
-        except (FileNotFoundError, json.JSONDecodeError):
+            st = schedule_path.stat()
+            key = (st.st_mtime_ns, st.st_size)
+            cached = self._day_cache.get(day)
+            if cached is not None and cached[0] == key:
+                data = cached[1]
+            else:
+                data = orjson.loads(schedule_path.read_bytes())
+                self._day_cache[day] = (key, data)
+        except (FileNotFoundError, orjson.JSONDecodeError):
             return DaySchedule.empty(day)
+        
+        # Callers edit the events in place, so hand out copies of the cached ones
+        schedule = DaySchedule.from_dict(data)
+        schedule.events = [dict(event) for event in schedule.events]
+        return schedule
     
     def save_day_schedule(self, schedule: DaySchedule):
         """
@@ -197,16 +278,18 @@ class ScheduleManager:
             schedule: DaySchedule object to save
         """
         day = schedule.day.lower()
-        if day not in DAYS_OF_WEEK:
+        if day not in DAY_INDEX:
             raise ValueError(f"Invalid day: {day}")
         
-        schedule.last_updated = datetime.now().isoformat()
+        # One timestamp for the day file and the week metadata
+        now_iso = datetime.now().isoformat()
+        schedule.last_updated = now_iso
         schedule_path = self.base_dir / day / "schedule.json"
         
-        with open(schedule_path, 'w') as f:
-            json.dump(schedule.to_dict(), f, indent=2)
+        _write_json(schedule_path, schedule)
+        self._day_cache.pop(day, None)
         
-        self._update_week_metadata()
+        self._update_week_metadata(now_iso)
         print(f"[schedule_manager] Saved {day} schedule with {len(schedule.events)} events")
     
     def clear_day(self, day: str) -> bool:
@@ -219,15 +302,26 @@ class ScheduleManager:
         Returns:
             True if cleared, False if already empty
         """
+        return len(self.pop_day_schedule(day).events) > 0
+    
+    def pop_day_schedule(self, day: str) -> DaySchedule:
+        """
+        Clear a day and return the schedule it had, reading it only once.
+        
+        Args:
+            day: Day name
+            
+        Returns:
+            DaySchedule as it was before clearing
+        """
         day = day.lower()
         existing = self.get_day_schedule(day)
-        had_events = len(existing.events) > 0
         
         empty_schedule = DaySchedule.empty(day)
         self.save_day_schedule(empty_schedule)
         
         print(f"[schedule_manager] Cleared {day} schedule")
-        return had_events
+        return existing
     
     # ==================== WEEK OPERATIONS ====================
     
@@ -238,22 +332,29 @@ class ScheduleManager:
         Returns:
             Dictionary mapping day names to DaySchedule objects
         """
-        week = {}
-        for day in DAYS_OF_WEEK:
-            week[day] = self.get_day_schedule(day)
-        return week
+        if len(self._day_cache) < len(DAYS_OF_WEEK):
+            # Cold cache: read the days concurrently. Once every day is
+            # cached, reads are just stat() calls and stay on this thread.
+            return dict(zip(DAYS_OF_WEEK, _week_io_executor.map(self.get_day_schedule, DAYS_OF_WEEK)))
+        return {day: self.get_day_schedule(day) for day in DAYS_OF_WEEK}
     
     def clear_week(self):
         """Clear all schedules for the entire week"""
-        for day in DAYS_OF_WEEK:
-            schedule_path = self.base_dir / day / "schedule.json"
-            empty_schedule = DaySchedule.empty(day)
-            with open(schedule_path, 'w') as f:
-                json.dump(empty_schedule.to_dict(), f, indent=2)
+        def write_empty(day):
+            _write_json(self.base_dir / day / "schedule.json", DaySchedule.empty(day))
+        
+        list(_week_io_executor.map(write_empty, DAYS_OF_WEEK))
+        self._day_cache.clear()
         
         self._reset_week_metadata()
         print(f"[schedule_manager] Cleared entire week schedule")
     
+    def pop_week_schedule(self) -> Dict[str, DaySchedule]:
+        """Clear the week and return the schedules it had."""
+        week = self.get_week_schedule()
+        self.clear_week()
+        return week
+    
     def get_week_summary_data(self) -> Dict[str, Any]:
         """
         Get a summary of the entire week for display/API.
@@ -283,6 +384,52 @@ class ScheduleManager:
         summary["total_events"] = total_events
         return summary
     
+    def _week_files_key(self) -> tuple:
+        """
+        State of the seven day files on disk. Saves from any process (the
+        background calendar sync runs in its own) rename a new file into
+        place, which changes the inode even when the mtime doesn't move.
+        """
+        key = []
+        for day in DAYS_OF_WEEK:
+            try:
+                st = (self.base_dir / day / "schedule.json").stat()
+                key.append((st.st_ino, st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                key.append(None)
+        return tuple(key)
+    
+    def get_week_summary_text(
+        self, generate: Callable[[Dict[str, Any]], Tuple[str, bool]]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Get the natural language week summary, regenerating it only when a
+        day file has changed on disk since the last call.
+        
+        Args:
+            generate: Summary function taken from get_week_summary_data()["days"],
+                      returning (text, ok) (summary_generator.generate_week_summary_with_status).
+                      Only summaries with ok=True are cached, so a fallback
+                      from a failed LLM call is retried on the next request.
+            
+        Returns:
+            (summary text, week summary data)
+        """
+        # Taken before reading the week, so a save that lands mid-generation
+        # leaves a stale key and the next call regenerates
+        files_key = self._week_files_key()
+        with self._summary_lock:
+            if self._summary_cache is not None and self._summary_cache[0] == files_key:
+                return self._summary_cache[1]
+        
+        week_data = self.get_week_summary_data()
+        summary, ok = generate(week_data["days"])
+        
+        if ok:
+            with self._summary_lock:
+                self._summary_cache = (files_key, (summary, week_data))
+        return summary, week_data
+    
     # ==================== EVENT CRUD OPERATIONS ====================
     
     def add_event_to_day(self, day: str, event: Dict[str, Any]) -> DaySchedule:
@@ -312,24 +459,39 @@ class ScheduleManager:
         Returns:
             Removed event if found, None otherwise
         """
-        schedule = self.get_day_schedule(day)
-        event_name_lower = event_name.lower()
+        removed = self.remove_events_from_day(day, [event_name])
+        return removed[-1] if removed else None
+    
+    def remove_events_from_day(self, day: str, event_names: List[str]) -> List[Dict[str, Any]]:
+        """
+        Remove every event matching any of the names, saving the day once.
         
-        removed_event = None
-        new_events = []
+        Args:
+            day: Day name
+            event_names: Names of events to remove (case-insensitive partial match)
+            
+        Returns:
+            Removed events, in schedule order
+        """
+        schedule = self.get_day_schedule(day)
+        names_lower = [name.lower() for name in event_names]
         
+        removed = []
+        kept = []
         for event in schedule.events:
-            if event_name_lower in event.get("name", "").lower():
-                removed_event = event
+            event_name = event.get("name", "").lower()
+            if any(name in event_name for name in names_lower):
+                removed.append(event)
             else:
-                new_events.append(event)
+                kept.append(event)
         
-        if removed_event:
-            schedule.events = new_events
+        if removed:
+            schedule.events = kept
             self.save_day_schedule(schedule)
-            print(f"[schedule_manager] Removed '{removed_event.get('name')}' from {day}")
+            for event in removed:
+                print(f"[schedule_manager] Removed '{event.get('name')}' from {day}")
         
-        return removed_event
+        return removed
     
     def modify_event_in_day(self, day: str, event_name: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -359,12 +521,13 @@ class ScheduleManager:
         
         return modified_event
     
-    def find_event_by_name(self, event_name: str) -> List[tuple]:
+    def find_event_by_name(self, event_name: str, limit: Optional[int] = None) -> List[tuple]:
         """
         Search for an event by name across all days.
         
         Args:
             event_name: Name to search for (case-insensitive partial match)
+            limit: Stop after this many matches (days are searched in order)
             
         Returns:
             List of (day, event) tuples where event was found
@@ -377,6 +540,8 @@ class ScheduleManager:
             for event in schedule.events:
                 if event_name_lower in event.get("name", "").lower():
                     results.append((day, event))
+                    if limit is not None and len(results) >= limit:
+                        return results
         
         return results
 
@@ -421,14 +586,13 @@ def parse_relative_day(relative: str, reference_date: datetime) -> str:
         return get_day_from_datetime(yesterday)
     
     # Check for day names
-    for i, day in enumerate(DAYS_OF_WEEK):
+    for day in DAYS_OF_WEEK:
         if day in relative:
             return day
     
     # Check for "in X days"
     if "in" in relative and "day" in relative:
-        import re
-        match = re.search(r'in\s+(\d+)\s+day', relative)
+        match = _IN_N_DAYS_RE.search(relative)
         if match:
             days_ahead = int(match.group(1))
             future = reference_date + timedelta(days=days_ahead)
@@ -455,7 +619,7 @@ def normalize_day_name(day_input: str, reference_date: datetime = None) -> str:
     day_lower = day_input.lower().strip()
     
     # Check if it's already a valid day name
-    if day_lower in DAYS_OF_WEEK:
+    if day_lower in DAY_INDEX:
         return day_lower
     
     # Try to parse as relative
@@ -464,10 +628,13 @@ def normalize_day_name(day_input: str, reference_date: datetime = None) -> str:
 
 # Global instance for convenience
 _manager_instance: Optional[ScheduleManager] = None
+_manager_lock = threading.Lock()
 
 def get_schedule_manager() -> ScheduleManager:
     """Get or create the global ScheduleManager instance"""
     global _manager_instance
     if _manager_instance is None:
-        _manager_instance = ScheduleManager()
+        with _manager_lock:
+            if _manager_instance is None:
+                _manager_instance = ScheduleManager()
     return _manager_instance
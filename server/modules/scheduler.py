@@ -8,17 +8,56 @@ Handles:
 - Per-day schedule optimization
 """
 
+import os
+import threading
+from bisect import bisect_left, bisect_right
 from datetime import datetime, time, timedelta
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+from ortools.sat import sat_parameters_pb2
+try:
+    from numba import njit   # optional: compiled overlap scan for very busy days
+except ImportError:
+    njit = None
 from ortools.sat.python import cp_model
 
+# CP-SAT parallel portfolio/LNS workers and per-solve time limit; FEASIBLE
+# answers found before the limit are accepted
+SOLVER_NUM_WORKERS = int(os.getenv("SCHEDULER_WORKERS", str(min(8, os.cpu_count() or 1))))
+SOLVER_TIME_LIMIT = float(os.getenv("SCHEDULER_TIME_LIMIT", "5.0"))
+
+# Below this many existing events find_conflicts compares pairs in Python;
+# array setup costs more than it saves on a typical day
+VECTORIZE_MIN_EVENTS = 32
+# From this many events the numba kernel (when installed) replaces the NumPy mask
+JIT_MIN_EVENTS = 64
+
+# Days with at most this many flexible tasks skip probing/linearization and
+# place tasks earliest-start-first; presolve work otherwise dominates the solve
+SMALL_MODEL_MAX_TASKS = 16
+
+# One CpSolver per thread, reused across solves (a week is seven in a row)
+_solver_local = threading.local()
+
+
+def _get_solver() -> cp_model.CpSolver:
+    """This thread's CpSolver, created on first use."""
+    solver = getattr(_solver_local, "solver", None)
+    if solver is None:
+        solver = _solver_local.solver = cp_model.CpSolver()
+    return solver
+
 # Helper functions for time parsing and conversions
+@lru_cache(maxsize=4096)
 def parse_iso(ts: str) -> datetime:
     """
     Parse an ISO-8601 timestamp into a naive datetime object in local time.
 
     We intentionally drop timezone info for the MVP, assuming all times are in
     the same local timezone for scheduling purposes.
+    Cached: conflict checks compare every pair of a day's events, so the same
+    few timestamps are parsed over and over.
     """
     dt = datetime.fromisoformat(ts)
     # Drop tzinfo so it becomes "naive" and compatible with datetime.combine
@@ -33,13 +72,20 @@ def parse_hhmm(hhmm: str) -> time:
     return time(hour=hour, minute=minute)
 
 
+def to_minute(dt: datetime) -> int:
+    """
+    Whole minutes since 0001-01-01 for a naive datetime (seconds dropped).
+    Plain integer arithmetic, so no timedelta is built per conversion.
+    """
+    return dt.toordinal() * 1440 + dt.hour * 60 + dt.minute
+
+
 def minutes_since_day_start(dt: datetime, day_start_dt: datetime) -> int:
     """
     Given a datetime dt and the datetime representing start of the scheduling day,
     return the number of minutes between them.
     """
-    delta: timedelta = dt - day_start_dt
-    return int(delta.total_seconds() // 60)
+    return to_minute(dt) - to_minute(day_start_dt)
 
 
 def add_minutes_to_day_start(day_start_dt: datetime, minutes: int) -> datetime:
@@ -100,6 +146,7 @@ def build_schedule_model(data: Dict[str, Any]) -> Dict[str, Any]:
     day_end_dt   = datetime.combine(schedule_date, day_end_time)
 
     day_start_minutes = 0
+    day_start_abs = to_minute(day_start_dt)
     day_end_minutes = int((day_end_dt - day_start_dt).total_seconds() // 60)
     # The scheduling horizon is [0, day_end_minutes].
 
@@ -107,6 +154,8 @@ def build_schedule_model(data: Dict[str, Any]) -> Dict[str, Any]:
     start_vars = {}          # task_name -> start_var (flexible tasks only)
     duration_map = {}        # task_name -> duration in minutes
     fixed_starts = {}      # event_name -> fixed start minute
+    event_map = {}         # name -> original event/task dict
+    start_domains = {}     # (start_lb, start_ub) -> Domain shared by same-window tasks
 
     # ------------------------------------------------------
     # 2. Handle FIXED events
@@ -116,13 +165,14 @@ def build_schedule_model(data: Dict[str, Any]) -> Dict[str, Any]:
         start_dt = parse_iso(event["start"])
         end_dt   = parse_iso(event["end"])
 
-        start_min = minutes_since_day_start(start_dt, day_start_dt)
-        end_min   = minutes_since_day_start(end_dt, day_start_dt)
+        start_min = to_minute(start_dt) - day_start_abs
+        end_min   = to_minute(end_dt) - day_start_abs
         duration  = end_min - start_min
 
         # Save duration for later result-building
         duration_map[name] = duration
         fixed_starts[name] = start_min
+        event_map[name] = event
 
         # Fixed intervals use: NewFixedSizeIntervalVar
         interval = model.NewFixedSizeIntervalVar(start_min, duration, name)
@@ -135,6 +185,7 @@ def build_schedule_model(data: Dict[str, Any]) -> Dict[str, Any]:
         name = task["name"]
         duration = task["durationMinutes"]
         duration_map[name] = duration
+        event_map[name] = task
 
         # These may be missing; fall back to full day window.
         earliest_iso = task.get("earliestStart")
@@ -152,8 +203,8 @@ def build_schedule_model(data: Dict[str, Any]) -> Dict[str, Any]:
             # If no latestEnd given, use the end of the scheduling day.
             latest_dt = day_end_dt
 
-        earliest_min = minutes_since_day_start(earliest_dt, day_start_dt)
-        latest_min   = minutes_since_day_start(latest_dt,  day_start_dt)
+        earliest_min = to_minute(earliest_dt) - day_start_abs
+        latest_min   = to_minute(latest_dt) - day_start_abs
 
         # Domain for start: earliest_start ≤ start ≤ latest_end - duration
         start_lb = earliest_min
@@ -163,16 +214,29 @@ def build_schedule_model(data: Dict[str, Any]) -> Dict[str, Any]:
             # Window too tight for this duration; for MVP we just raise.
             raise RuntimeError(f"Task '{name}' has an impossible time window.")
 
-        start_var = model.NewIntVar(start_lb, start_ub, f"{name}_start")
-        end_var   = model.NewIntVar(start_lb + duration, latest_min, f"{name}_end")
-
-        model.Add(end_var == start_var + duration)
+        domain = start_domains.get((start_lb, start_ub))
+        if domain is None:
+            domain = start_domains[(start_lb, start_ub)] = cp_model.Domain(start_lb, start_ub)
+        start_var = model.NewIntVarFromDomain(domain, f"{name}_start")
 
-        interval = model.NewIntervalVar(start_var, duration, end_var, name)
+        # The start domain already keeps the end inside the window, so a
+        # fixed-size interval over start_var needs no separate end variable
+        interval = model.NewFixedSizeIntervalVar(start_var, duration, name)
 
         intervals.append((name, interval))
         start_vars[name] = start_var
 
+    # ------------------------------------------------------
+    # 4. No two intervals may overlap
+    # ------------------------------------------------------
+    # Added here rather than at solve time so a built model can be solved
+    # again without stacking duplicate constraints
+    if intervals:
+        model.AddNoOverlap([interval for (_, interval) in intervals])
+    if start_vars and len(start_vars) <= SMALL_MODEL_MAX_TASKS:
+        model.AddDecisionStrategy(
+            list(start_vars.values()), cp_model.CHOOSE_LOWEST_MIN, cp_model.SELECT_MIN_VALUE
+        )
 
     # Return everything needed for solving
     return {
@@ -183,16 +247,20 @@ def build_schedule_model(data: Dict[str, Any]) -> Dict[str, Any]:
         "fixed_starts": fixed_starts,
         "day_start_dt": day_start_dt,
         "day_end_minutes": day_end_minutes,
-        "event_map": {**{e["name"]: e for e in data.get("events", [])}, 
-                      **{t["name"]: t for t in data.get("tasks", [])}}
+        "event_map": event_map
     }
 
 # Solve the scheduling model, convert results back to datetime
 
-def solve_schedule(model_info: Dict[str, Any]) -> Dict[str, Any]:
+def solve_schedule(
+    model_info: Dict[str, Any],
+    num_workers: Optional[int] = None,
+    max_time_seconds: Optional[float] = None
+) -> Dict[str, Any]:
     """
     Given a constructed model_info dict from build_schedule_model,
     solve the schedule and return a new schedule dictionary with concrete start/end times.
+    num_workers / max_time_seconds default to SOLVER_NUM_WORKERS / SOLVER_TIME_LIMIT.
 
     Output format:
     {
@@ -211,26 +279,50 @@ def solve_schedule(model_info: Dict[str, Any]) -> Dict[str, Any]:
     day_start_dt = model_info["day_start_dt"]
 
     # ----------------------------------------------------
-    # 1. Add the NoOverlap constraint
-    # ----------------------------------------------------
-    interval_vars = [interval for (_, interval) in intervals]
-    model.AddNoOverlap(interval_vars)
-
-    # ----------------------------------------------------
-    # 2. Solve the model
+    # 1. Solve the model (NoOverlap was added by build_schedule_model)
     # ----------------------------------------------------
-    solver = cp_model.CpSolver()
+    solver = _get_solver()
+    # Start from default parameters; the previous solve may have set small-model ones
+    solver.parameters.Clear()
+    solver.parameters.num_search_workers = num_workers or SOLVER_NUM_WORKERS
+    solver.parameters.max_time_in_seconds = max_time_seconds or SOLVER_TIME_LIMIT
+    if start_vars and len(start_vars) <= SMALL_MODEL_MAX_TASKS:
+        # Uses the earliest-start decision strategy added in build_schedule_model
+        solver.parameters.search_branching = sat_parameters_pb2.SatParameters.FIXED_SEARCH
+        solver.parameters.cp_model_probing_level = 0
+        solver.parameters.linearization_level = 0
     solver_status = solver.Solve(model)
 
     if solver_status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
         raise RuntimeError("No feasible schedule could be found.")
 
     # ----------------------------------------------------
-    # 3. Build the result dictionary
+    # 2. Build the result dictionary
     # ----------------------------------------------------
     result_events = []
 
-        # Handle fixed events: start/end times are known from build_schedule_model.
+    # Every result shares the day's date, so format times onto a fixed prefix
+    # rather than building a datetime and calling isoformat() per bound
+    date_prefix = day_start_dt.strftime("%Y-%m-%dT")
+    day_offset = day_start_dt.hour * 60 + day_start_dt.minute
+
+    def to_iso(minutes: int) -> str:
+        clock = day_offset + minutes
+        if 0 <= clock < 24 * 60:
+            return f"{date_prefix}{clock // 60:02d}:{clock % 60:02d}:00"
+        # Past midnight: let datetime roll the date over
+        return add_minutes_to_day_start(day_start_dt, minutes).isoformat()
+
+    # Keep output in start order as it is built (nice readability);
+    # start_keys runs parallel to result_events for bisecting
+    start_keys = []
+
+    def place(event_out: Dict[str, Any]) -> None:
+        i = bisect_right(start_keys, event_out["start"])
+        start_keys.insert(i, event_out["start"])
+        result_events.insert(i, event_out)
+
+    # Handle fixed events: start/end times are known from build_schedule_model.
     for (name, interval) in intervals:
         if name not in start_vars:
             # This is a fixed event
@@ -238,9 +330,6 @@ def solve_schedule(model_info: Dict[str, Any]) -> Dict[str, Any]:
             duration = duration_map[name]
             end_min = start_min + duration
 
-            start_dt = add_minutes_to_day_start(day_start_dt, start_min)
-            end_dt   = add_minutes_to_day_start(day_start_dt, end_min)
-
             # Retrieve original event data to preserve extra fields (like _calendar_id)
             original_data = model_info.get("event_map", {}).get(name, {})
             
@@ -248,10 +337,10 @@ def solve_schedule(model_info: Dict[str, Any]) -> Dict[str, Any]:
             event_out.update({
                 "name": name,
                 "type": "fixed",
-                "start": start_dt.isoformat(),
-                "end": end_dt.isoformat(),
+                "start": to_iso(start_min),
+                "end": to_iso(end_min),
             })
-            result_events.append(event_out)
+            place(event_out)
 
 
     # Handle flexible tasks
@@ -260,9 +349,6 @@ def solve_schedule(model_info: Dict[str, Any]) -> Dict[str, Any]:
         duration = duration_map[name]
         end_min = start_min + duration
 
-        start_dt = add_minutes_to_day_start(day_start_dt, start_min)
-        end_dt   = add_minutes_to_day_start(day_start_dt, end_min)
-
         # Retrieve original event data
         original_data = model_info.get("event_map", {}).get(name, {})
         
@@ -270,33 +356,91 @@ def solve_schedule(model_info: Dict[str, Any]) -> Dict[str, Any]:
         task_out.update({
             "name": name,
             "type": "flexible",
-            "start": start_dt.isoformat(),
-            "end": end_dt.isoformat(),
+            "start": to_iso(start_min),
+            "end": to_iso(end_min),
         })
-        result_events.append(task_out)
+        place(task_out)
 
-    # Sort output by start time (nice readability)
-    result_events.sort(key=lambda e: e["start"])
+    return {"events": result_events}
 
+def _schedule_fixed_only(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Result of schedule_day when there are no flexible tasks: the fixed events
+    sorted by start. Overlapping fixed events raise RuntimeError, the same
+    outcome as the solver finding the model infeasible.
+    """
+    result_events = sorted(
+        ({**event, "type": "fixed"} for event in events),
+        key=lambda e: parse_iso(e["start"])
+    )
+    for prev, curr in zip(result_events, result_events[1:]):
+        if parse_iso(curr["start"]) < parse_iso(prev["end"]):
+            raise RuntimeError("No feasible schedule could be found.")
     return {"events": result_events}
 
 # Final wrapper function that we'll call from main.py, which executes the full scheduling process. 
 
-def schedule_day(data: Dict[str, Any]) -> Dict[str, Any]:
+def schedule_day(
+    data: Dict[str, Any],
+    num_workers: Optional[int] = None,
+    max_time_seconds: Optional[float] = None
+) -> Dict[str, Any]:
     """
     Full MVP scheduling pipeline.
     Input: dictionary from llm_interpreter (as returned by ChatGPT)
     Output: dictionary of fully scheduled events/tasks
+    num_workers / max_time_seconds tune the CP-SAT solve (see solve_schedule).
     """
     # Handle empty schedules gracefully
     if not data.get("events") and not data.get("tasks"):
         return {"events": []}
-    
-    # 1. Build the model and interval structures
-    model_info = build_schedule_model(data)
 
-    # 2. Solve and return the scheduled events
-    return solve_schedule(model_info)
+    # Only fixed events: nothing to place, so skip building and solving the model
+    if not data.get("tasks"):
+        return _schedule_fixed_only(data["events"])
+    
+    # 1-2. Build and solve the model, or reuse the placement from an identical day
+    key = (
+        data["rules"]["dayStart"],
+        data["rules"]["dayEnd"],
+        data.get("date"),
+        tuple((e["name"], e["start"], e["end"]) for e in data.get("events", [])),
+        tuple((t["name"], t["durationMinutes"], t.get("earliestStart"), t.get("latestEnd"))
+              for t in data["tasks"]),
+    )
+    placements = _solve_cached(key, num_workers, max_time_seconds)
+
+    # Re-attach the caller's extra fields (like _calendar_id) to each placement
+    originals = {**{e["name"]: e for e in data.get("events", [])},
+                 **{t["name"]: t for t in data["tasks"]}}
+    return {"events": [
+        {**originals[name], "name": name, "type": kind, "start": start, "end": end}
+        for name, kind, start, end in placements
+    ]}
+
+
+@lru_cache(maxsize=128)
+def _solve_cached(
+    key: tuple,
+    num_workers: Optional[int],
+    max_time_seconds: Optional[float]
+) -> Tuple[Tuple[str, str, str, str], ...]:
+    """
+    Build and solve the model for a schedule_day key, returning
+    (name, type, start, end) per placed event. Merging operations re-optimizes
+    the same day repeatedly, so identical inputs skip the rebuild and solve.
+    """
+    day_start, day_end, date, events, tasks = key
+    data = {
+        "rules": {"dayStart": day_start, "dayEnd": day_end},
+        "events": [{"name": n, "start": s, "end": e} for n, s, e in events],
+        "tasks": [{"name": n, "durationMinutes": d, "earliestStart": es, "latestEnd": le}
+                  for n, d, es, le in tasks],
+    }
+    if date is not None:
+        data["date"] = date
+    result = solve_schedule(build_schedule_model(data), num_workers, max_time_seconds)
+    return tuple((e["name"], e["type"], e["start"], e["end"]) for e in result["events"])
 
 
 # ==================== NEW FUNCTIONS FOR WEEKLY SCHEDULING ====================
@@ -313,10 +457,10 @@ def check_time_overlap(event1: Dict[str, Any], event2: Dict[str, Any]) -> bool:
     """
     try:
         # Parse and strip timezone info to enforce naive local time comparison
-        start1 = datetime.fromisoformat(event1["start"]).replace(tzinfo=None)
-        end1 = datetime.fromisoformat(event1["end"]).replace(tzinfo=None)
-        start2 = datetime.fromisoformat(event2["start"]).replace(tzinfo=None)
-        end2 = datetime.fromisoformat(event2["end"]).replace(tzinfo=None)
+        start1 = parse_iso(event1["start"])
+        end1 = parse_iso(event1["end"])
+        start2 = parse_iso(event2["start"])
+        end2 = parse_iso(event2["end"])
         
         # Events overlap if one starts before the other ends
         # NOT overlapping: end1 <= start2 OR end2 <= start1
@@ -337,6 +481,17 @@ def find_conflicts(new_event: Dict[str, Any], existing_events: List[Dict[str, An
     Returns:
         List of conflicting events
     """
+    if len(existing_events) >= VECTORIZE_MIN_EVENTS:
+        span = _minute_span(new_event)
+        if span is None:
+            return []
+        starts, ends = _events_to_minute_arrays(existing_events)
+        if _overlap_indices is not None and len(existing_events) >= JIT_MIN_EVENTS:
+            hits = _overlap_indices(starts, ends, span[0], span[1])
+        else:
+            hits = np.nonzero((starts < span[1]) & (ends > span[0]))[0]
+        return [existing_events[i] for i in hits]
+
     conflicts = []
     for existing in existing_events:
         if check_time_overlap(new_event, existing):
@@ -344,6 +499,76 @@ def find_conflicts(new_event: Dict[str, Any], existing_events: List[Dict[str, An
     return conflicts
 
 
+def _minute_span(event: Dict[str, Any]) -> Optional[Tuple[int, int]]:
+    """
+    (start, end) of an event as whole minutes since 0001-01-01, or None if
+    its times are missing or unparseable (such events never conflict).
+    """
+    try:
+        start = parse_iso(event["start"])
+        end = parse_iso(event["end"])
+    except (KeyError, ValueError):
+        return None
+    return to_minute(start), to_minute(end)
+
+
+def _span_duration(event: Dict[str, Any], default: int = 60) -> int:
+    """Length of an event's start/end span in minutes, or default (1 hour) if unusable."""
+    span = _minute_span(event)
+    return span[1] - span[0] if span else default
+
+
+def _events_to_minute_arrays(events: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Start and end minutes of each event as int64 arrays. Events without usable
+    times get an empty (max, min) span so they never register as overlapping.
+    """
+    spans = [_minute_span(e) or (np.iinfo(np.int64).max, np.iinfo(np.int64).min) for e in events]
+    arr = np.array(spans, dtype=np.int64).reshape(-1, 2)
+    return arr[:, 0], arr[:, 1]
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _overlap_indices(starts, ends, new_start, new_end):
+        """Indices i with starts[i] < new_end and ends[i] > new_start, in order."""
+        out = np.empty(len(starts), np.int64)
+        n = 0
+        for i in range(len(starts)):
+            if starts[i] < new_end and ends[i] > new_start:
+                out[n] = i
+                n += 1
+        return out[:n]
+else:
+    _overlap_indices = None
+
+
+def _timeline_conflicts(
+    starts: List[int],
+    ends: List[int],
+    refs: List[Dict[str, Any]],
+    max_length: int,
+    span: Tuple[int, int]
+) -> List[Dict[str, Any]]:
+    """
+    Events in a start-sorted timeline (parallel starts/ends/refs lists) that
+    overlap span. Walks back from the first entry starting at or after the
+    span's end, stopping once entries start too early to reach the span's start.
+    """
+    new_start, new_end = span
+    floor = new_start - max_length
+    hits = []
+    i = bisect_left(starts, new_end)
+    while i > 0:
+        i -= 1
+        if starts[i] <= floor:
+            break
+        if ends[i] > new_start:
+            hits.append(refs[i])
+    hits.reverse()
+    return hits
+
+
 def detect_and_resolve_conflicts(
     existing_events: List[Dict[str, Any]],
     new_events: List[Dict[str, Any]],
@@ -364,19 +589,52 @@ def detect_and_resolve_conflicts(
     events_to_add = []
     conflicts = []
     
-    # Track what we've tentatively added to check for self-conflicts
-    tentative_schedule = list(existing_events)
+    # Track what we've tentatively added to check for self-conflicts, as a
+    # start-sorted timeline of integer minute spans so each check only looks
+    # at events near the new one instead of rescanning the whole day.
+    # Kept as parallel lists so bisect and the overlap walk compare plain ints.
+    timed = sorted(
+        ((span, event) for event in existing_events
+         if (span := _minute_span(event)) is not None),
+        key=lambda item: item[0]
+    )
+    starts = [span[0] for span, _ in timed]
+    ends = [span[1] for span, _ in timed]
+    refs = [event for _, event in timed]
+    max_length = max((end - start for start, end in zip(starts, ends)), default=0)
+
+    def add_tentative(event):
+        nonlocal max_length
+        span = _minute_span(event)
+        if span is not None:
+            i = bisect_right(starts, span[0])
+            starts.insert(i, span[0])
+            ends.insert(i, span[1])
+            refs.insert(i, event)
+            max_length = max(max_length, span[1] - span[0])
+
+    def remove_tentative(event):
+        span = _minute_span(event)
+        if span is None:
+            return
+        i = bisect_left(starts, span[0])
+        while i < len(starts) and starts[i] == span[0]:
+            if refs[i] is event:
+                del starts[i], ends[i], refs[i]
+                return
+            i += 1
     
     for new_event in new_events:
         # Flexible tasks are placed by the optimizer; don't preemptively treat them as blocking conflicts.
         if new_event.get("type") == "flexible":
             events_to_add.append(new_event)
-            tentative_schedule.append(new_event)
+            add_tentative(new_event)
             print(f"[scheduler] Queued flexible task '{new_event.get('name')}' for optimization")
             continue
         
         # Check conflicts with everything (existing + previously processed new events)
-        current_conflicts = find_conflicts(new_event, tentative_schedule)
+        span = _minute_span(new_event)
+        current_conflicts = _timeline_conflicts(starts, ends, refs, max_length, span) if span else []
         
         if current_conflicts:
             # Found conflicts!
@@ -386,11 +644,8 @@ def detect_and_resolve_conflicts(
                 # and re-queue the flexible one for optimization instead of blocking.
                 if new_event.get("type") == "fixed" and conflict_event.get("type") == "flexible":
                     # Remove the flexible from tentative and re-queue it
-                    try:
-                        tentative_schedule.remove(conflict_event)
-                        print(f"[scheduler] Rescheduling flexible task '{conflict_event.get('name')}' due to fixed '{new_event.get('name')}'")
-                    except ValueError:
-                        pass
+                    remove_tentative(conflict_event)
+                    print(f"[scheduler] Rescheduling flexible task '{conflict_event.get('name')}' due to fixed '{new_event.get('name')}'")
                     events_to_add.append(conflict_event)
                     continue
                 
@@ -400,8 +655,8 @@ def detect_and_resolve_conflicts(
                     rec_start = conflict_end
                     
                     # Calculate duration of new event
-                    start_dt = datetime.fromisoformat(new_event["start"])
-                    end_dt = datetime.fromisoformat(new_event["end"])
+                    start_dt = parse_iso(new_event["start"])
+                    end_dt = parse_iso(new_event["end"])
                     duration = (end_dt - start_dt).total_seconds() / 60
                     
                     rec_end = rec_start + timedelta(minutes=duration)
@@ -425,11 +680,11 @@ def detect_and_resolve_conflicts(
             # If all conflicts were flexible and re-queued, allow the fixed event through
             if not conflicts:
                 events_to_add.append(new_event)
-                tentative_schedule.append(new_event)
+                add_tentative(new_event)
         else:
             # No conflict, add to tentative schedule
             events_to_add.append(new_event)
-            tentative_schedule.append(new_event)
+            add_tentative(new_event)
     
     return events_to_add, conflicts
 
@@ -468,14 +723,7 @@ def optimize_day_events(
         if event_type == "flexible":
             # Calculate duration from start/end
             # Use explicit durationMinutes if provided; fall back to window duration.
-            duration = event.get("durationMinutes")
-            if not duration:
-                try:
-                    start_dt = datetime.fromisoformat(event["start"])
-                    end_dt = datetime.fromisoformat(event["end"])
-                    duration = int((end_dt - start_dt).total_seconds() / 60)
-                except (KeyError, ValueError):
-                    duration = 60  # Default 1 hour
+            duration = event.get("durationMinutes") or _span_duration(event)
             
             # Preserve all fields from original event
             task = event.copy()
@@ -504,17 +752,10 @@ def optimize_day_events(
             conflicts = find_conflicts(event, resolved_fixed)
             if conflicts:
                 # Convert to flexible
-                try:
-                    start_dt = datetime.fromisoformat(event["start"])
-                    end_dt = datetime.fromisoformat(event["end"])
-                    duration = int((end_dt - start_dt).total_seconds() / 60)
-                except (KeyError, ValueError):
-                    duration = 60
-                
                 flexible_tasks.append({
                     "name": event["name"],
                     "type": "flexible",
-                    "durationMinutes": duration,
+                    "durationMinutes": _span_duration(event),
                 })
                 print(f"[scheduler] Fixed event '{event['name']}' conflicts - converting to flexible")
             else:
@@ -522,8 +763,9 @@ def optimize_day_events(
         fixed_events = resolved_fixed
     
     # If only fixed events and no conflicts, just return sorted
+    # (the conflict pass above already walked them in start order)
     if not flexible_tasks:
-        return {"events": sorted(fixed_events, key=lambda e: e["start"])}
+        return {"events": fixed_events}
     
     # Build the data structure for schedule_day
     schedule_data = {
@@ -574,6 +816,9 @@ def merge_and_optimize_events(
     rescheduled = []
     conflict_messages = []
     
+    # Lowercase each name once; deletes and edits all match against this list
+    lowered = [e.get("name", "").lower() for e in result_events]
+    
     # Process deletions first
     for delete_item in delete_names:
         if isinstance(delete_item, dict):
@@ -582,10 +827,9 @@ def merge_and_optimize_events(
             delete_name = str(delete_item)
             
         delete_lower = delete_name.lower()
-        result_events = [
-            e for e in result_events 
-            if delete_lower not in e.get("name", "").lower()
-        ]
+        kept = [(e, name) for e, name in zip(result_events, lowered) if delete_lower not in name]
+        result_events = [e for e, _ in kept]
+        lowered = [name for _, name in kept]
         print(f"[scheduler] Deleted events matching '{delete_name}'")
     
     # Process edits (find and update)
@@ -594,9 +838,10 @@ def merge_and_optimize_events(
         found = False
         
         for i, existing in enumerate(result_events):
-            if edit_name_lower in existing.get("name", "").lower():
+            if edit_name_lower in lowered[i]:
                 # Update the existing event with new values
                 result_events[i] = {**existing, **edit_event}
+                lowered[i] = result_events[i].get("name", "").lower()
                 found = True
                 print(f"[scheduler] Updated event '{existing.get('name')}'")
                 break
@@ -662,6 +907,7 @@ def validate_events_for_day(events: List[Dict[str, Any]], day_date: datetime) ->
         List of validation error messages (empty if valid)
     """
     errors = []
+    expected_date = day_date.date()
     
     for i, event in enumerate(events):
         name = event.get("name", f"Event {i+1}")
@@ -680,14 +926,14 @@ def validate_events_for_day(events: List[Dict[str, Any]], day_date: datetime) ->
         
         # Validate times
         try:
-            start_dt = datetime.fromisoformat(event["start"])
-            end_dt = datetime.fromisoformat(event["end"])
+            start_dt = parse_iso(event["start"])
+            end_dt = parse_iso(event["end"])
             
             if end_dt <= start_dt:
                 errors.append(f"{name}: End time must be after start time")
             
             # Check if event is on the expected day
-            if start_dt.date() != day_date.date():
+            if start_dt.date() != expected_date:
                 errors.append(f"{name}: Event date doesn't match expected day")
                 
         except ValueError as e:
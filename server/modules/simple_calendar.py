@@ -1,17 +1,22 @@
 import os
 import json
+import time
+import random
 import logging
 import datetime
-from typing import List, Optional, Dict, Any
+import threading
+from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
 from googleapiclient.errors import HttpError
 from dateutil import parser as date_parser
-import pytz
 
 # Configure logging
 LOGGER = logging.getLogger("simple_calendar")
@@ -20,14 +25,70 @@ LOGGER.setLevel(logging.INFO)
 # Constants
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 TIMEZONE = os.getenv("TIMEZONE", "America/New_York")
+# Resolved once; naive times are read as wall-clock time in this zone
+_TZ = ZoneInfo(TIMEZONE)
 MODULE_DIR = Path(__file__).parent
 TOKEN_PATH = MODULE_DIR / "token.json"
-TEMP_CREDS_PATH = MODULE_DIR / "temp_credentials.json"
+# Most calls Google recommends packing into one batch HTTP request
+BATCH_LIMIT = 50
+# Retries for rate-limited / transiently failing mutations (exponential backoff)
+MAX_RETRIES = 5
+RETRY_BASE_DELAY = 0.5
+# 403 reasons that mean "slow down" rather than "not allowed"
+RATE_LIMIT_REASONS = frozenset({"rateLimitExceeded", "userRateLimitExceeded"})
+# Where the last events.list nextSyncToken is kept between background syncs
+SYNC_TOKEN_PATH = Path(os.getenv("CALENDAR_SYNC_TOKEN", "output/.sync_token"))
 
-def _get_credentials():
+# Per-thread cache for get_service()
+_thread_local = threading.local()
+# Refresh a cached service's token this long before it expires, so a call
+# doesn't start with a token that lapses mid-request
+TOKEN_EXPIRY_BUFFER = datetime.timedelta(minutes=5)
+
+def client_config_from_env() -> Optional[Dict[str, Any]]:
+    """
+    Build an OAuth "installed app" client config from GOOGLE_* env vars.
+    Returns None if the client ID or secret is missing.
+    """
+    client_id = os.environ.get("GOOGLE_CLIENT_ID")
+    client_secret = os.environ.get("GOOGLE_CLIENT_SECRET")
+    project_id = os.environ.get("GOOGLE_PROJECT_ID")
+    
+    if not client_id or not client_secret:
+        return None
+    
+    return {
+        "installed": {
+            "client_id": client_id,
+            "project_id": project_id or "smartpager",
+            "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+            "token_uri": "https://oauth2.googleapis.com/token",
+            "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
+            "client_secret": client_secret,
+            "redirect_uris": ["http://localhost"]
+        }
+    }
+
+def _save_token(creds):
+    """
+    Write creds to token.json via a temp file and rename, owner-readable only,
+    so a crash mid-write never leaves a truncated token behind.
+    """
+    tmp_path = TOKEN_PATH.with_name(f"{TOKEN_PATH.name}.{threading.get_ident()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(creds.to_json())
+        os.replace(tmp_path, TOKEN_PATH)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+def _get_credentials(client_config: Optional[Dict[str, Any]] = None):
     """
     Obtains valid user credentials from storage.
-    If no valid token exists, initiates the OAuth flow using env vars.
+    If no valid token exists, initiates the OAuth flow using client_config,
+    or one built from env vars when not given.
     """
     creds = None
     
@@ -39,72 +100,136 @@ def _get_credentials():
             LOGGER.warning(f"Failed to load token: {e}")
             creds = None
 
-    # 2. Refresh if expired
-    if creds and creds.expired and creds.refresh_token:
+    # 2. Refresh if expired, or about to (TOKEN_EXPIRY_BUFFER), so the first
+    #    call after loading doesn't go out with a token that lapses mid-request
+    if creds and creds.refresh_token and (creds.expired or _expires_soon(creds)):
         try:
             creds.refresh(Request())
             # Save refreshed token
-            with open(TOKEN_PATH, 'w') as f:
-                f.write(creds.to_json())
+            _save_token(creds)
         except Exception as e:
             LOGGER.warning(f"Failed to refresh token: {e}")
-            creds = None
+            # A token that hasn't actually expired yet is still usable
+            if not creds.valid:
+                creds = None
 
     # 3. New Login if needed
     if not creds or not creds.valid:
         LOGGER.info("No valid token found. Initiating login flow...")
         
-        # Check for Env Vars
-        client_id = os.environ.get("GOOGLE_CLIENT_ID")
-        client_secret = os.environ.get("GOOGLE_CLIENT_SECRET")
-        project_id = os.environ.get("GOOGLE_PROJECT_ID")
-        
-        if not client_id or not client_secret:
+        if client_config is None:
+            client_config = client_config_from_env()
+        if client_config is None:
             raise RuntimeError("Missing GOOGLE_CLIENT_ID or GOOGLE_CLIENT_SECRET env vars.")
-            
-        # Create temp credentials file for InstalledAppFlow
-        creds_data = {
-            "installed": {
-                "client_id": client_id,
-                "project_id": project_id or "smartpager",
-                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                "token_uri": "https://oauth2.googleapis.com/token",
-                "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
-                "client_secret": client_secret,
-                "redirect_uris": ["http://localhost"]
-            }
-        }
         
-        try:
-            with open(TEMP_CREDS_PATH, "w") as f:
-                json.dump(creds_data, f)
-                
-            flow = InstalledAppFlow.from_client_secrets_file(str(TEMP_CREDS_PATH), SCOPES)
-            creds = flow.run_local_server(port=0)
-            
-            # Save new token
-            with open(TOKEN_PATH, 'w') as f:
-                f.write(creds.to_json())
-                
-        finally:
-            # Cleanup temp file
-            if TEMP_CREDS_PATH.exists():
-                os.remove(TEMP_CREDS_PATH)
+        # InstalledAppFlow takes the client config dict directly; no temp file needed
+        flow = InstalledAppFlow.from_client_config(client_config, SCOPES)
+        creds = flow.run_local_server(port=0)
+        
+        # Save new token
+        _save_token(creds)
                 
     return creds
 
-def get_service():
-    """Returns an authenticated Google Calendar service."""
-    creds = _get_credentials()
-    return build('calendar', 'v3', credentials=creds, cache_discovery=False)
+def get_service(client_config: Optional[Dict[str, Any]] = None):
+    """
+    Returns an authenticated Google Calendar service.
+    Each thread keeps its own service (httplib2 connections are not
+    thread-safe) and reuses it while its credentials are valid, instead of
+    re-reading token.json and rebuilding the discovery client on every call.
+    The service's single Http keeps its googleapis.com connection alive, so
+    back-to-back calls skip the TCP/TLS handshake.
+    """
+    creds = getattr(_thread_local, "creds", None)
+    if creds is None or not creds.valid:
+        creds = _get_credentials(client_config)
+        _thread_local.creds = creds
+        # static_discovery reads the discovery document bundled with the
+        # client library instead of fetching it from googleapis.com
+        _thread_local.service = build(
+            'calendar', 'v3', http=AuthorizedHttp(creds, http=build_http()),
+            cache_discovery=False, static_discovery=True
+        )
+    if _expires_soon(creds) and creds.refresh_token:
+        # The service holds this creds object, so refreshing in place keeps it usable
+        try:
+            creds.refresh(Request())
+            _save_token(creds)
+        except Exception as e:
+            LOGGER.warning(f"Failed to refresh token early: {e}")
+    return _thread_local.service
+
+def _expires_soon(creds) -> bool:
+    """True if creds expire within TOKEN_EXPIRY_BUFFER."""
+    # google-auth keeps expiry as naive UTC
+    return creds.expiry is not None and creds.expiry - datetime.datetime.utcnow() <= TOKEN_EXPIRY_BUFFER
+
+def invalidate_service():
+    """Drop this thread's cached service so the next call re-reads token.json."""
+    _thread_local.creds = None
+    _thread_local.service = None
+
+def _error_reasons(exc: HttpError) -> set:
+    """
+    The "reason" codes in an API error body: error.errors[].reason (Calendar
+    v3) plus any error.details[].reason (google.rpc ErrorInfo).
+    """
+    try:
+        error = json.loads(exc.content)["error"]
+    except (ValueError, TypeError, KeyError):
+        return set()
+    if not isinstance(error, dict):
+        return set()
+    return {
+        item["reason"]
+        for item in (error.get("errors") or []) + (error.get("details") or [])
+        if isinstance(item, dict) and "reason" in item
+    }
+
+def _is_retryable(exc: Exception) -> bool:
+    """True for HttpErrors worth retrying: rate limits (403/429) and 5xx."""
+    if not isinstance(exc, HttpError):
+        return False
+    status = int(exc.resp.status)
+    if status == 403:
+        # A plain 403 is a permissions problem; only rate-limit 403s are transient
+        return not _error_reasons(exc).isdisjoint(RATE_LIMIT_REASONS)
+    return status == 429 or status >= 500
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with a little jitter so retries don't line up."""
+    return RETRY_BASE_DELAY * 2 ** attempt + random.uniform(0, 0.25)
+
+def _execute_with_retry(request):
+    """Execute an API request, retrying rate limits and server errors with backoff."""
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            return request.execute()
+        except HttpError as e:
+            if attempt == MAX_RETRIES or not _is_retryable(e):
+                raise
+            delay = _backoff_delay(attempt)
+            LOGGER.warning(f"Calendar API error {e.resp.status}, retrying in {delay:.2f}s")
+            time.sleep(delay)
+
+def _parse_datetime(dt_str: str) -> datetime.datetime:
+    """
+    Parse a date/datetime string. ISO 8601 (what the pipeline and Google send)
+    goes through the C fromisoformat; anything else falls back to dateutil.
+    """
+    try:
+        return datetime.datetime.fromisoformat(
+            dt_str[:-1] + "+00:00" if dt_str.endswith("Z") else dt_str
+        )
+    except ValueError:
+        return date_parser.parse(dt_str)
 
 def _ensure_rfc3339(dt_str: str) -> str:
     """Ensures datetime string is RFC3339 formatted with timezone."""
     try:
-        dt = date_parser.parse(dt_str)
+        dt = _parse_datetime(dt_str)
         if dt.tzinfo is None:
-            tz = pytz.timezone(TIMEZONE)
-            dt = tz.localize(dt)
+            dt = dt.replace(tzinfo=_TZ)
         return dt.isoformat()
     except Exception as e:
         LOGGER.error(f"Date parsing error for {dt_str}: {e}")
@@ -117,8 +242,8 @@ def _normalize_event(evt: Dict[str, Any]) -> Dict[str, Any]:
     
     # Handle all-day events (date only) -> convert to ISO for consistency if needed
     if "date" in evt["start"]:
-        start_dt = date_parser.parse(start)
-        end_dt = date_parser.parse(end) - datetime.timedelta(seconds=1)
+        start_dt = _parse_datetime(start)
+        end_dt = _parse_datetime(end) - datetime.timedelta(seconds=1)
         start = start_dt.isoformat()
         end = end_dt.isoformat()
 
@@ -132,6 +257,34 @@ def _normalize_event(evt: Dict[str, Any]) -> Dict[str, Any]:
         "location": evt.get("location")
     }
 
+def _build_event_body(
+    title: str,
+    start: str,
+    end: str,
+    description: Optional[str] = None,
+    location: Optional[str] = None,
+    all_day: bool = False,
+    recurrence: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Build the Calendar API request body for a new event."""
+    event_body = {
+        "summary": title,
+        "description": description,
+        "location": location
+    }
+    
+    if all_day:
+        event_body["start"] = {"date": _parse_datetime(start).date().isoformat()}
+        event_body["end"] = {"date": _parse_datetime(end).date().isoformat()}
+    else:
+        event_body["start"] = {"dateTime": _ensure_rfc3339(start)}
+        event_body["end"] = {"dateTime": _ensure_rfc3339(end)}
+        
+    if recurrence:
+        event_body["recurrence"] = recurrence
+    
+    return event_body
+
 # ================= PUBLIC API =================
 
 def create_event(
@@ -150,23 +303,9 @@ def create_event(
     try:
         service = get_service()
         
-        event_body = {
-            "summary": title,
-            "description": description,
-            "location": location
-        }
-        
-        if all_day:
-            event_body["start"] = {"date": date_parser.parse(start).date().isoformat()}
-            event_body["end"] = {"date": date_parser.parse(end).date().isoformat()}
-        else:
-            event_body["start"] = {"dateTime": _ensure_rfc3339(start)}
-            event_body["end"] = {"dateTime": _ensure_rfc3339(end)}
-            
-        if recurrence:
-            event_body["recurrence"] = recurrence
+        event_body = _build_event_body(title, start, end, description, location, all_day, recurrence)
             
-        created_event = service.events().insert(calendarId='primary', body=event_body).execute()
+        created_event = _execute_with_retry(service.events().insert(calendarId='primary', body=event_body))
         LOGGER.info(f"Created event: {created_event.get('id')}")
         
         return {
@@ -179,6 +318,89 @@ def create_event(
         LOGGER.error(f"Error creating event: {e}")
         return {"status": "error", "error": str(e), "debug_message": f"Failed to create event: {str(e)}"}
 
+def create_events_batch(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Create several events in the primary calendar with one batched HTTP request.
+    Each item holds create_event's keyword arguments (title, start, end, ...).
+    Returns one create_event-style result per item, in the same order.
+    """
+    if not events:
+        return []
+    
+    try:
+        service = get_service()
+    except Exception as e:
+        LOGGER.error(f"Error creating events: {e}")
+        return [
+            {"status": "error", "error": str(e), "debug_message": f"Failed to create event: {str(e)}"}
+            for _ in events
+        ]
+    
+    results = []
+    ops = [("insert", {"body": _build_event_body(**evt)}) for evt in events]
+    for evt, (response, exception) in zip(events, batch_calendar_ops(ops, service)):
+        if exception is not None:
+            LOGGER.error(f"Error creating event: {exception}")
+            results.append({"status": "error", "error": str(exception), "debug_message": f"Failed to create event: {str(exception)}"})
+        else:
+            LOGGER.info(f"Created event: {response.get('id')}")
+            results.append({
+                "status": "success",
+                "event": _normalize_event(response),
+                "debug_message": f"Created Google Calendar event '{evt.get('title')}' (ID: {response.get('id')})"
+            })
+    
+    return results
+
+def batch_calendar_ops(ops: List[tuple], service=None) -> List[tuple]:
+    """
+    Send several primary-calendar events() calls as batched HTTP requests
+    (BATCH_LIMIT per request) instead of one round-trip each.
+    ops: (method, kwargs) pairs, e.g. ("insert", {"body": ...}),
+         ("patch", {"eventId": ..., "body": ...}), ("delete", {"eventId": ...}).
+    Items that fail with a retryable error are resent in a follow-up batch
+    after a backoff delay, up to MAX_RETRIES times.
+    Returns one (response, exception) pair per op, in the same order; batch
+    responses arrive unordered, so they are matched back by request id.
+    """
+    if service is None:
+        service = get_service()
+    results: List[Optional[tuple]] = [None] * len(ops)
+    pending = list(range(len(ops)))
+    
+    for attempt in range(MAX_RETRIES + 1):
+        retry = []
+        
+        def _on_response(request_id, response, exception):
+            i = int(request_id)
+            if exception is not None and attempt < MAX_RETRIES and _is_retryable(exception):
+                retry.append(i)
+            else:
+                results[i] = (response, exception)
+        
+        for offset in range(0, len(pending), BATCH_LIMIT):
+            chunk = pending[offset:offset + BATCH_LIMIT]
+            try:
+                batch = service.new_batch_http_request(callback=_on_response)
+                for i in chunk:
+                    method, kwargs = ops[i]
+                    batch.add(getattr(service.events(), method)(calendarId='primary', **kwargs), request_id=str(i))
+                batch.execute()
+            except Exception as e:
+                LOGGER.error(f"Error sending calendar batch: {e}")
+                for i in chunk:
+                    if results[i] is None and i not in retry:
+                        results[i] = (None, e)
+        
+        if not retry:
+            break
+        pending = sorted(retry)
+        delay = _backoff_delay(attempt)
+        LOGGER.warning(f"Retrying {len(pending)} rate-limited calendar calls in {delay:.2f}s")
+        time.sleep(delay)
+    
+    return results
+
 def update_event(
     event_id: str,
     title: Optional[str] = None,
@@ -204,13 +426,13 @@ def update_event(
             patch_body["end"] = {}
             
             if all_day:
-                if start: patch_body["start"]["date"] = date_parser.parse(start).date().isoformat()
-                if end: patch_body["end"]["date"] = date_parser.parse(end).date().isoformat()
+                if start: patch_body["start"]["date"] = _parse_datetime(start).date().isoformat()
+                if end: patch_body["end"]["date"] = _parse_datetime(end).date().isoformat()
             else:
                 if start: patch_body["start"]["dateTime"] = _ensure_rfc3339(start)
                 if end: patch_body["end"]["dateTime"] = _ensure_rfc3339(end)
                 
-        updated_event = service.events().patch(calendarId='primary', eventId=event_id, body=patch_body).execute()
+        updated_event = _execute_with_retry(service.events().patch(calendarId='primary', eventId=event_id, body=patch_body))
         LOGGER.info(f"Updated event: {event_id}")
         
         return {
@@ -229,7 +451,7 @@ def delete_event(event_id: str) -> Dict[str, Any]:
     """
     try:
         service = get_service()
-        service.events().delete(calendarId='primary', eventId=event_id).execute()
+        _execute_with_retry(service.events().delete(calendarId='primary', eventId=event_id))
         LOGGER.info(f"Deleted event: {event_id}")
         return {
             "status": "success",
@@ -239,16 +461,49 @@ def delete_event(event_id: str) -> Dict[str, Any]:
         LOGGER.error(f"Error deleting event {event_id}: {e}")
         return {"status": "error", "error": str(e), "debug_message": f"Failed to delete event {event_id}: {str(e)}"}
 
-def fetch_events(lookahead_days: int = 7) -> List[Dict[str, Any]]:
+def delete_events_batch(event_ids: List[str]) -> List[Dict[str, Any]]:
+    """
+    Delete several events with batched HTTP requests (see batch_calendar_ops,
+    which also retries rate-limited items).
+    Returns one delete_event-style result per ID, in the same order.
+    """
+    if not event_ids:
+        return []
+    
+    try:
+        service = get_service()
+    except Exception as e:
+        LOGGER.error(f"Error deleting events: {e}")
+        return [
+            {"status": "error", "error": str(e), "debug_message": f"Failed to delete event {event_id}: {str(e)}"}
+            for event_id in event_ids
+        ]
+    
+    results = []
+    ops = [("delete", {"eventId": event_id}) for event_id in event_ids]
+    for event_id, (response, exception) in zip(event_ids, batch_calendar_ops(ops, service)):
+        if exception is not None:
+            LOGGER.error(f"Error deleting event {event_id}: {exception}")
+            results.append({"status": "error", "error": str(exception), "debug_message": f"Failed to delete event {event_id}: {str(exception)}"})
+        else:
+            LOGGER.info(f"Deleted event: {event_id}")
+            results.append({"status": "success", "debug_message": f"Deleted Google Calendar event (ID: {event_id})"})
+    
+    return results
+
+def fetch_events(lookahead_days: int = 7, raise_errors: bool = False) -> List[Dict[str, Any]]:
     """
     Fetch upcoming events for the next N days.
+
+    Errors are logged and an empty list returned, unless raise_errors is set
+    (callers that must not mistake a failed fetch for an empty calendar).
     """
     try:
         service = get_service()
         
-        tz = pytz.timezone(TIMEZONE)
-        now = datetime.datetime.now(tz).isoformat()
-        end_time = (datetime.datetime.now(tz) + datetime.timedelta(days=lookahead_days)).isoformat()
+        start = datetime.datetime.now(_TZ)
+        now = start.isoformat()
+        end_time = (start + datetime.timedelta(days=lookahead_days)).isoformat()
         
         events_result = service.events().list(
             calendarId='primary',
@@ -262,9 +517,134 @@ def fetch_events(lookahead_days: int = 7) -> List[Dict[str, Any]]:
         return [_normalize_event(evt) for evt in items]
         
     except Exception as e:
+        if raise_errors:
+            raise
         LOGGER.error(f"Error fetching events: {e}")
         return []
 
+def calendar_changed_since_last_sync() -> Tuple[bool, Optional[str]]:
+    """
+    Ask Google whether the primary calendar changed since the last saved sync.
+
+    Uses an incremental sync token, so an unchanged calendar costs one
+    request with an empty item list. Google doesn't allow sync tokens
+    together with timeMin/timeMax, so this only detects changes; callers
+    still use fetch_events() for the windowed listing.
+
+    Returns (changed, next_sync_token). The token is not stored here: pass
+    it to save_sync_token() once the changes have actually been applied,
+    so a failed sync is retried on the next poll. changed is True when
+    unsure (first run, expired token, API errors), with a None token.
+    """
+    try:
+        token = SYNC_TOKEN_PATH.read_text().strip() or None
+    except FileNotFoundError:
+        token = None
+
+    try:
+        service = get_service()
+        changed = token is None
+        page_token = None
+        while True:
+            if token:
+                request = service.events().list(
+                    calendarId='primary',
+                    syncToken=token,
+                    pageToken=page_token,
+                    fields="items(id),nextPageToken,nextSyncToken"
+                )
+            else:
+                # Full sync just to obtain a token; skip the event bodies
+                request = service.events().list(
+                    calendarId='primary',
+                    pageToken=page_token,
+                    maxResults=2500,
+                    fields="nextPageToken,nextSyncToken"
+                )
+            page = _execute_with_retry(request)
+            if page.get('items'):
+                changed = True
+            page_token = page.get('nextPageToken')
+            if not page_token:
+                break
+
+        return changed, page.get('nextSyncToken')
+
+    except HttpError as e:
+        if e.resp.status == 410 and token:
+            # Token expired server-side: drop it and do a full resync
+            LOGGER.info("Sync token expired, running full sync")
+            SYNC_TOKEN_PATH.unlink(missing_ok=True)
+            return calendar_changed_since_last_sync()
+        LOGGER.error(f"Error checking calendar changes: {e}")
+        return True, None
+    except Exception as e:
+        LOGGER.error(f"Error checking calendar changes: {e}")
+        return True, None
+
+def save_sync_token(token: Optional[str]) -> None:
+    """Record the sync token whose changes have now been applied."""
+    if not token:
+        return
+    SYNC_TOKEN_PATH.parent.mkdir(parents=True, exist_ok=True)
+    SYNC_TOKEN_PATH.write_text(token)
+
+def _localized(dt_str: str) -> datetime.datetime:
+    """Parse an ISO time, treating naive values as TIMEZONE local time."""
+    dt = _parse_datetime(dt_str)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_TZ)
+    return dt
+
+def find_events_by_details(
+    targets: List[tuple],
+    window: datetime.timedelta = datetime.timedelta(hours=2)
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Batch version of find_event_by_details for (title, start_dt) pairs.
+
+    Lists every event spanning the targets once and matches locally, instead
+    of one search request per target. Returns one event (or None) per target.
+    """
+    if not targets:
+        return []
+    try:
+        starts = [_localized(start) for _, start in targets]
+        service = get_service()
+
+        # title -> [(start, event)] for everything in the covering window
+        index: Dict[str, List[tuple]] = {}
+        page_token = None
+        while True:
+            page = _execute_with_retry(service.events().list(
+                calendarId='primary',
+                timeMin=(min(starts) - window).isoformat(),
+                timeMax=(max(starts) + window).isoformat(),
+                singleEvents=True,
+                maxResults=2500,
+                pageToken=page_token
+            ))
+            for item in page.get('items', []):
+                evt = _normalize_event(item)
+                index.setdefault(evt["name"].lower(), []).append((_localized(evt["start"]), evt))
+            page_token = page.get('nextPageToken')
+            if not page_token:
+                break
+
+        found = []
+        for (title, _), start in zip(targets, starts):
+            candidates = [
+                (abs(evt_start - start), evt)
+                for evt_start, evt in index.get((title or "").lower(), ())
+                if abs(evt_start - start) <= window
+            ]
+            found.append(min(candidates, key=lambda c: c[0])[1] if candidates else None)
+        return found
+
+    except Exception as e:
+        LOGGER.error(f"Error finding events: {e}")
+        return [None] * len(targets)
+
 def find_event_by_details(title: str, start_dt: str) -> Optional[Dict[str, Any]]:
     """
     Try to find an event by title and approximate start time.
@@ -274,10 +654,9 @@ def find_event_by_details(title: str, start_dt: str) -> Optional[Dict[str, Any]]
         service = get_service()
         
         # Search window: +/- 2 hours around start time
-        start_obj = date_parser.parse(start_dt)
+        start_obj = _parse_datetime(start_dt)
         if start_obj.tzinfo is None:
-            tz = pytz.timezone(TIMEZONE)
-            start_obj = tz.localize(start_obj)
+            start_obj = start_obj.replace(tzinfo=_TZ)
             
         time_min = (start_obj - datetime.timedelta(hours=2)).isoformat()
         time_max = (start_obj + datetime.timedelta(hours=2)).isoformat()
@@ -287,14 +666,18 @@ def find_event_by_details(title: str, start_dt: str) -> Optional[Dict[str, Any]]
             timeMin=time_min,
             timeMax=time_max,
             q=title, # Full text search
-            singleEvents=True
+            singleEvents=True,
+            maxResults=10,
+            # Only what _normalize_event reads
+            fields="items(id,summary,start,end,htmlLink,description,location)"
         ).execute()
         
         items = events_result.get('items', [])
         
         # Filter by exact title match (case insensitive)
+        needle = title.casefold()
         for item in items:
-            if item.get('summary', '').lower() == title.lower():
+            if item.get('summary', '').casefold() == needle:
                 return _normalize_event(item)
                 
         return None
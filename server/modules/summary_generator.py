@@ -9,20 +9,54 @@ Provides:
 - ESP32-friendly agenda format
 """
 
-import os
+import re
 from datetime import datetime
-from openai import OpenAI
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Tuple
 
 from .schedule_manager import DAYS_OF_WEEK
+from .intent_router import get_openai_client
 
 
-def get_openai_client() -> OpenAI:
-    """Get OpenAI client with API key from environment"""
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise RuntimeError("OPENAI_API_KEY not set in environment variables.")
-    return OpenAI(api_key=api_key)
+# Where a streamed reply can be cut into speakable sentences
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def _complete(
+    system_prompt: str,
+    user_prompt: str,
+    on_sentence: Optional[Callable[[str], None]] = None
+) -> str:
+    """
+    Run a chat completion and return the stripped reply.
+    
+    With on_sentence, the reply is streamed and each finished sentence is
+    passed to it as soon as it arrives (e.g. to start TTS early).
+    """
+    client = get_openai_client()
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt}
+    ]
+    
+    if on_sentence is None:
+        response = client.chat.completions.create(model="gpt-4o-mini", messages=messages)
+        return response.choices[0].message.content.strip()
+    
+    stream = client.chat.completions.create(model="gpt-4o-mini", messages=messages, stream=True)
+    parts = []
+    pending = ""
+    for chunk in stream:
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if not delta:
+            continue
+        parts.append(delta)
+        *sentences, pending = _SENTENCE_END_RE.split(pending + delta)
+        for sentence in sentences:
+            if sentence.strip():
+                on_sentence(sentence.strip())
+    if pending.strip():
+        on_sentence(pending.strip())
+    return "".join(parts).strip()
 
 
 def generate_summary_text(schedule: dict) -> str:
@@ -155,13 +189,18 @@ def generate_agenda_for_esp32(schedule: dict) -> dict:
 
 # ==================== NEW WEEKLY SCHEDULE SUMMARIES ====================
 
-def generate_day_summary(day_name: str, events: List[Dict[str, Any]]) -> str:
+def generate_day_summary(
+    day_name: str,
+    events: List[Dict[str, Any]],
+    on_sentence: Optional[Callable[[str], None]] = None
+) -> str:
     """
     Generate a natural language summary for a specific day.
     
     Args:
         day_name: Name of the day (e.g., "monday")
         events: List of events for that day
+        on_sentence: Optional callback receiving each sentence as it streams in
         
     Returns:
         Human-readable summary string
@@ -204,32 +243,40 @@ def generate_day_summary(day_name: str, events: List[Dict[str, Any]]) -> str:
     )
     
     try:
-        client = get_openai_client()
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ]
-        )
-        return response.choices[0].message.content.strip()
+        return _complete(system_prompt, user_prompt, on_sentence)
     except Exception as e:
         print(f"[summary_generator] Error generating day summary: {e}")
         # Fallback to simple summary
         return f"On {day_name.capitalize()}, you have {len(events)} events scheduled."
 
 
-def generate_week_summary(week_data: Dict[str, Dict[str, Any]]) -> str:
+def generate_week_summary(
+    week_data: Dict[str, Dict[str, Any]],
+    on_sentence: Optional[Callable[[str], None]] = None
+) -> str:
     """
     Generate a natural language summary of the entire week.
     
     Args:
         week_data: Dictionary mapping day names to their schedule data
                   (from schedule_manager.get_week_summary_data()["days"])
+        on_sentence: Optional callback receiving each sentence as it streams in
         
     Returns:
         Human-readable week overview string
     """
+    return generate_week_summary_with_status(week_data, on_sentence)[0]
+
+
+def generate_week_summary_with_status(
+    week_data: Dict[str, Dict[str, Any]],
+    on_sentence: Optional[Callable[[str], None]] = None
+) -> Tuple[str, bool]:
+    """
+    Like generate_week_summary, but also reports whether the text is a real
+    summary (False for the fallback used when the LLM call fails), so
+    callers know whether it is safe to cache.
+    """
     # Build a summary of each day
     day_summaries = []
     total_events = 0
@@ -247,7 +294,7 @@ def generate_week_summary(week_data: Dict[str, Dict[str, Any]]) -> str:
             day_summaries.append(f"{day.capitalize()}: {', '.join(event_names)}")
     
     if total_events == 0:
-        return "Your week is completely free. No events scheduled."
+        return "Your week is completely free. No events scheduled.", True
     
     schedule_block = "\n".join(day_summaries) if day_summaries else "No events"
     
@@ -265,18 +312,10 @@ def generate_week_summary(week_data: Dict[str, Dict[str, Any]]) -> str:
     )
     
     try:
-        client = get_openai_client()
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ]
-        )
-        return response.choices[0].message.content.strip()
+        return _complete(system_prompt, user_prompt, on_sentence), True
     except Exception as e:
         print(f"[summary_generator] Error generating week summary: {e}")
-        return f"You have {total_events} events scheduled this week."
+        return f"You have {total_events} events scheduled this week.", False
 
 
 def generate_changes_summary(changes: Dict[str, Any]) -> str:
@@ -442,7 +481,12 @@ def generate_clear_confirmation(scope: str, day_name: str = None) -> str:
         return "Schedule cleared."
 
 
-def generate_query_response(day_name: str, events: List[Dict[str, Any]], is_today: bool = False) -> str:
+def generate_query_response(
+    day_name: str,
+    events: List[Dict[str, Any]],
+    is_today: bool = False,
+    on_sentence: Optional[Callable[[str], None]] = None
+) -> str:
     """
     Generate a response for schedule queries.
     
@@ -450,6 +494,7 @@ def generate_query_response(day_name: str, events: List[Dict[str, Any]], is_toda
         day_name: Name of the day being queried
         events: Events for that day
         is_today: Whether this is today's schedule
+        on_sentence: Optional callback receiving each sentence of an LLM summary
         
     Returns:
         Natural language response for TTS
@@ -460,4 +505,4 @@ def generate_query_response(day_name: str, events: List[Dict[str, Any]], is_toda
         return f"You have no events scheduled for {day_name.capitalize()}."
     
     # Generate detailed summary
-    return generate_day_summary(day_name, events)
+    return generate_day_summary(day_name, events, on_sentence)
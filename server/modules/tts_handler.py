@@ -5,41 +5,54 @@ Generates audio files from text for ESP32 playback.
 """
 
 import os
+import re
 import wave
-from typing import Optional
+import shutil
+import hashlib
+import logging
+import threading
+from functools import lru_cache
+from typing import Iterable, Optional
 from pathlib import Path
 
+LOGGER = logging.getLogger("tts_handler")
+# Per-request messages are DEBUG; model loading and failures stay visible at INFO
+LOGGER.setLevel(os.getenv("SPEECH_LOG_LEVEL", "INFO").upper())
+
 # Resolve model path relative to this file
 BASE_DIR = Path(__file__).resolve().parent.parent
 MODEL_PATH = BASE_DIR / "models" / "tts" / "en_US-amy-medium.onnx"
 
+# Rendered WAVs for recurring responses (help text, confirmations), keyed by
+# voice + text. Texts with digits (times, dates, counts) rarely repeat, so
+# they are not cached.
+CACHE_DIR = BASE_DIR / "models" / "tts" / "cache"
+CACHE_MAX_FILES = int(os.getenv("TTS_CACHE_MAX_FILES", "256"))
+_UNCACHEABLE_RE = re.compile(r"\d")
+
+# Output directories already created, so each synthesis skips makedirs
+_KNOWN_DIRS: set = set()
+
 _model = None
-_tts_available = None
+_model_lock = threading.Lock()
 
 
+@lru_cache(maxsize=1)
 def is_tts_available() -> bool:
-    """Check if TTS is available (Piper installed and model exists)"""
-    global _tts_available
-    
-    if _tts_available is not None:
-        return _tts_available
-    
+    """Check if TTS is available (Piper installed and model exists); checked once"""
     # Check if piper is installed
     try:
         from piper.voice import PiperVoice
     except ImportError:
-        print("[tts_handler] Piper TTS not installed. Run: pip install piper-tts")
-        _tts_available = False
+        LOGGER.warning("[tts_handler] Piper TTS not installed. Run: pip install piper-tts")
         return False
     
     # Check if model exists
     if not MODEL_PATH.exists():
-        print(f"[tts_handler] TTS model not found at: {MODEL_PATH}")
-        print("[tts_handler] TTS will be disabled. Download model to enable.")
-        _tts_available = False
+        LOGGER.warning("[tts_handler] TTS model not found at: %s", MODEL_PATH)
+        LOGGER.warning("[tts_handler] TTS will be disabled. Download model to enable.")
         return False
     
-    _tts_available = True
     return True
 
 
@@ -51,14 +64,94 @@ def _load_model():
         return None
         
     if _model is None:
-        from piper.voice import PiperVoice
-        print(f"[tts_handler] Loading TTS model from: {MODEL_PATH}")
-        _model = PiperVoice.load(str(MODEL_PATH))
-        print("[tts_handler] TTS model loaded.")
+        with _model_lock:
+            if _model is None:
+                LOGGER.info("[tts_handler] Loading TTS model from: %s", MODEL_PATH)
+                _model = _load_voice()
+                LOGGER.info("[tts_handler] TTS model loaded.")
     
     return _model
 
 
+def _load_voice():
+    """
+    Build the PiperVoice with ONNX Runtime's CPU memory arena and memory
+    pattern disabled. Both pre-reserve buffers sized for the largest run seen,
+    which for short responses mostly pins RAM that is never reused.
+    Falls back to PiperVoice.load() if this piper version builds voices differently.
+    """
+    from piper.voice import PiperVoice
+    try:
+        import json
+        import onnxruntime
+        from piper.config import PiperConfig
+
+        options = onnxruntime.SessionOptions()
+        options.enable_cpu_mem_arena = False
+        options.enable_mem_pattern = False
+        with open(f"{MODEL_PATH}.json", "r", encoding="utf-8") as config_file:
+            config = PiperConfig.from_dict(json.load(config_file))
+        session = onnxruntime.InferenceSession(
+            str(MODEL_PATH), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        return PiperVoice(config=config, session=session)
+    except (ImportError, TypeError, AttributeError) as e:
+        LOGGER.info("[tts_handler] Falling back to default voice loading: %s", e)
+        return PiperVoice.load(str(MODEL_PATH))
+
+
+def preload_voice():
+    """Load the Piper voice ahead of the first synthesis request (no-op if TTS is unavailable)."""
+    _load_model()
+
+
+def _cache_path(text: str) -> Optional[Path]:
+    """Path of the cached WAV for text, or None if text shouldn't be cached."""
+    if CACHE_MAX_FILES <= 0 or _UNCACHEABLE_RE.search(text):
+        return None
+    digest = hashlib.blake2b(f"{MODEL_PATH.stem}\0{text}".encode("utf-8"), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{digest}.wav"
+
+
+def _store_in_cache(wav_path: str, cache_path: Path):
+    """Copy a freshly synthesized WAV into the cache, evicting the least recently used files."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+        shutil.copyfile(wav_path, tmp_path)
+        os.replace(tmp_path, cache_path)
+        
+        cached = list(CACHE_DIR.glob("*.wav"))
+        if len(cached) > CACHE_MAX_FILES:
+            cached.sort(key=lambda p: p.stat().st_mtime)
+            for stale in cached[:len(cached) - CACHE_MAX_FILES]:
+                stale.unlink(missing_ok=True)
+    except OSError as e:
+        LOGGER.warning("[tts_handler] Could not cache TTS audio: %s", e)
+
+
+def _ensure_output_dir(output_path: str):
+    """Create output_path's directory, once per directory per process."""
+    output_dir = os.path.dirname(output_path)
+    if output_dir and output_dir not in _KNOWN_DIRS:
+        # exist_ok makes a race between two first requests harmless
+        os.makedirs(output_dir, exist_ok=True)
+        _KNOWN_DIRS.add(output_dir)
+
+
+def _tmp_path(output_path: str) -> str:
+    """Per-thread temp file next to output_path, renamed over it once complete."""
+    return f"{output_path}.{threading.get_ident()}.tmp"
+
+
+def _discard(tmp_path: str):
+    """Remove a temp file left behind by a failed write."""
+    try:
+        os.unlink(tmp_path)
+    except FileNotFoundError:
+        pass
+
+
 def synthesize_speech(text: str, output_path: str) -> Optional[str]:
     """
     Generate a WAV file from text using the Piper TTS model.
@@ -73,15 +166,29 @@ def synthesize_speech(text: str, output_path: str) -> Optional[str]:
     voice = _load_model()
     
     if voice is None:
-        print("[tts_handler] TTS not available, skipping synthesis")
+        LOGGER.debug("[tts_handler] TTS not available, skipping synthesis")
         return None
 
     # Ensure output directory exists
-    output_dir = os.path.dirname(output_path)
-    if output_dir:
-        os.makedirs(output_dir, exist_ok=True)
+    _ensure_output_dir(output_path)
 
-    print(f"[tts_handler] Synthesizing speech: '{text[:50]}...'")
+    # Every write goes to a temp file that is renamed into place, so the
+    # ESP32 never downloads a half-written WAV
+    tmp_path = _tmp_path(output_path)
+
+    cache_path = _cache_path(text)
+    if cache_path is not None:
+        try:
+            # Copy rather than link so output_path never aliases the cache entry
+            os.utime(cache_path)  # mark as recently used
+            shutil.copyfile(cache_path, tmp_path)
+            os.replace(tmp_path, output_path)
+            LOGGER.debug("[tts_handler] Reused cached audio for: '%s...'", text[:50])
+            return output_path
+        except FileNotFoundError:
+            _discard(tmp_path)
+
+    LOGGER.debug("[tts_handler] Synthesizing speech: '%s...'", text[:50])
 
     # Get generator of AudioChunk objects
     gen = voice.synthesize(text)
@@ -89,22 +196,88 @@ def synthesize_speech(text: str, output_path: str) -> Optional[str]:
     # Get first chunk (to read metadata)
     first_chunk = next(gen, None)
     if first_chunk is None:
-        print("[tts_handler] Piper returned no audio for given text.")
+        LOGGER.warning("[tts_handler] Piper returned no audio for given text.")
         return None
 
     # Open WAV file and configure parameters according to Piper metadata
-    with wave.open(output_path, "wb") as wav_file:
-        wav_file.setnchannels(first_chunk.sample_channels)
-        wav_file.setsampwidth(first_chunk.sample_width)
-        wav_file.setframerate(first_chunk.sample_rate)
+    try:
+        with wave.open(tmp_path, "wb") as wav_file:
+            wav_file.setnchannels(first_chunk.sample_channels)
+            wav_file.setsampwidth(first_chunk.sample_width)
+            wav_file.setframerate(first_chunk.sample_rate)
+
+            # writeframesraw skips the per-write header patch (a seek and
+            # rewrite each time); closing the file fixes the header up once.
+            # Write first chunk
+            wav_file.writeframesraw(first_chunk.audio_int16_bytes)
+
+            # Write remaining chunks
+            for chunk in gen:
+                wav_file.writeframesraw(chunk.audio_int16_bytes)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        _discard(tmp_path)
+        raise
+
+    LOGGER.debug("[tts_handler] Audio saved to: %s", output_path)
+    if cache_path is not None:
+        _store_in_cache(output_path, cache_path)
+    return output_path
+
+
+def synthesize_speech_stream(sentences: Iterable[str], output_path: str) -> Optional[str]:
+    """
+    Generate one WAV file from sentences that arrive over time.
+    
+    Each sentence is synthesized as soon as the iterable yields it, so audio
+    for the start of a streamed LLM reply is ready before the reply ends.
+    
+    Args:
+        sentences: Iterable of text pieces, consumed until exhausted
+        output_path: Path for output WAV file
+        
+    Returns:
+        Path to generated audio file, or None if TTS unavailable or no audio
+    """
+    voice = _load_model()
+    
+    if voice is None:
+        LOGGER.debug("[tts_handler] TTS not available, skipping synthesis")
+        for _ in sentences:  # drain so the producer never blocks
+            pass
+        return None
 
-        # Write first chunk
-        wav_file.writeframes(first_chunk.audio_int16_bytes)
+    _ensure_output_dir(output_path)
 
-        # Write remaining chunks
-        for chunk in gen:
-            wav_file.writeframes(chunk.audio_int16_bytes)
+    # Written under a temp name and renamed into place (see synthesize_speech)
+    tmp_path = _tmp_path(output_path)
+    wav_file = None
+    completed = False
+    try:
+        for sentence in sentences:
+            LOGGER.debug("[tts_handler] Synthesizing sentence: '%s...'", sentence[:50])
+            for chunk in voice.synthesize(sentence):
+                if wav_file is None:
+                    # Configure the WAV from the first chunk's Piper metadata
+                    wav_file = wave.open(tmp_path, "wb")
+                    wav_file.setnchannels(chunk.sample_channels)
+                    wav_file.setsampwidth(chunk.sample_width)
+                    wav_file.setframerate(chunk.sample_rate)
+                # Header is patched once on close (see synthesize_speech)
+                wav_file.writeframesraw(chunk.audio_int16_bytes)
+        completed = True
+    finally:
+        if wav_file is not None:
+            wav_file.close()
+            if completed:
+                os.replace(tmp_path, output_path)
+            else:
+                _discard(tmp_path)
+
+    if wav_file is None:
+        LOGGER.warning("[tts_handler] Piper returned no audio for given text.")
+        return None
 
-    print(f"[tts_handler] Audio saved to: {output_path}")
+    LOGGER.debug("[tts_handler] Audio saved to: %s", output_path)
     return output_path
 
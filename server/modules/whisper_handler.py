@@ -1,57 +1,134 @@
 # smartPager/server/modules/whisper_handler.py
 
 import os
+import logging
+import threading
 from pathlib import Path
 from typing import Optional
 
+LOGGER = logging.getLogger("whisper_handler")
+# Per-request messages are DEBUG; model loading and failures stay visible at INFO
+LOGGER.setLevel(os.getenv("SPEECH_LOG_LEVEL", "INFO").upper())
+
+WHISPER_MODEL = os.getenv("WHISPER_MODEL", "base")
+# Greedy decoding is plenty for short voice commands; raise for harder audio
+WHISPER_BEAM_SIZE = int(os.getenv("WHISPER_BEAM_SIZE", "1"))
+# Fixing the language skips Whisper's detection pass; set to "" to auto-detect
+WHISPER_LANGUAGE = os.getenv("WHISPER_LANGUAGE", "en") or None
+# Concurrent requests transcribe in parallel, one CTranslate2 worker each
+WHISPER_NUM_WORKERS = max(1, int(os.getenv("WHISPER_NUM_WORKERS", "2")))
+
+AUDIO_EXTENSIONS = frozenset({".wav", ".mp3", ".m4a", ".flac", ".ogg"})
+
 # Lazy load whisper to avoid startup delay if not needed
 _model = None
+_backend = None  # "faster_whisper" or "openai_whisper"
+_model_lock = threading.Lock()
+
+
+def _load_faster_whisper():
+    """
+    Load the model with faster-whisper (CTranslate2), quantized to int8.
+    Uses int8 weights with fp16 activations on GPU and plain int8 on CPU.
+    With several workers, transcribe() calls from different request threads
+    run in parallel instead of queueing behind one another; on CPU the cores
+    are split between the workers.
+    """
+    from faster_whisper import WhisperModel
+    import ctranslate2
+
+    if ctranslate2.get_cuda_device_count() > 0:
+        device, compute_type = "cuda", "int8_float16"
+    else:
+        device, compute_type = "cpu", "int8"
+
+    LOGGER.info("[whisper_handler] Loading faster-whisper '%s' (%s, %s)...", WHISPER_MODEL, device, compute_type)
+    return WhisperModel(
+        WHISPER_MODEL,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=max(1, (os.cpu_count() or 4) // WHISPER_NUM_WORKERS),
+        num_workers=WHISPER_NUM_WORKERS
+    )
+
 
 def _get_model():
     """Load Whisper model lazily (first call only)"""
-    global _model
+    global _model, _backend
     if _model is None:
-        import whisper
-        print("[whisper_handler] Loading Whisper model (this may take a moment)...")
-        _model = whisper.load_model("base")
-        print("[whisper_handler] Whisper model loaded.")
+        # The server may warm the model up in a background thread while a
+        # request is already waiting on it, so only load it once.
+        with _model_lock:
+            if _model is None:
+                try:
+                    _model = _load_faster_whisper()
+                    _backend = "faster_whisper"
+                except ImportError:
+                    import whisper
+                    LOGGER.warning("[whisper_handler] faster-whisper not installed, falling back to openai-whisper")
+                    LOGGER.info("[whisper_handler] Loading Whisper model (this may take a moment)...")
+                    _model = whisper.load_model(WHISPER_MODEL)
+                    _backend = "openai_whisper"
+                LOGGER.info("[whisper_handler] Whisper model loaded.")
     return _model
 
 
+def preload_model():
+    """Load the Whisper model ahead of the first transcription request."""
+    _get_model()
+
+
 def transcribe_audio_file(audio_path: str) -> Optional[str]:
     """
     Transcribe an audio file using local Whisper.
-    
+
     Args:
         audio_path: Full path to the audio file
-        
+
     Returns:
         Transcribed text or None if failed
     """
     path = Path(audio_path)
-    
+
     if not path.exists():
-        print(f"[whisper_handler] Audio file not found: {audio_path}")
+        LOGGER.warning("[whisper_handler] Audio file not found: %s", audio_path)
         return None
 
-    if path.suffix.lower() not in [".wav", ".mp3", ".m4a", ".flac", ".ogg"]:
-        print(f"[whisper_handler] Unsupported audio format: {path.suffix}")
+    if path.suffix.lower() not in AUDIO_EXTENSIONS:
+        LOGGER.warning("[whisper_handler] Unsupported audio format: %s", path.suffix)
         return None
 
-    print(f"[whisper_handler] Transcribing: {path.name}")
+    LOGGER.debug("[whisper_handler] Transcribing: %s", path.name)
 
     try:
         model = _get_model()
-        result = model.transcribe(str(path))
 
-        if "text" not in result:
-            print("[whisper_handler] Whisper did not return text output.")
-            return None
+        if _backend == "faster_whisper":
+            # faster-whisper returns a lazy generator of segments; decoding
+            # happens as we iterate over it. The VAD filter skips the silence
+            # around button-press recordings instead of decoding it.
+            segments, _info = model.transcribe(
+                str(path),
+                beam_size=WHISPER_BEAM_SIZE,
+                language=WHISPER_LANGUAGE,
+                vad_filter=True
+            )
+            transcript = "".join(segment.text for segment in segments).strip()
+        else:
+            # fp16 only helps on GPU; on CPU openai-whisper would warn and fall back every call
+            result = model.transcribe(
+                str(path), language=WHISPER_LANGUAGE, fp16=model.device.type == "cuda"
+            )
+
+            if "text" not in result:
+                LOGGER.warning("[whisper_handler] Whisper did not return text output.")
+                return None
 
-        transcript = result["text"].strip()
-        print(f"[whisper_handler] Transcription complete: '{transcript[:50]}...'")
+            transcript = result["text"].strip()
+
+        LOGGER.debug("[whisper_handler] Transcription complete: '%s...'", transcript[:50])
         return transcript
-        
+
     except Exception as e:
-        print(f"[whisper_handler] Transcription error: {e}")
+        LOGGER.error("[whisper_handler] Transcription error: %s", e)
         return None
@@ -1,5 +1,6 @@
 import os
 import sys
+import logging
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -35,12 +36,12 @@ def test_pipeline():
                 print(result.changes_made)
                 
                 # Verify _calendar_id in the saved file
-                import json
+                import orjson
                 # Assuming tomorrow is Monday based on previous runs
                 schedule_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "schedule", "monday", "schedule.json")
                 if os.path.exists(schedule_path):
-                    with open(schedule_path, 'r') as f:
-                        data = json.load(f)
+                    with open(schedule_path, 'rb') as f:
+                        data = orjson.loads(f.read())
                         events = data.get("events", [])
                         found = False
                         for evt in events:
@@ -78,4 +79,7 @@ def test_pipeline():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    # The pipeline logs its progress (transcript, intent, calendar results)
+    # instead of printing it; show INFO and up like the server does
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     test_pipeline()
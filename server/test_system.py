@@ -3,8 +3,9 @@ import sys
 import os
 import time
 import requests
-import json
+import orjson
 from datetime import datetime
+from pathlib import Path
 
 # Add server directory to path for imports
 sys.path.append(os.path.abspath("."))
@@ -16,6 +17,8 @@ YELLOW = "\033[93m"
 RESET = "\033[0m"
 
 SERVER_URL = "http://localhost:8000"
+# One keep-alive connection for every pipeline command in the run
+SESSION = requests.Session()
 
 def print_step(msg):
     print(f"\n{YELLOW}=== {msg} ==={RESET}")
@@ -86,7 +89,7 @@ def send_pipeline_command(transcript, description):
     }
     
     try:
-        response = requests.post(f"{SERVER_URL}/api/process_transcript", json=payload)
+        response = SESSION.post(f"{SERVER_URL}/api/process_transcript", json=payload)
         if response.status_code == 200:
             data = response.json()
             print_success(f"{description} successful")
@@ -100,14 +103,18 @@ def send_pipeline_command(transcript, description):
         print_fail("Could not connect to server. Is it running on port 8000?")
         return None
 
+MONDAY_SCHEDULE = Path("schedule/monday/schedule.json")
+
 def get_monday_schedule():
     """Read the actual schedule file for Monday to verify state"""
     try:
-        with open("schedule/monday/schedule.json", "r") as f:
-            return json.load(f)
+        return orjson.loads(MONDAY_SCHEDULE.read_bytes())
     except FileNotFoundError:
         return {"events": []}
 
+# Name the pipeline steps add, move and delete (compared casefolded)
+TEST_EVENT = "system test event"
+
 def test_pipeline_integration():
     print_step("Step 3: Testing Full Pipeline Integration")
     
@@ -133,13 +140,13 @@ def test_pipeline_integration():
     events = sched.get("events", [])
     found = False
     for evt in events:
-        if "system test event" in evt["name"].lower() and "10:00" in evt["start"]:
+        if TEST_EVENT in evt["name"].casefold() and "10:00" in evt["start"]:
             found = True
             break
     
     if not found:
         print_fail("Event not found in schedule.json after Add")
-        print(json.dumps(events, indent=2))
+        print(orjson.dumps(events, option=orjson.OPT_INDENT_2).decode())
         return False
     print_success("Verified: Event found in schedule.json at 10:00")
     
@@ -156,7 +163,7 @@ def test_pipeline_integration():
     found_new = False
     found_old = False
     for evt in events:
-        name = evt["name"].lower()
+        name = evt["name"].casefold()
         if "system test" in name:
             if "11:00" in evt["start"]:
                 found_new = True
@@ -182,7 +189,7 @@ def test_pipeline_integration():
     events = sched.get("events", [])
     found = False
     for evt in events:
-        if "system test event" in evt["name"].lower():
+        if TEST_EVENT in evt["name"].casefold():
             found = True
             break
             
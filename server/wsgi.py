@@ -0,0 +1,17 @@
+# smartPager/server/wsgi.py
+"""
+WSGI entry point for running the server under gunicorn instead of the
+Flask development server:
+
+    gunicorn --workers=1 --threads=8 --worker-class=gthread --bind 0.0.0.0:5000 wsgi:app
+
+Keep a single worker: processing results, conversation context and the
+Whisper/TTS models live in process memory, and the schedule is cleared on
+startup. Threads give concurrent uploads and audio downloads. Put nginx or
+Apache in front and set USE_X_SENDFILE=true to hand WAV transfers to it.
+"""
+
+from audioCapture_server import app
+
+if __name__ == "__main__":
+    app.run(host="0.0.0.0", port=5000)